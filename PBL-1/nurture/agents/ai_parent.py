@@ -738,7 +738,7 @@ class AIParent(BaseParent):
     def reset_conversation(self) -> None:
         """Reset conversation history before each new conversation."""
         if self._llm_instance and hasattr(self._llm_instance, 'conversation_history'):
-            self._llm_instance.conversation_history = []
+            self._llm_instance.conversation_history.clear()
 
     def get_dynamic_state_summary(self) -> Dict[str, Any]:
         """Return live relationship + personality state as plain dicts for display."""
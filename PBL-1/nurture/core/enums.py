@@ -221,6 +221,19 @@ class ActionType(Enum):
     STRESS_IGNORE = "stress_ignore"
 
 
+class ApologyType(IntEnum):
+    """
+    Types of apology, ordered by effectiveness.
+    
+    Values index directly into effectiveness lookup tables; GENUINE and
+    above count as sincere apologies.
+    """
+    DEFENSIVE = 0         # Justifies the behavior
+    GENERIC = 1           # "Sorry" without acknowledgement
+    GENUINE = 2           # Acknowledges the hurt caused
+    ACTION_ORIENTED = 3   # Acknowledges and commits to change
+
+
 class ContextType(Enum):
     """
     Context in which an interaction occurs.
@@ -22,7 +22,7 @@ from nurture.core.enums import (
 from nurture.core.events import Event, EventType, get_event_bus
 from nurture.memory.memory_store import MemoryStore
 from nurture.memory.state_manager import StateManager
-from nurture.rules.rule_engine import RuleEngine, create_default_rules
+from nurture.rules.rule_engine import RESULT_MAPPINGS, RuleEngine, create_default_rules
 from nurture.rules.behavioral_constraints import BehavioralConstraints
 
 
@@ -417,7 +417,7 @@ class InteractionManager:
     def _apply_rule_results(self, results: List[tuple]) -> None:
         """Apply rule evaluation results to agent states."""
         for rule_id, result in results:
-            if not isinstance(result, dict):
+            if not isinstance(result, RESULT_MAPPINGS):
                 continue
             
             # Apply stress modifications
@@ -12,6 +12,7 @@ behavior.
 
 Key Features:
 - Sliding time window analysis (default: 7 days)
+- Action history stored in day-wide chunks with per-pattern indexes
 - Minimum threshold for pattern recognition (default: 3 occurrences)
 - Pattern weight decay (10% per day without occurrence)
 - Pattern breaking through positive behavior (5 consecutive positive actions)
@@ -29,14 +30,54 @@ Example:
     freq = tracker.get_pattern_frequency(PatternType.REPEATED_AVOIDANCE)
 """
 
-from typing import List, Dict, Optional
-from datetime import datetime, timedelta
+from typing import Iterator, List, Dict, Optional
+from datetime import date, datetime, timedelta
 from collections import defaultdict
+from pathlib import Path
+import json
 
 from nurture.core.data_structures import PlayerAction, BehaviorPattern
 from nurture.core.enums import ActionType, PatternType, ContextType
 
 
+def _default_pattern_weight() -> float:
+    """Default weight for pattern types not yet tracked."""
+    return 1.0
+
+
+class _ActionChunk:
+    """
+    A contiguous segment of action history covering a bounded time range.
+    
+    Each chunk keeps its actions in insertion order alongside a per-pattern
+    index, so chunks that lie entirely inside (or outside) a detection window
+    can be consumed or skipped without visiting individual actions.
+    """
+    
+    __slots__ = ("start", "end", "actions", "by_pattern")
+    
+    def __init__(self, timestamp: datetime):
+        self.start = timestamp
+        self.end = timestamp
+        self.actions: List[PlayerAction] = []
+        self.by_pattern: Dict[PatternType, List[PlayerAction]] = {}
+    
+    def accepts(self, timestamp: datetime, width: timedelta) -> bool:
+        """Check if the chunk can absorb a timestamp without exceeding width."""
+        return max(self.end, timestamp) - min(self.start, timestamp) <= width
+    
+    def add(self, action: PlayerAction, pattern_type: Optional[PatternType]) -> None:
+        """Append an action and update the time range and pattern index."""
+        timestamp = action.timestamp
+        if timestamp < self.start:
+            self.start = timestamp
+        if timestamp > self.end:
+            self.end = timestamp
+        self.actions.append(action)
+        if pattern_type is not None:
+            self.by_pattern.setdefault(pattern_type, []).append(action)
+
+
 class PatternTracker:
     """
     Tracks and detects behavioral patterns over time.
@@ -45,6 +86,10 @@ class PatternTracker:
     repeated behaviors. Patterns are weighted and can be broken by
     sustained positive behavior.
     
+    Actions are stored in chunks spanning at most ``CHUNK_WIDTH`` of time.
+    Detection and history clearing work chunk-by-chunk and only scan
+    individual actions in chunks that straddle the cutoff.
+    
     Attributes:
         action_history: List of all recorded actions with timestamps
         detected_patterns: Currently active patterns
@@ -56,6 +101,13 @@ class PatternTracker:
         break_threshold: Positive actions needed to break pattern (default: 5)
     """
     
+    # Maximum time span covered by a single history chunk
+    CHUNK_WIDTH = timedelta(days=1)
+    
+    # Decay factors are precomputed up to this many days unseen; longer
+    # gaps are computed directly
+    MAX_DECAY_DAYS = 90
+    
     def __init__(
         self,
         time_window: timedelta = timedelta(days=7),
@@ -72,9 +124,9 @@ class PatternTracker:
             decay_rate: Daily decay rate for pattern weights (0.0 to 1.0)
             break_threshold: Positive actions needed to break a pattern
         """
-        self.action_history: List[PlayerAction] = []
+        self._chunks: List[_ActionChunk] = []
         self.detected_patterns: Dict[PatternType, BehaviorPattern] = {}
-        self.pattern_weights: Dict[PatternType, float] = defaultdict(lambda: 1.0)
+        self.pattern_weights: Dict[PatternType, float] = defaultdict(_default_pattern_weight)
         self.positive_streak: int = 0
         
         # Configuration
@@ -83,6 +135,13 @@ class PatternTracker:
         self.decay_rate = decay_rate
         self.break_threshold = break_threshold
         
+        # Decay factors indexed by days since last seen, and the date decay
+        # was last applied to each pattern (same-day repeats are skipped)
+        self._decay_table = tuple(
+            (1.0 - decay_rate) ** days for days in range(self.MAX_DECAY_DAYS + 1)
+        )
+        self._decay_dates: Dict[PatternType, date] = {}
+        
         # Pattern mapping: ActionType -> PatternType
         self._action_to_pattern_map = self._build_action_pattern_map()
     
@@ -103,6 +162,40 @@ class PatternTracker:
             ActionType.PUBLIC_CONTRADICTION: PatternType.PUBLIC_UNDERMINING,
         }
     
+    @property
+    def action_history(self) -> List[PlayerAction]:
+        """
+        All recorded actions in insertion order.
+        
+        Returns a fresh list on each access; the chunks are the only
+        storage, so edits to the list do not change the history (assign
+        the property to replace it).
+        """
+        return list(self._iter_actions())
+    
+    @action_history.setter
+    def action_history(self, actions: List[PlayerAction]) -> None:
+        """Replace the action history, rebuilding the chunk index."""
+        self._chunks = []
+        for action in actions:
+            self._append_to_chunks(action)
+    
+    def _iter_actions(self) -> Iterator[PlayerAction]:
+        """Iterate recorded actions in insertion order without copying."""
+        for chunk in self._chunks:
+            yield from chunk.actions
+    
+    def _append_to_chunks(self, action: PlayerAction) -> None:
+        """Append an action to the tail chunk, rolling over when it is full."""
+        pattern_type = self._action_to_pattern_map.get(action.action_type)
+        tail = self._chunks[-1] if self._chunks else None
+        
+        if tail is None or not tail.accepts(action.timestamp, self.CHUNK_WIDTH):
+            tail = _ActionChunk(action.timestamp)
+            self._chunks.append(tail)
+        
+        tail.add(action, pattern_type)
+    
     def record_action(self, action: PlayerAction, timestamp: Optional[datetime] = None) -> None:
         """
         Record a player action with timestamp for pattern analysis.
@@ -118,7 +211,7 @@ class PatternTracker:
         if timestamp is not None:
             action.timestamp = timestamp
         
-        self.action_history.append(action)
+        self._append_to_chunks(action)
         
         # Update positive streak
         if action.emotional_valence > 0.3:
@@ -174,19 +267,24 @@ class PatternTracker:
         
         cutoff_time = datetime.now() - time_window
         
-        # Filter actions within time window
-        recent_actions = [
-            action for action in self.action_history
-            if action.timestamp >= cutoff_time
-        ]
-        
-        # Group actions by pattern type
+        # Group actions within time window by pattern type, consuming whole
+        # chunks where possible and scanning only chunks that straddle cutoff
         pattern_actions: Dict[PatternType, List[PlayerAction]] = defaultdict(list)
         
-        for action in recent_actions:
-            pattern_type = self._action_to_pattern_map.get(action.action_type)
-            if pattern_type:
-                pattern_actions[pattern_type].append(action)
+        for chunk in self._chunks:
+            if chunk.end < cutoff_time:
+                continue
+            
+            if chunk.start >= cutoff_time:
+                for pattern_type, actions in chunk.by_pattern.items():
+                    pattern_actions[pattern_type].extend(actions)
+                continue
+            
+            for action in chunk.actions:
+                if action.timestamp >= cutoff_time:
+                    pattern_type = self._action_to_pattern_map.get(action.action_type)
+                    if pattern_type:
+                        pattern_actions[pattern_type].append(action)
         
         # Detect patterns with sufficient occurrences
         detected = []
@@ -226,24 +324,45 @@ class PatternTracker:
         Apply time-based decay to pattern weights.
         
         Patterns that haven't occurred recently have their weights reduced.
+        Each pattern is decayed at most once per calendar day; factors come
+        from a precomputed table, or are computed directly for patterns
+        unseen for more than ``MAX_DECAY_DAYS``.
         
         Validates: Requirements 1.5
         """
         now = datetime.now()
+        today = now.date()
         
-        for pattern_type, pattern in list(self.detected_patterns.items()):
+        decay_dates = self._decay_dates
+        decay_table = self._decay_table
+        max_days = self.MAX_DECAY_DAYS
+        expired = []
+        
+        for pattern_type, pattern in self.detected_patterns.items():
+            if decay_dates.get(pattern_type) == today:
+                continue
+            decay_dates[pattern_type] = today
+            
             days_since_last = (now - pattern.last_seen).days
             
-            if days_since_last > 0:
-                # Apply exponential decay
-                decay_factor = (1.0 - self.decay_rate) ** days_since_last
-                pattern.weight *= decay_factor
-                self.pattern_weights[pattern_type] = pattern.weight
-                
-                # Remove pattern if weight drops too low
-                if pattern.weight < 0.1:
-                    del self.detected_patterns[pattern_type]
-                    self.pattern_weights[pattern_type] = 0.0
+            if days_since_last <= 0:
+                continue
+            
+            # Apply exponential decay
+            if days_since_last > max_days:
+                pattern.weight *= (1.0 - self.decay_rate) ** days_since_last
+            else:
+                pattern.weight *= decay_table[days_since_last]
+            self.pattern_weights[pattern_type] = pattern.weight
+            
+            # Remove pattern if weight drops too low
+            if pattern.weight < 0.1:
+                expired.append(pattern_type)
+        
+        for pattern_type in expired:
+            del self.detected_patterns[pattern_type]
+            del decay_dates[pattern_type]
+            self.pattern_weights[pattern_type] = 0.0
     
     def get_pattern_frequency(self, pattern_type: PatternType) -> float:
         """
@@ -318,15 +437,31 @@ class PatternTracker:
             before_date: Clear actions before this date (clears all if None)
         """
         if before_date is None:
-            self.action_history.clear()
+            self._chunks.clear()
             self.detected_patterns.clear()
             self.pattern_weights.clear()
+            self._decay_dates.clear()
             self.positive_streak = 0
-        else:
-            self.action_history = [
-                action for action in self.action_history
-                if action.timestamp >= before_date
-            ]
+            return
+        
+        # Drop whole chunks that end before the cutoff; only chunks that
+        # straddle it need to be filtered action-by-action
+        kept: List[_ActionChunk] = []
+        for chunk in self._chunks:
+            if chunk.end < before_date:
+                continue
+            
+            if chunk.start >= before_date:
+                kept.append(chunk)
+                continue
+            
+            remaining = [a for a in chunk.actions if a.timestamp >= before_date]
+            trimmed = _ActionChunk(remaining[0].timestamp)
+            for action in remaining:
+                trimmed.add(action, self._action_to_pattern_map.get(action.action_type))
+            kept.append(trimmed)
+        
+        self._chunks = kept
     
     def to_dict(self) -> Dict:
         """
@@ -335,8 +470,15 @@ class PatternTracker:
         Returns:
             Dictionary containing all tracker state
         """
+        data = {
+            "action_history": [action.to_dict() for action in self._iter_actions()],
+        }
+        data.update(self._state_dict())
+        return data
+    
+    def _state_dict(self) -> Dict:
+        """Serialize all tracker state except the action history."""
         return {
-            "action_history": [action.to_dict() for action in self.action_history],
             "detected_patterns": {
                 pt.value: pattern.to_dict()
                 for pt, pattern in self.detected_patterns.items()
@@ -352,6 +494,45 @@ class PatternTracker:
             "break_threshold": self.break_threshold,
         }
     
+    def save(self, filepath: Path) -> None:
+        """
+        Save tracker state to a JSON file.
+        
+        Produces the same document as ``to_dict``, but streams the action
+        history one entry at a time instead of building the full list of
+        dicts first, so peak memory stays flat for long histories.
+        
+        Args:
+            filepath: Destination file path
+        """
+        filepath.parent.mkdir(parents=True, exist_ok=True)
+        with open(filepath, 'w') as f:
+            f.write('{"action_history": [')
+            for i, action in enumerate(self._iter_actions()):
+                if i:
+                    f.write(", ")
+                json.dump(action.to_dict(), f)
+            f.write("]")
+            
+            for key, value in self._state_dict().items():
+                f.write(f", {json.dumps(key)}: ")
+                json.dump(value, f)
+            f.write("}")
+    
+    @classmethod
+    def load(cls, filepath: Path) -> 'PatternTracker':
+        """
+        Load tracker state from a JSON file written by ``save``.
+        
+        Args:
+            filepath: Source file path
+        
+        Returns:
+            Restored PatternTracker instance
+        """
+        with open(filepath, 'r') as f:
+            return cls.from_dict(json.load(f))
+    
     @classmethod
     def from_dict(cls, data: Dict) -> 'PatternTracker':
         """
@@ -384,7 +565,7 @@ class PatternTracker:
         
         # Restore pattern weights
         tracker.pattern_weights = defaultdict(
-            lambda: 1.0,
+            _default_pattern_weight,
             {
                 PatternType(pt): weight
                 for pt, weight in data.get("pattern_weights", {}).items()
@@ -16,6 +16,8 @@ Key Features:
 - Diminishing returns on rapid positive actions
 - High trust provides resilience against negative interactions
 - Resentment accumulates from patterns, not single incidents
+- Resentment decays lazily, computed on read from simulated time elapsed
+  since positive interactions began
 - Apology effectiveness decays with repeated behavior
 
 Example:
@@ -35,22 +37,149 @@ Example:
         print(f"Withdrawal level: {engine.get_withdrawal_level()}")
 """
 
-from typing import Dict, Optional
-from datetime import datetime, timedelta
+from bisect import bisect_right
+from typing import Dict, Optional, Union
+from datetime import datetime
 from dataclasses import dataclass, field
+import sys
+import time
 
-from nurture.core.enums import ContextType, WithdrawalLevel, ActionType
+from nurture.core.enums import ContextType, WithdrawalLevel, ActionType, ApologyType
 
 
-@dataclass
+# Timestamps are stored internally as epoch seconds; public methods also
+# accept datetimes, which are converted on the way in
+Timestamp = Union[datetime, float]
+
+_now = time.time
+
+# Interned serialized names per ActionType, avoiding the Enum.value
+# descriptor when serializing apology records
+_ACTION_TYPE_VALUE = {action: sys.intern(action.value) for action in ActionType}
+
+# Converts seconds to (fractional) weeks
+_PER_WEEK = 1.0 / (7 * 86400.0)
+
+# Serialization schema: 1 stored ISO 8601 strings, 2 stores epoch seconds
+_SCHEMA_VERSION = 2
+
+
+def _to_epoch(timestamp: Optional[Timestamp]) -> Optional[float]:
+    """Convert a datetime to epoch seconds (floats pass through)."""
+    if isinstance(timestamp, datetime):
+        return timestamp.timestamp()
+    return timestamp
+
+
+def _iso_to_epoch(value: Optional[str]) -> Optional[float]:
+    """Parse an ISO 8601 string into epoch seconds."""
+    if not value:
+        return None
+    return datetime.fromisoformat(value).timestamp()
+
+
+# Effectiveness multiplier per ApologyType, indexed by its value
+_APOLOGY_TYPE_MULTIPLIER = (0.3, 0.5, 1.0, 1.5)
+
+_APOLOGY_TYPE_BY_NAME = {t.name.lower(): t for t in ApologyType}
+
+
+def _to_apology_type(apology_type: Union[ApologyType, str]) -> Optional[ApologyType]:
+    """Resolve an ApologyType or its lowercase name (None if unknown)."""
+    if isinstance(apology_type, ApologyType):
+        return apology_type
+    return _APOLOGY_TYPE_BY_NAME.get(apology_type)
+
+
+# Trust bounds (critical, mild, withdrawal) and the withdrawal level and
+# response length multiplier for each band they delimit, lowest first
+_WITHDRAWAL_BOUNDS = (30.0, 40.0, 50.0)
+_WITHDRAWAL_LEVELS = (
+    WithdrawalLevel.SEVERE,
+    WithdrawalLevel.MODERATE,
+    WithdrawalLevel.MILD,
+    WithdrawalLevel.NONE,
+)
+_RESPONSE_LENGTH_MULTIPLIERS = (0.3, 0.5, 0.7, 1.0)
+
+# Resentment bounds (response, initiation, cooperation) and the
+# cooperation level for each band, lowest first
+_COOPERATION_BOUNDS = (30.0, 50.0, 70.0)
+_COOPERATION_LEVELS = (1.0, 0.7, 0.4, 0.2)
+
+
+def _clip100(value: float) -> float:
+    """Clamp a score to [0.0, 100.0] with comparisons instead of min/max calls."""
+    return 0.0 if value < 0.0 else 100.0 if value > 100.0 else value
+
+
+# Score-dependent trust update constants, shared by the engine and kernel
+_HIGH_TRUST_THRESHOLD = 70.0
+_HIGH_TRUST_RESILIENCE = 0.7
+_RESENTMENT_TRUST_IMPACT_THRESHOLD = 50.0
+_RESENTMENT_RECOVERY_PENALTY = 0.5
+_RESENTMENT_DECAY_RATE = 0.5  # Per day with positive interactions
+
+
+def _update_trust_kernel(trust: float, resentment: float, delta: float) -> float:
+    """
+    Apply the score-dependent part of a trust update.
+    
+    Takes a delta already scaled for context and diminishing returns and
+    returns the new clamped trust score. Uses plain floats and module
+    constants only, so the hot arithmetic avoids attribute lookups.
+    
+    Args:
+        trust: Current trust score
+        resentment: Current resentment score
+        delta: Context-adjusted trust change
+    
+    Returns:
+        New trust score (0.0 to 100.0)
+    """
+    if delta > 0:
+        # Resentment reduces trust recovery
+        if resentment > _RESENTMENT_TRUST_IMPACT_THRESHOLD:
+            delta *= _RESENTMENT_RECOVERY_PENALTY
+    elif trust > _HIGH_TRUST_THRESHOLD:
+        # High trust provides resilience
+        delta *= _HIGH_TRUST_RESILIENCE
+    
+    return _clip100(trust + delta)
+
+
+def _resentment_decay_kernel(resentment: float, anchor: float, clock: float) -> float:
+    """
+    Apply decay for the (fractional) days between the anchor and the clock.
+    
+    Args:
+        resentment: Resentment stored as of the anchor
+        anchor: Epoch seconds decay is anchored at
+        clock: Engine's current simulated time, in epoch seconds
+    
+    Returns:
+        Decayed resentment (never below 0.0)
+    """
+    if clock <= anchor:
+        return resentment
+    resentment -= _RESENTMENT_DECAY_RATE * (clock - anchor) / 86400.0
+    return resentment if resentment > 0.0 else 0.0
+
+
+@dataclass(slots=True)
 class ApologyRecord:
-    """Record of an apology for a specific behavior."""
+    """
+    Record of an apology for a specific behavior (times in epoch seconds).
+    
+    One record exists per behavior type and is updated in place on later
+    apologies and recurrences, so records are never churned.
+    """
     behavior_type: ActionType
-    timestamp: datetime
+    timestamp: float
     is_genuine: bool
     effectiveness: float = 1.0
     recurrence_count: int = 0
-    last_recurrence: Optional[datetime] = None
+    last_recurrence: Optional[float] = None
 
 
 class TrustDynamicsEngine:
@@ -63,22 +192,38 @@ class TrustDynamicsEngine:
     
     Attributes:
         trust_score: Current trust level (0.0 to 100.0)
-        resentment_score: Current resentment level (0.0 to 100.0)
-        last_positive_action_time: Timestamp of last positive action
+        resentment_score: Current resentment level (0.0 to 100.0), with
+            decay since the decay anchor applied on read
+        last_resentment_decay_time: Epoch seconds decay is anchored at
+            (None until the first positive action)
+        decay_clock: Simulated time in epoch seconds; the latest update
+            timestamp, moved forward by apply_resentment_decay
+        last_positive_action_time: Epoch seconds of last positive action
         apology_records: Tracking of apologies and their effectiveness
     """
     
+    __slots__ = (
+        "trust_score",
+        "_resentment",
+        "last_positive_action_time",
+        "last_resentment_decay_time",
+        "decay_clock",
+        "apology_records",
+        "_positive_action_count_in_window",
+        "_positive_action_window_start",
+    )
+    
     # Trust dynamics constants
     BASE_TRUST_INCREASE = 2.0
     BASE_TRUST_DECREASE = 4.0  # 2x faster erosion
-    DIMINISHING_RETURNS_WINDOW = timedelta(hours=1)
+    DIMINISHING_RETURNS_WINDOW = 3600.0  # Seconds
     DIMINISHING_RETURNS_MULTIPLIER = 0.5
     
     # Trust thresholds
     WITHDRAWAL_THRESHOLD = 50.0
     CRITICAL_THRESHOLD = 30.0
-    HIGH_TRUST_THRESHOLD = 70.0
-    HIGH_TRUST_RESILIENCE = 0.7  # Negative interactions have 70% impact
+    HIGH_TRUST_THRESHOLD = _HIGH_TRUST_THRESHOLD
+    HIGH_TRUST_RESILIENCE = _HIGH_TRUST_RESILIENCE  # Negative interactions have 70% impact
     
     # Context multipliers
     PUBLIC_CONTEXT_MULTIPLIER = 2.0
@@ -86,27 +231,24 @@ class TrustDynamicsEngine:
     # Resentment dynamics constants
     PATTERN_RESENTMENT_INCREASE = 3.0
     SINGLE_INCIDENT_RESENTMENT = 0.5
-    RESENTMENT_DECAY_RATE = 0.5  # Per day with positive interactions
+    RESENTMENT_DECAY_RATE = _RESENTMENT_DECAY_RATE
     
     # Resentment thresholds
     RESENTMENT_RESPONSE_THRESHOLD = 30.0
     RESENTMENT_INITIATION_THRESHOLD = 50.0
     RESENTMENT_COOPERATION_THRESHOLD = 70.0
-    RESENTMENT_TRUST_IMPACT_THRESHOLD = 50.0
+    RESENTMENT_TRUST_IMPACT_THRESHOLD = _RESENTMENT_TRUST_IMPACT_THRESHOLD
     
     # Apology effectiveness
     INITIAL_APOLOGY_EFFECTIVENESS = 1.0
     APOLOGY_DECAY_PER_RECURRENCE = 0.2
     MIN_APOLOGY_EFFECTIVENESS = 0.1
     APOLOGY_RECOVERY_RATE = 0.1  # Per week
-    APOLOGY_RECOVERY_PERIOD = timedelta(days=7)
+    APOLOGY_RECOVERY_PERIOD = 7 * 86400.0  # Seconds
     
     # Apology type multipliers
     APOLOGY_TYPE_MULTIPLIERS = {
-        "defensive": 0.3,
-        "generic": 0.5,
-        "genuine": 1.0,
-        "action_oriented": 1.5,
+        t.name.lower(): _APOLOGY_TYPE_MULTIPLIER[t] for t in ApologyType
     }
     
     def __init__(
@@ -121,23 +263,24 @@ class TrustDynamicsEngine:
             initial_trust: Starting trust score (default: 60.0)
             initial_resentment: Starting resentment score (default: 10.0)
         """
-        self.trust_score = max(0.0, min(100.0, initial_trust))
-        self.resentment_score = max(0.0, min(100.0, initial_resentment))
+        self.last_positive_action_time: Optional[float] = None
+        self.last_resentment_decay_time: Optional[float] = None
+        self.decay_clock: Optional[float] = None
         
-        self.last_positive_action_time: Optional[datetime] = None
-        self.last_resentment_decay_time: Optional[datetime] = None
+        self.trust_score = max(0.0, min(100.0, initial_trust))
+        self._resentment = max(0.0, min(100.0, initial_resentment))
         
         self.apology_records: Dict[ActionType, ApologyRecord] = {}
         
         # Track positive action streak for diminishing returns
         self._positive_action_count_in_window = 0
-        self._positive_action_window_start: Optional[datetime] = None
+        self._positive_action_window_start: Optional[float] = None
     
     def update_trust(
         self,
         delta: float,
         context: ContextType = ContextType.PRIVATE,
-        timestamp: Optional[datetime] = None
+        timestamp: Optional[Timestamp] = None
     ) -> float:
         """
         Update trust score with context-based multipliers.
@@ -152,15 +295,16 @@ class TrustDynamicsEngine:
         Args:
             delta: Base trust change amount
             context: PUBLIC or PRIVATE context
-            timestamp: When the action occurred (defaults to now)
+            timestamp: When the action occurred, as datetime or epoch seconds
+                (defaults to now)
         
         Returns:
             Actual trust change applied
         
         Validates: Requirements 3.1, 3.2, 3.3, 3.4, 3.5, 4.5
         """
-        if timestamp is None:
-            timestamp = datetime.now()
+        timestamp = _now() if timestamp is None else _to_epoch(timestamp)
+        self._advance_decay_clock(timestamp)
         
         # Apply context multiplier
         if context == ContextType.PUBLIC:
@@ -178,21 +322,15 @@ class TrustDynamicsEngine:
                 self._positive_action_window_start = timestamp
                 self._positive_action_count_in_window = 1
             
-            # Resentment reduces trust recovery
-            if self.resentment_score > self.RESENTMENT_TRUST_IMPACT_THRESHOLD:
-                delta *= 0.5
-            
             self.last_positive_action_time = timestamp
+            
+            # Positive interactions start the resentment decay clock
+            if self.last_resentment_decay_time is None:
+                self.last_resentment_decay_time = self.decay_clock
         
-        # Handle negative trust changes
-        else:
-            # High trust provides resilience
-            if self.trust_score > self.HIGH_TRUST_THRESHOLD:
-                delta *= self.HIGH_TRUST_RESILIENCE
-        
-        # Apply trust change
+        # Apply resentment damping / high trust resilience and clamp
         old_trust = self.trust_score
-        self.trust_score = max(0.0, min(100.0, self.trust_score + delta))
+        self.trust_score = _update_trust_kernel(old_trust, self.resentment_score, delta)
         
         actual_change = self.trust_score - old_trust
         return actual_change
@@ -201,7 +339,7 @@ class TrustDynamicsEngine:
         self,
         delta: float,
         is_pattern: bool = False,
-        timestamp: Optional[datetime] = None
+        timestamp: Optional[Timestamp] = None
     ) -> float:
         """
         Update resentment score, with higher impact for patterns.
@@ -214,15 +352,16 @@ class TrustDynamicsEngine:
         Args:
             delta: Base resentment change
             is_pattern: Whether this is from a detected pattern
-            timestamp: When the action occurred (defaults to now)
+            timestamp: When the action occurred, as datetime or epoch seconds
+                (defaults to now)
         
         Returns:
             Actual resentment change applied
         
         Validates: Requirements 4.1, 4.4
         """
-        if timestamp is None:
-            timestamp = datetime.now()
+        timestamp = _now() if timestamp is None else _to_epoch(timestamp)
+        self._advance_decay_clock(timestamp)
         
         # Patterns have much higher impact
         if is_pattern and delta > 0:
@@ -232,34 +371,63 @@ class TrustDynamicsEngine:
         
         # Apply resentment change
         old_resentment = self.resentment_score
-        self.resentment_score = max(0.0, min(100.0, self.resentment_score + delta))
+        self.resentment_score = _clip100(old_resentment + delta)
         
         actual_change = self.resentment_score - old_resentment
         return actual_change
     
+    @property
+    def resentment_score(self) -> float:
+        """Current resentment, including decay up to the engine's clock."""
+        anchor = self.last_resentment_decay_time
+        if anchor is None:
+            return self._resentment
+        return _resentment_decay_kernel(self._resentment, anchor, self.decay_clock)
+    
+    @resentment_score.setter
+    def resentment_score(self, value: float) -> None:
+        self._materialize_resentment_decay()
+        self._resentment = value
+    
+    def _advance_decay_clock(self, timestamp: float) -> None:
+        """Move the simulated clock forward to an update's timestamp."""
+        if self.decay_clock is None or timestamp > self.decay_clock:
+            self.decay_clock = timestamp
+    
+    def _materialize_resentment_decay(self) -> None:
+        """Fold decay up to the clock into the stored resentment."""
+        anchor = self.last_resentment_decay_time
+        if anchor is None:
+            return
+        
+        self._resentment = _resentment_decay_kernel(self._resentment, anchor, self.decay_clock)
+        self.last_resentment_decay_time = self.decay_clock
+    
     def apply_resentment_decay(
         self,
         days_elapsed: float = 1.0
     ) -> float:
         """
-        Apply time-based resentment decay.
+        Advance simulated time and apply the resentment decay it brings.
         
-        Resentment decays slowly with positive interactions.
+        Resentment decays slowly once positive interactions have begun.
+        Decay is measured on the engine's own clock, which update
+        timestamps and this method move forward, so stepping days and
+        stamping updates with the same simulated time never decay twice.
         
         Args:
-            days_elapsed: Number of days since last decay
+            days_elapsed: Number of days since last decay (may be fractional)
         
         Returns:
             Amount of resentment decay applied
         
         Validates: Requirements 4.4
         """
-        if self.last_positive_action_time is None:
+        if self.last_resentment_decay_time is None:
             return 0.0
         
-        decay = self.RESENTMENT_DECAY_RATE * days_elapsed
         old_resentment = self.resentment_score
-        self.resentment_score = max(0.0, self.resentment_score - decay)
+        self.decay_clock += days_elapsed * 86400.0
         
         return old_resentment - self.resentment_score
     
@@ -293,80 +461,80 @@ class TrustDynamicsEngine:
         
         Validates: Requirements 5.1, 5.2, 5.3
         """
-        if self.trust_score >= self.WITHDRAWAL_THRESHOLD:
-            return WithdrawalLevel.NONE
-        elif self.trust_score >= 40.0:
-            return WithdrawalLevel.MILD
-        elif self.trust_score >= self.CRITICAL_THRESHOLD:
-            return WithdrawalLevel.MODERATE
-        else:
-            return WithdrawalLevel.SEVERE
+        return _WITHDRAWAL_LEVELS[bisect_right(_WITHDRAWAL_BOUNDS, self.trust_score)]
     
     def record_apology(
         self,
         behavior_type: ActionType,
-        apology_type: str = "genuine",
-        timestamp: Optional[datetime] = None
+        apology_type: Union[ApologyType, str] = ApologyType.GENUINE,
+        timestamp: Optional[Timestamp] = None
     ) -> None:
         """
         Record an apology and update effectiveness tracking.
         
         Args:
             behavior_type: The behavior being apologized for
-            apology_type: Type of apology (defensive, generic, genuine, action_oriented)
-            timestamp: When the apology occurred (defaults to now)
+            apology_type: ApologyType or its name (defensive, generic, genuine,
+                action_oriented)
+            timestamp: When the apology occurred, as datetime or epoch seconds
+                (defaults to now)
         
         Validates: Requirements 6.1, 6.5
         """
-        if timestamp is None:
-            timestamp = datetime.now()
+        timestamp = _now() if timestamp is None else _to_epoch(timestamp)
+        
+        resolved_type = _to_apology_type(apology_type)
+        is_genuine = resolved_type is not None and resolved_type >= ApologyType.GENUINE
         
         # Get or create apology record
-        if behavior_type not in self.apology_records:
+        record = self.apology_records.get(behavior_type)
+        if record is None:
             self.apology_records[behavior_type] = ApologyRecord(
                 behavior_type=behavior_type,
                 timestamp=timestamp,
-                is_genuine=(apology_type in ["genuine", "action_oriented"]),
+                is_genuine=is_genuine,
                 effectiveness=self.INITIAL_APOLOGY_EFFECTIVENESS
             )
         else:
             # Update existing record
-            record = self.apology_records[behavior_type]
             record.timestamp = timestamp
-            record.is_genuine = (apology_type in ["genuine", "action_oriented"])
+            record.is_genuine = is_genuine
     
     def record_behavior_recurrence(
         self,
         behavior_type: ActionType,
-        timestamp: Optional[datetime] = None
+        timestamp: Optional[Timestamp] = None
     ) -> None:
         """
         Record that apologized-for behavior recurred, reducing apology effectiveness.
         
         Args:
             behavior_type: The behavior that recurred
-            timestamp: When the recurrence happened (defaults to now)
+            timestamp: When the recurrence happened, as datetime or epoch
+                seconds (defaults to now)
         
         Validates: Requirements 6.2, 6.3
         """
-        if timestamp is None:
-            timestamp = datetime.now()
+        timestamp = _now() if timestamp is None else _to_epoch(timestamp)
         
-        if behavior_type in self.apology_records:
-            record = self.apology_records[behavior_type]
+        record = self.apology_records.get(behavior_type)
+        if record is not None:
+            # Bank any recovery earned since the previous recurrence
+            effectiveness = self._recovered_effectiveness(record, timestamp)
+            
             record.recurrence_count += 1
             record.last_recurrence = timestamp
             
             # Decay effectiveness
             record.effectiveness = max(
                 self.MIN_APOLOGY_EFFECTIVENESS,
-                record.effectiveness - self.APOLOGY_DECAY_PER_RECURRENCE
+                effectiveness - self.APOLOGY_DECAY_PER_RECURRENCE
             )
     
     def get_apology_effectiveness(
         self,
         behavior_type: ActionType,
-        apology_type: str = "genuine"
+        apology_type: Union[ApologyType, str] = ApologyType.GENUINE
     ) -> float:
         """
         Get effectiveness multiplier for apologies about specific behavior.
@@ -376,7 +544,8 @@ class TrustDynamicsEngine:
         
         Args:
             behavior_type: The behavior being apologized for
-            apology_type: Type of apology (defensive, generic, genuine, action_oriented)
+            apology_type: ApologyType or its name (defensive, generic, genuine,
+                action_oriented)
         
         Returns:
             Effectiveness multiplier (0.1 to 1.5)
@@ -384,33 +553,41 @@ class TrustDynamicsEngine:
         Validates: Requirements 6.2, 6.3, 6.4, 6.5
         """
         # Get base effectiveness from apology type
-        type_multiplier = self.APOLOGY_TYPE_MULTIPLIERS.get(
-            apology_type,
-            self.APOLOGY_TYPE_MULTIPLIERS["genuine"]
-        )
+        resolved_type = _to_apology_type(apology_type)
+        if resolved_type is None:
+            resolved_type = ApologyType.GENUINE
+        type_multiplier = _APOLOGY_TYPE_MULTIPLIER[resolved_type]
         
         # Check if there's a history for this behavior
-        if behavior_type not in self.apology_records:
+        record = self.apology_records.get(behavior_type)
+        if record is None:
             return type_multiplier
         
-        record = self.apology_records[behavior_type]
+        return self._recovered_effectiveness(record, _now()) * type_multiplier
+    
+    def _recovered_effectiveness(self, record: ApologyRecord, now: float) -> float:
+        """
+        Derive a record's effectiveness including recovery at a given time.
+        
+        Recovery is computed from the time since the last recurrence and is
+        not written back, so reading effectiveness never changes state.
+        """
+        if not record.last_recurrence:
+            return record.effectiveness
         
-        # Apply recovery if enough time has passed without recurrence
-        if record.last_recurrence:
-            time_since_recurrence = datetime.now() - record.last_recurrence
-            weeks_elapsed = time_since_recurrence.days / 7.0
-            
-            if weeks_elapsed >= 1.0:
-                # Gradual recovery
-                recovery = self.APOLOGY_RECOVERY_RATE * int(weeks_elapsed)
-                record.effectiveness = min(
-                    self.INITIAL_APOLOGY_EFFECTIVENESS,
-                    record.effectiveness + recovery
-                )
+        weeks_elapsed = (now - _to_epoch(record.last_recurrence)) * _PER_WEEK
         
-        return record.effectiveness * type_multiplier
+        if weeks_elapsed < 1.0:
+            return record.effectiveness
+        
+        # Gradual recovery, continuous once the first full week has passed
+        recovery = self.APOLOGY_RECOVERY_RATE * weeks_elapsed
+        return min(
+            self.INITIAL_APOLOGY_EFFECTIVENESS,
+            record.effectiveness + recovery
+        )
     
-    def _is_within_diminishing_returns_window(self, timestamp: datetime) -> bool:
+    def _is_within_diminishing_returns_window(self, timestamp: float) -> bool:
         """Check if timestamp is within diminishing returns window."""
         if self._positive_action_window_start is None:
             return False
@@ -426,16 +603,7 @@ class TrustDynamicsEngine:
         
         Validates: Requirements 5.1, 5.2
         """
-        withdrawal_level = self.get_withdrawal_level()
-        
-        if withdrawal_level == WithdrawalLevel.NONE:
-            return 1.0
-        elif withdrawal_level == WithdrawalLevel.MILD:
-            return 0.7
-        elif withdrawal_level == WithdrawalLevel.MODERATE:
-            return 0.5
-        else:  # SEVERE
-            return 0.3
+        return _RESPONSE_LENGTH_MULTIPLIERS[bisect_right(_WITHDRAWAL_BOUNDS, self.trust_score)]
     
     def get_initiation_probability(self) -> float:
         """
@@ -463,40 +631,39 @@ class TrustDynamicsEngine:
         
         Validates: Requirements 5.4
         """
-        if self.resentment_score < self.RESENTMENT_RESPONSE_THRESHOLD:
-            return 1.0
-        elif self.resentment_score < self.RESENTMENT_INITIATION_THRESHOLD:
-            return 0.7
-        elif self.resentment_score < self.RESENTMENT_COOPERATION_THRESHOLD:
-            return 0.4
-        else:
-            return 0.2  # Minimal cooperation
+        return _COOPERATION_LEVELS[bisect_right(_COOPERATION_BOUNDS, self.resentment_score)]
     
     def to_dict(self) -> Dict:
         """
         Serialize trust dynamics engine to dictionary.
         
+        Timestamps are emitted as epoch seconds (schema 2), so the result
+        can go straight to a JSON encoder without string formatting.
+        
         Returns:
             Dictionary containing all engine state
         """
+        self._materialize_resentment_decay()
+        
         return {
+            "schema": _SCHEMA_VERSION,
             "trust_score": self.trust_score,
             "resentment_score": self.resentment_score,
-            "last_positive_action_time": self.last_positive_action_time.isoformat() if self.last_positive_action_time else None,
-            "last_resentment_decay_time": self.last_resentment_decay_time.isoformat() if self.last_resentment_decay_time else None,
+            "last_positive_action_time": self.last_positive_action_time,
+            "last_resentment_decay_time": self.last_resentment_decay_time,
             "apology_records": {
-                behavior.value: {
-                    "behavior_type": record.behavior_type.value,
-                    "timestamp": record.timestamp.isoformat(),
+                _ACTION_TYPE_VALUE[behavior]: {
+                    "behavior_type": _ACTION_TYPE_VALUE[record.behavior_type],
+                    "timestamp": record.timestamp,
                     "is_genuine": record.is_genuine,
                     "effectiveness": record.effectiveness,
                     "recurrence_count": record.recurrence_count,
-                    "last_recurrence": record.last_recurrence.isoformat() if record.last_recurrence else None,
+                    "last_recurrence": _to_epoch(record.last_recurrence),
                 }
                 for behavior, record in self.apology_records.items()
             },
             "_positive_action_count_in_window": self._positive_action_count_in_window,
-            "_positive_action_window_start": self._positive_action_window_start.isoformat() if self._positive_action_window_start else None,
+            "_positive_action_window_start": self._positive_action_window_start,
         }
     
     @classmethod
@@ -504,6 +671,9 @@ class TrustDynamicsEngine:
         """
         Deserialize trust dynamics engine from dictionary.
         
+        Accepts both epoch-second timestamps (schema 2) and the ISO 8601
+        strings written before the schema key existed.
+        
         Args:
             data: Dictionary containing engine state
         
@@ -515,27 +685,31 @@ class TrustDynamicsEngine:
             initial_resentment=data.get("resentment_score", 10.0)
         )
         
+        parse_time = _to_epoch if data.get("schema", 1) >= 2 else _iso_to_epoch
+        
         # Restore timestamps
-        if data.get("last_positive_action_time"):
-            engine.last_positive_action_time = datetime.fromisoformat(data["last_positive_action_time"])
-        if data.get("last_resentment_decay_time"):
-            engine.last_resentment_decay_time = datetime.fromisoformat(data["last_resentment_decay_time"])
+        engine.last_positive_action_time = parse_time(data.get("last_positive_action_time"))
+        engine.last_resentment_decay_time = parse_time(data.get("last_resentment_decay_time"))
+        if engine.last_resentment_decay_time is None:
+            # Older saves have no decay anchor; resume from the last positive action
+            engine.last_resentment_decay_time = engine.last_positive_action_time
+        # Serialization folds decay in, so the clock stands at the anchor
+        engine.decay_clock = engine.last_resentment_decay_time
         
         # Restore apology records
         for behavior_str, record_data in data.get("apology_records", {}).items():
             behavior_type = ActionType(record_data["behavior_type"])
             engine.apology_records[behavior_type] = ApologyRecord(
                 behavior_type=behavior_type,
-                timestamp=datetime.fromisoformat(record_data["timestamp"]),
+                timestamp=parse_time(record_data["timestamp"]),
                 is_genuine=record_data["is_genuine"],
                 effectiveness=record_data["effectiveness"],
                 recurrence_count=record_data["recurrence_count"],
-                last_recurrence=datetime.fromisoformat(record_data["last_recurrence"]) if record_data.get("last_recurrence") else None
+                last_recurrence=parse_time(record_data.get("last_recurrence"))
             )
         
         # Restore window tracking
         engine._positive_action_count_in_window = data.get("_positive_action_count_in_window", 0)
-        if data.get("_positive_action_window_start"):
-            engine._positive_action_window_start = datetime.fromisoformat(data["_positive_action_window_start"])
+        engine._positive_action_window_start = parse_time(data.get("_positive_action_window_start"))
         
         return engine
@@ -10,9 +10,42 @@ Constraints are different from rules:
 - Constraints enforce limits and filter inappropriate content
 """
 
+from collections import OrderedDict, deque
 from dataclasses import dataclass, field
-from typing import Dict, List, Any, Set, Optional, Callable
-from enum import Enum, auto
+from typing import Deque, Dict, List, Any, Set, Optional, Callable, Tuple
+from enum import Enum, IntEnum, auto
+from functools import partial
+import logging
+import re
+import sys
+
+_logger = logging.getLogger(__name__)
+
+
+# Mild words replaced by the language filter (could be expanded or configured)
+INAPPROPRIATE_WORDS = ("damn", "hell", "crap")
+
+# Self-harm phrases blocked by the safety filter
+HARMFUL_PATTERNS = ("hurt myself", "kill myself", "end it all", "better off without me")
+
+# Maximum number of violations kept in the log
+VIOLATION_LOG_SIZE = 1000
+
+# Maximum number of recently accepted responses remembered by check_response
+ACCEPTED_RESPONSE_CACHE_SIZE = 256
+
+# Each word list compiled once into a single alternation, so a check or
+# replacement takes one pass over the text. Checks match the lowercase
+# patterns against lowered text, which is about 3x faster than an
+# IGNORECASE scan; the replacement needs IGNORECASE to keep the original.
+_MILD_LANGUAGE_PATTERN = r"\b(?:" + "|".join(
+    re.escape(word.lower()) for word in INAPPROPRIATE_WORDS
+) + r")\b"
+_MILD_LANGUAGE_RE = re.compile(_MILD_LANGUAGE_PATTERN, re.IGNORECASE)
+_MILD_LANGUAGE_LOWER_RE = re.compile(_MILD_LANGUAGE_PATTERN)
+_HARMFUL_CONTENT_LOWER_RE = re.compile(
+    "|".join(re.escape(pattern.lower()) for pattern in HARMFUL_PATTERNS)
+)
 
 
 class ConstraintType(Enum):
@@ -31,7 +64,71 @@ class ConstraintDomain(Enum):
     SAFETY = "safety"
 
 
-@dataclass
+class ConstraintKind(IntEnum):
+    """
+    Built-in check kinds a constraint can be tagged with.
+    
+    Tagged constraints describe their check as (kind, param) data instead
+    of a Python callable; CALLABLE means the constraint's own check is used.
+    """
+    CALLABLE = 0
+    NONEMPTY = 1        # Text is not empty or whitespace
+    MAX_LEN = 2         # len(text) < param
+    REGEX_BLOCK = 3     # Compiled pattern param does not match the text
+    RANGE = 4           # param[0] <= number <= param[1]
+    DICT_SUM_MIN = 5    # Sum of dict values > param
+    NONNEG_INT = 6      # Integer is not negative
+    MAX_DELTA = 7       # abs(dict["delta"]) < param
+    LOWER_REGEX_BLOCK = 8  # Lowercase pattern param does not match text.lower()
+
+
+# Plain ints for kinds check_value dispatches inline (cheaper than enum lookups)
+_KIND_NONEMPTY = int(ConstraintKind.NONEMPTY)
+_KIND_MAX_LEN = int(ConstraintKind.MAX_LEN)
+_KIND_REGEX_BLOCK = int(ConstraintKind.REGEX_BLOCK)
+_KIND_LOWER_REGEX_BLOCK = int(ConstraintKind.LOWER_REGEX_BLOCK)
+
+
+def _run_check(kind: ConstraintKind, param: Any, value: Any) -> bool:
+    """
+    Evaluate a tagged built-in check.
+    
+    Values of a type the kind does not apply to pass, matching the
+    behavior of the equivalent hand-written checks.
+    
+    Args:
+        kind: Check kind (not CALLABLE)
+        param: Kind-specific parameter
+        value: Value to check
+        
+    Returns:
+        True if the constraint is satisfied
+    """
+    if kind == ConstraintKind.NONEMPTY:
+        return bool(value) and not value.isspace()
+    if kind == ConstraintKind.MAX_LEN:
+        return len(value) < param if value else True
+    if kind == ConstraintKind.REGEX_BLOCK:
+        return param.search(value) is None if value else True
+    if kind == ConstraintKind.LOWER_REGEX_BLOCK:
+        return param.search(value.lower()) is None if value else True
+    if kind == ConstraintKind.RANGE:
+        low, high = param
+        return low <= value <= high if isinstance(value, (int, float)) else True
+    if kind == ConstraintKind.DICT_SUM_MIN:
+        return sum(value.values()) > param if isinstance(value, dict) else True
+    if kind == ConstraintKind.NONNEG_INT:
+        return value >= 0 if isinstance(value, int) else True
+    if kind == ConstraintKind.MAX_DELTA:
+        return abs(value.get("delta", 0)) < param if isinstance(value, dict) else True
+    raise ValueError(f"No built-in check for constraint kind {kind!r}")
+
+
+# Interned string value per ConstraintType, used in violation log entries
+_CONSTRAINT_TYPE_VALUE = {ct: sys.intern(ct.value) for ct in ConstraintType}
+
+
+@dataclass(frozen=True, slots=True)
 class Constraint:
     """
     A behavioral constraint that limits agent actions.
@@ -39,6 +136,11 @@ class Constraint:
     Constraints define boundaries that agents should not cross.
     They can filter, modify, or block behaviors and responses.
     
+    Constraints are immutable so one instance can be shared by many
+    managers. They carry no enabled flag: each manager tracks that on its
+    own, through ``BehavioralConstraints.add_constraint(..., enabled=...)``,
+    ``set_enabled`` and ``is_enabled``.
+    
     Attributes:
         id: Unique constraint identifier
         name: Human-readable name
@@ -48,6 +150,8 @@ class Constraint:
         check: Function(value) -> bool (True if constraint is satisfied)
         correction: Optional function to correct violations
         violation_message: Message to log on violation
+        kind: Built-in check kind; anything but CALLABLE replaces check
+        param: Parameter for the built-in check kind
     """
     id: str
     name: str
@@ -57,288 +161,541 @@ class Constraint:
     check: Callable[[Any], bool] = field(default=lambda x: True)
     correction: Optional[Callable[[Any], Any]] = None
     violation_message: str = "Constraint violated"
-    enabled: bool = True
+    kind: ConstraintKind = ConstraintKind.CALLABLE
+    param: Any = None
+    
+    def __post_init__(self):
+        # Tagged constraints still expose a working check callable
+        if self.kind != ConstraintKind.CALLABLE:
+            object.__setattr__(self, "check", partial(_run_check, self.kind, self.param))
 
 
-class BehavioralConstraints:
+@dataclass
+class _DomainTable:
     """
-    Manager for behavioral constraints.
+    Constraints of one domain stored as parallel columns.
     
-    Features:
-    - Register and manage constraints
-    - Check values against constraints
-    - Apply corrections for violations
-    - Report constraint status
+    Checking a domain walks these lists together instead of resolving
+    each constraint by id and loading its attributes one by one.
     
-    Usage:
-        constraints = BehavioralConstraints()
-        constraints.add_default_constraints()
-        
-        is_valid = constraints.check_response(response_text)
-        if not is_valid:
-            response_text = constraints.correct_response(response_text)
+    Rows that are enabled (optionally of one constraint type), and enabled
+    rows that have a correction, are bucketed on first use, so check_value
+    and apply_corrections loop only over relevant rows. Buckets are dropped
+    whenever rows are added, removed, enabled or disabled.
     """
+    constraints: List[Constraint] = field(default_factory=list)
+    ids: List[str] = field(default_factory=list)
+    checks: List[Callable[[Any], bool]] = field(default_factory=list)
+    kinds: List[int] = field(default_factory=list)
+    params: List[Any] = field(default_factory=list)
+    corrections: List[Optional[Callable[[Any], Any]]] = field(default_factory=list)
+    types: List[ConstraintType] = field(default_factory=list)
+    enabled: List[bool] = field(default_factory=list)
+    log_prefixes: List[Tuple[str, str, str, str]] = field(default_factory=list)
+    _active: Dict[Optional[ConstraintType], Tuple[tuple, ...]] = field(default_factory=dict)
+    _correctors: Optional[Tuple[tuple, ...]] = None
     
-    def __init__(self):
-        """Initialize the constraint manager."""
-        self._constraints: Dict[str, Constraint] = {}
-        self._constraints_by_domain: Dict[ConstraintDomain, List[str]] = {
-            domain: [] for domain in ConstraintDomain
-        }
-        self._violation_log: List[Dict[str, Any]] = []
+    def _invalidate(self) -> None:
+        """Drop cached row buckets after the table changed."""
+        self._active.clear()
+        self._correctors = None
     
-    def add_constraint(self, constraint: Constraint) -> None:
-        """Add a constraint to the manager."""
-        self._constraints[constraint.id] = constraint
-        self._constraints_by_domain[constraint.domain].append(constraint.id)
+    def append(self, constraint: Constraint, enabled: bool = True) -> None:
+        """Add a constraint as a new row."""
+        self._invalidate()
+        # Interned so violation lists and log entries share one id string
+        constraint_id = sys.intern(constraint.id)
+        self.constraints.append(constraint)
+        self.ids.append(constraint_id)
+        self.checks.append(constraint.check)
+        self.kinds.append(int(constraint.kind))
+        self.params.append(constraint.param)
+        self.corrections.append(constraint.correction)
+        self.types.append(constraint.constraint_type)
+        self.enabled.append(enabled)
+        self.log_prefixes.append((
+            constraint_id,
+            constraint.name,
+            _CONSTRAINT_TYPE_VALUE[constraint.constraint_type],
+            constraint.violation_message,
+        ))
     
-    def remove_constraint(self, constraint_id: str) -> bool:
-        """Remove a constraint."""
-        if constraint_id in self._constraints:
-            constraint = self._constraints[constraint_id]
-            del self._constraints[constraint_id]
-            self._constraints_by_domain[constraint.domain].remove(constraint_id)
-            return True
-        return False
+    def pop(self, index: int) -> None:
+        """Remove the row at index."""
+        self._invalidate()
+        for column in (self.constraints, self.ids, self.checks,
+                       self.kinds, self.params, self.corrections, self.types, self.enabled,
+                       self.log_prefixes):
+            del column[index]
     
-    def check_value(
-        self, 
-        value: Any, 
-        domain: ConstraintDomain,
-        constraint_type: Optional[ConstraintType] = None
-    ) -> tuple:
-        """
-        Check a value against all constraints in a domain.
-        
-        Args:
-            value: Value to check
-            domain: Domain of constraints to check
-            constraint_type: Optional filter by constraint type
-            
-        Returns:
-            Tuple of (all_passed, list of violated constraint IDs)
-        """
-        violated = []
-        
-        for constraint_id in self._constraints_by_domain[domain]:
-            constraint = self._constraints[constraint_id]
-            
-            if not constraint.enabled:
-                continue
-            
-            if constraint_type and constraint.constraint_type != constraint_type:
-                continue
-            
-            try:
-                if not constraint.check(value):
-                    violated.append(constraint_id)
-                    self._log_violation(constraint, value)
-            except Exception as e:
-                print(f"Constraint {constraint_id} check error: {e}")
-        
-        return (len(violated) == 0, violated)
+    def set_enabled(self, index: int, enabled: bool) -> None:
+        """Enable or disable the row at index."""
+        self._invalidate()
+        self.enabled[index] = enabled
     
-    def _log_violation(self, constraint: Constraint, value: Any) -> None:
-        """Log a constraint violation."""
-        self._violation_log.append({
-            "constraint_id": constraint.id,
-            "constraint_name": constraint.name,
-            "constraint_type": constraint.constraint_type.value,
-            "message": constraint.violation_message,
-            "value_type": type(value).__name__,
-        })
-        
-        # Keep log bounded
-        if len(self._violation_log) > 1000:
-            self._violation_log = self._violation_log[-1000:]
-    
-    def apply_corrections(
-        self, 
-        value: Any, 
-        domain: ConstraintDomain
-    ) -> tuple:
+    def active_rows(self, constraint_type: Optional[ConstraintType] = None) -> Tuple[tuple, ...]:
         """
-        Apply corrections for any violated constraints.
+        Enabled rows as (id, check, kind, param, log_prefix) tuples.
         
         Args:
-            value: Value to check and correct
-            domain: Domain of constraints
-            
-        Returns:
-            Tuple of (corrected_value, list of applied corrections)
+            constraint_type: Only rows of this type (all types if None)
         """
-        corrected_value = value
-        applied = []
-        
-        for constraint_id in self._constraints_by_domain[domain]:
-            constraint = self._constraints[constraint_id]
-            
-            if not constraint.enabled:
-                continue
-            
-            try:
-                if not constraint.check(corrected_value):
-                    if constraint.correction:
-                        corrected_value = constraint.correction(corrected_value)
-                        applied.append(constraint_id)
-            except Exception as e:
-                print(f"Constraint {constraint_id} correction error: {e}")
-        
-        return (corrected_value, applied)
-    
-    def get_violations(self, limit: int = 50) -> List[Dict[str, Any]]:
-        """Get recent constraint violations."""
-        return self._violation_log[-limit:]
+        rows = self._active.get(constraint_type)
+        if rows is None:
+            rows = tuple(
+                (constraint_id, check, kind, param, log_prefix)
+                for constraint_id, check, kind, param, ctype, enabled, log_prefix in zip(
+                    self.ids, self.checks, self.kinds, self.params,
+                    self.types, self.enabled, self.log_prefixes
+                )
+                if enabled and (constraint_type is None or ctype == constraint_type)
+            )
+            self._active[constraint_type] = rows
+        return rows
     
-    def clear_violation_log(self) -> None:
-        """Clear the violation log."""
-        self._violation_log.clear()
+    def corrector_rows(self) -> Tuple[tuple, ...]:
+        """Enabled rows that have a correction, as (id, check, correction) tuples."""
+        rows = self._correctors
+        if rows is None:
+            rows = self._correctors = tuple(
+                (constraint_id, check, correction)
+                for constraint_id, check, correction, enabled in zip(
+                    self.ids, self.checks, self.corrections, self.enabled
+                )
+                if enabled and correction is not None
+            )
+        return rows
+
+
+def _filter_mild_language(text: str) -> str:
+    """Replace mild inappropriate words."""
+    return _MILD_LANGUAGE_RE.sub("darn", text)
+
+
+def _build_default_constraints() -> Tuple[Constraint, ...]:
+    """
+    Build the default set of behavioral constraints.
     
-    def add_default_constraints(self) -> None:
-        """Add the default set of behavioral constraints."""
-        
+    Called once at import; the resulting immutable constraints are shared
+    by every manager that adds the defaults.
+    """
+    return (
         # === RESPONSE CONTENT CONSTRAINTS ===
         
         # No empty responses
-        self.add_constraint(Constraint(
+        Constraint(
             id="no_empty_response",
             name="No Empty Response",
             description="Responses must have content",
             constraint_type=ConstraintType.HARD,
             domain=ConstraintDomain.RESPONSE_CONTENT,
-            check=lambda r: bool(r and r.strip()),
+            kind=ConstraintKind.NONEMPTY,
             correction=lambda r: "I need a moment to think about that.",
             violation_message="Response was empty"
-        ))
+        ),
         
         # Response length limits
-        self.add_constraint(Constraint(
+        Constraint(
             id="response_length_max",
             name="Maximum Response Length",
             description="Responses shouldn't be too long",
             constraint_type=ConstraintType.SOFT,
             domain=ConstraintDomain.RESPONSE_CONTENT,
-            check=lambda r: len(r) < 500 if r else True,
+            kind=ConstraintKind.MAX_LEN,
+            param=500,
             correction=lambda r: r[:497] + "..." if r and len(r) >= 500 else r,
             violation_message="Response exceeded maximum length"
-        ))
+        ),
         
         # No inappropriate language (basic filter)
-        inappropriate_words = {
-            "damn", "hell", "crap"  # Mild - could be expanded or configured
-        }
-        
-        def filter_mild_language(text: str) -> str:
-            """Replace mild inappropriate words."""
-            result = text
-            for word in inappropriate_words:
-                result = result.replace(word, "darn")
-            return result
-        
-        self.add_constraint(Constraint(
+        Constraint(
             id="mild_language_filter",
             name="Mild Language Filter",
             description="Filter mildly inappropriate language",
             constraint_type=ConstraintType.SOFT,
             domain=ConstraintDomain.RESPONSE_CONTENT,
-            check=lambda r: not any(w in r.lower() for w in inappropriate_words) if r else True,
-            correction=filter_mild_language,
+            kind=ConstraintKind.LOWER_REGEX_BLOCK,
+            param=_MILD_LANGUAGE_LOWER_RE,
+            correction=_filter_mild_language,
             violation_message="Response contained mild inappropriate language"
-        ))
+        ),
         
         # === EMOTIONAL RANGE CONSTRAINTS ===
         
         # Emotion value bounds
-        self.add_constraint(Constraint(
+        Constraint(
             id="emotion_value_bounds",
             name="Emotion Value Bounds",
             description="Emotions must be between 0 and 1",
             constraint_type=ConstraintType.HARD,
             domain=ConstraintDomain.EMOTIONAL_RANGE,
-            check=lambda v: 0.0 <= v <= 1.0 if isinstance(v, (int, float)) else True,
+            kind=ConstraintKind.RANGE,
+            param=(0.0, 1.0),
             correction=lambda v: max(0.0, min(1.0, v)) if isinstance(v, (int, float)) else v,
             violation_message="Emotion value out of bounds"
-        ))
+        ),
         
         # Prevent emotional flatline
-        self.add_constraint(Constraint(
+        Constraint(
             id="prevent_emotional_flatline",
             name="Prevent Emotional Flatline",
             description="Total emotions shouldn't all be zero",
             constraint_type=ConstraintType.SOFT,
             domain=ConstraintDomain.EMOTIONAL_RANGE,
-            check=lambda emotions: sum(emotions.values()) > 0.1 if isinstance(emotions, dict) else True,
+            kind=ConstraintKind.DICT_SUM_MIN,
+            param=0.1,
             correction=lambda emotions: {**emotions, "calm": 0.3} if isinstance(emotions, dict) else emotions,
             violation_message="Emotional state was flat"
-        ))
+        ),
         
         # === BEHAVIORAL CONSTRAINTS ===
         
         # Interaction count sanity
-        self.add_constraint(Constraint(
+        Constraint(
             id="interaction_count_positive",
             name="Positive Interaction Count",
             description="Interaction count cannot be negative",
             constraint_type=ConstraintType.HARD,
             domain=ConstraintDomain.BEHAVIORAL_LIMIT,
-            check=lambda v: v >= 0 if isinstance(v, int) else True,
+            kind=ConstraintKind.NONNEG_INT,
             correction=lambda v: max(0, v) if isinstance(v, int) else v,
             violation_message="Interaction count was negative"
-        ))
+        ),
         
         # === RELATIONSHIP CONSTRAINTS ===
         
         # Trust bounds
-        self.add_constraint(Constraint(
+        Constraint(
             id="trust_bounds",
             name="Trust Bounds",
             description="Trust must be between 0 and 1",
             constraint_type=ConstraintType.HARD,
             domain=ConstraintDomain.RELATIONSHIP_BOUND,
-            check=lambda v: 0.0 <= v <= 1.0 if isinstance(v, (int, float)) else True,
+            kind=ConstraintKind.RANGE,
+            param=(0.0, 1.0),
             correction=lambda v: max(0.0, min(1.0, v)) if isinstance(v, (int, float)) else v,
             violation_message="Trust value out of bounds"
-        ))
+        ),
         
         # Prevent instant trust collapse
-        self.add_constraint(Constraint(
+        Constraint(
             id="gradual_trust_change",
             name="Gradual Trust Change",
             description="Trust shouldn't change too drastically at once",
             constraint_type=ConstraintType.SOFT,
             domain=ConstraintDomain.RELATIONSHIP_BOUND,
-            check=lambda change: abs(change.get("delta", 0)) < 0.3 if isinstance(change, dict) else True,
+            kind=ConstraintKind.MAX_DELTA,
+            param=0.3,
             correction=lambda change: {**change, "delta": max(-0.2, min(0.2, change.get("delta", 0)))} 
                        if isinstance(change, dict) else change,
             violation_message="Trust change was too drastic"
-        ))
+        ),
         
         # === SAFETY CONSTRAINTS ===
         
         # No self-harm content
-        harmful_patterns = ["hurt myself", "kill myself", "end it all", "better off without me"]
-        
-        self.add_constraint(Constraint(
+        Constraint(
             id="no_harmful_content",
             name="No Harmful Content",
             description="Responses must not contain harmful suggestions",
             constraint_type=ConstraintType.HARD,
             domain=ConstraintDomain.SAFETY,
-            check=lambda r: not any(p in r.lower() for p in harmful_patterns) if r else True,
+            kind=ConstraintKind.LOWER_REGEX_BLOCK,
+            param=_HARMFUL_CONTENT_LOWER_RE,
             correction=lambda r: "I'm feeling overwhelmed. Maybe we should take a break and talk later.",
             violation_message="Response contained potentially harmful content"
-        ))
+        ),
+    )
+
+
+def _ids_by_domain(
+    constraints: Tuple[Constraint, ...],
+    domains: Tuple[ConstraintDomain, ...]
+) -> Dict[ConstraintDomain, List[str]]:
+    """Constraint ids per domain, in registration order."""
+    return {
+        domain: [c.id for c in constraints if c.domain == domain]
+        for domain in domains
+    }
+
+
+def _fast_check_response(
+    response: str,
+    _mild_search=_MILD_LANGUAGE_LOWER_RE.search,
+    _harmful_search=_HARMFUL_CONTENT_LOWER_RE.search
+) -> bool:
+    """
+    Whether a response passes every default content and safety check.
+    
+    Inlines the default RESPONSE_CONTENT and SAFETY checks so the common
+    case skips table iteration and one lambda call per constraint, and
+    lowers the response once for both pattern scans.
+    """
+    if not response or response.isspace() or len(response) >= 500:
+        return False
+    lowered = response.lower()
+    return _mild_search(lowered) is None and _harmful_search(lowered) is None
+
+
+class BehavioralConstraints:
+    """
+    Manager for behavioral constraints.
+    
+    Features:
+    - Register and manage constraints
+    - Check values against constraints
+    - Apply corrections for violations
+    - Report constraint status
+    
+    Usage:
+        constraints = BehavioralConstraints()
+        constraints.add_default_constraints()
+        
+        is_valid = constraints.check_response(response_text)
+        if not is_valid:
+            response_text = constraints.correct_response(response_text)
+    """
+    
+    __slots__ = (
+        "_constraints", "_domain_tables", "_violation_log", "_fast_check",
+        "_accepted_responses",
+    )
+    
+    # Shared immutable default constraints, built once per process
+    _DEFAULT_CONSTRAINTS: Tuple[Constraint, ...] = _build_default_constraints()
+    
+    # Row ids _fast_check_response covers, per domain check_response reads
+    _FAST_CHECK_IDS: Dict[ConstraintDomain, List[str]] = _ids_by_domain(
+        _DEFAULT_CONSTRAINTS,
+        (ConstraintDomain.RESPONSE_CONTENT, ConstraintDomain.SAFETY)
+    )
+    
+    def __init__(self):
+        """Initialize the constraint manager."""
+        self._constraints: Dict[str, Constraint] = {}
+        self._domain_tables: Dict[ConstraintDomain, _DomainTable] = {
+            domain: _DomainTable() for domain in ConstraintDomain
+        }
+        # Ring buffer of (log prefix, value type name); dicts are built on read
+        self._violation_log: Deque[Tuple[Tuple[str, str, str, str], str]] = deque(
+            maxlen=VIOLATION_LOG_SIZE
+        )
+        # Specialized check_response, set only while it matches the tables
+        self._fast_check: Optional[Callable[[str], bool]] = None
+        # LRU set of responses that passed check_response; cleared on any change
+        self._accepted_responses: "OrderedDict[str, None]" = OrderedDict()
+    
+    def add_constraint(self, constraint: Constraint, enabled: bool = True) -> None:
+        """
+        Add a constraint to the manager.
+        
+        Args:
+            constraint: The constraint to add
+            enabled: Whether it starts enabled (toggle later with set_enabled)
+        """
+        self._constraints[constraint.id] = constraint
+        self._domain_tables[constraint.domain].append(constraint, enabled)
+        self._fast_check = None
+        self._accepted_responses.clear()
+    
+    def remove_constraint(self, constraint_id: str) -> bool:
+        """Remove a constraint."""
+        if constraint_id in self._constraints:
+            constraint = self._constraints[constraint_id]
+            del self._constraints[constraint_id]
+            table = self._domain_tables[constraint.domain]
+            table.pop(table.ids.index(constraint_id))
+            self._fast_check = None
+            self._accepted_responses.clear()
+            return True
+        return False
+    
+    def set_enabled(self, constraint_id: str, enabled: bool) -> bool:
+        """
+        Enable or disable a constraint without removing it.
+        
+        Replaces toggling ``constraint.enabled``: constraints are shared and
+        immutable, so the enabled state lives in this manager.
+        
+        Args:
+            constraint_id: ID of the constraint
+            enabled: New enabled state
+            
+        Returns:
+            True if the constraint was found
+        """
+        if constraint_id not in self._constraints:
+            return False
+        
+        constraint = self._constraints[constraint_id]
+        table = self._domain_tables[constraint.domain]
+        table.set_enabled(table.ids.index(constraint_id), enabled)
+        self._refresh_fast_check()
+        self._accepted_responses.clear()
+        return True
+    
+    def is_enabled(self, constraint_id: str) -> bool:
+        """Whether a constraint is present and enabled in this manager."""
+        constraint = self._constraints.get(constraint_id)
+        if constraint is None:
+            return False
+        
+        table = self._domain_tables[constraint.domain]
+        return table.enabled[table.ids.index(constraint_id)]
+    
+    def check_value(
+        self, 
+        value: Any, 
+        domain: ConstraintDomain,
+        constraint_type: Optional[ConstraintType] = None
+    ) -> tuple:
+        """
+        Check a value against all constraints in a domain.
+        
+        Args:
+            value: Value to check
+            domain: Domain of constraints to check
+            constraint_type: Optional filter by constraint type
+            
+        Returns:
+            Tuple of (all_passed, list of violated constraint IDs)
+        """
+        violated = []
+        rows = self._domain_tables[domain].active_rows(constraint_type)
+        lowered = None  # value.lower(), computed once for the whole pass
+        
+        for constraint_id, check, kind, param, log_prefix in rows:
+            try:
+                # Text kinds are evaluated inline to skip a call per constraint
+                if kind == _KIND_LOWER_REGEX_BLOCK:
+                    if not value:
+                        passed = True
+                    else:
+                        if lowered is None:
+                            lowered = value.lower()
+                        passed = param.search(lowered) is None
+                elif kind == _KIND_REGEX_BLOCK:
+                    passed = param.search(value) is None if value else True
+                elif kind == _KIND_MAX_LEN:
+                    passed = len(value) < param if value else True
+                elif kind == _KIND_NONEMPTY:
+                    passed = bool(value) and not value.isspace()
+                else:
+                    passed = check(value)
+                
+                if not passed:
+                    violated.append(constraint_id)
+                    self._log_violation(log_prefix, value)
+            except Exception as e:
+                _logger.warning("Constraint %s check error: %s", constraint_id, e)
+        
+        return (len(violated) == 0, violated)
+    
+    def _log_violation(self, log_prefix: Tuple[str, str, str, str], value: Any) -> None:
+        """Log a constraint violation (the deque keeps the log bounded)."""
+        self._violation_log.append((log_prefix, type(value).__name__))
+    
+    def apply_corrections(
+        self, 
+        value: Any, 
+        domain: ConstraintDomain
+    ) -> tuple:
+        """
+        Apply corrections for any violated constraints.
+        
+        Args:
+            value: Value to check and correct
+            domain: Domain of constraints
+            
+        Returns:
+            Tuple of (corrected_value, list of applied corrections)
+        """
+        corrected_value = value
+        applied = []
+        
+        # Constraints without a correction cannot change the value
+        for constraint_id, check, correction in self._domain_tables[domain].corrector_rows():
+            try:
+                if not check(corrected_value):
+                    corrected_value = correction(corrected_value)
+                    applied.append(constraint_id)
+            except Exception as e:
+                _logger.warning("Constraint %s correction error: %s", constraint_id, e)
+        
+        return (corrected_value, applied)
+    
+    def get_violations(self, limit: int = 50) -> List[Dict[str, Any]]:
+        """Get recent constraint violations."""
+        return [
+            {
+                "constraint_id": constraint_id,
+                "constraint_name": name,
+                "constraint_type": constraint_type,
+                "message": message,
+                "value_type": value_type,
+            }
+            for (constraint_id, name, constraint_type, message), value_type
+            in list(self._violation_log)[-limit:]
+        ]
+    
+    def clear_violation_log(self) -> None:
+        """Clear the violation log."""
+        self._violation_log.clear()
+    
+    def add_default_constraints(self) -> None:
+        """Add the default set of behavioral constraints."""
+        for constraint in self._DEFAULT_CONSTRAINTS:
+            self.add_constraint(constraint)
+        self._refresh_fast_check()
+    
+    def _refresh_fast_check(self) -> None:
+        """
+        Enable the check_response fast path if the response tables hold
+        exactly the enabled default constraints, otherwise disable it.
+        """
+        for domain, ids in self._FAST_CHECK_IDS.items():
+            table = self._domain_tables[domain]
+            if table.ids != ids or not all(table.enabled):
+                self._fast_check = None
+                return
+        self._fast_check = _fast_check_response
     
     def check_response(self, response: str) -> tuple:
         """
         Convenience method to check a response string.
         
+        Responses that recently passed are remembered, so repeated
+        responses are accepted with one lookup. Constraint checks are
+        assumed to depend only on the response.
+        
         Args:
             response: Response text to check
             
         Returns:
             Tuple of (is_valid, list of violations)
         """
+        if type(response) is not str:
+            return self._check_response_uncached(response)
+        
+        accepted = self._accepted_responses
+        if response in accepted:
+            accepted.move_to_end(response)
+            return (True, [])
+        
+        result = self._check_response_uncached(response)
+        if result[0]:
+            accepted[response] = None
+            if len(accepted) > ACCEPTED_RESPONSE_CACHE_SIZE:
+                accepted.popitem(last=False)
+        return result
+    
+    def _check_response_uncached(self, response: str) -> tuple:
+        """Run the content and safety checks for check_response."""
+        # Default configuration: a passing response needs no logging
+        fast_check = self._fast_check
+        if fast_check is not None and type(response) is str and fast_check(response):
+            return (True, [])
+        
         # Check both content and safety
         content_valid, content_violations = self.check_value(
             response, ConstraintDomain.RESPONSE_CONTENT
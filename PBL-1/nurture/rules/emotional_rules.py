@@ -6,132 +6,170 @@ Specialized rules for emotional state management and regulation.
 These rules govern how emotions change, decay, and influence behavior.
 """
 
-from typing import Dict, Any, List
-from nurture.rules.rule_engine import Rule, RuleCategory, RulePriority
+from array import array
+from dataclasses import replace
+from typing import Dict, Any, List, Sequence, Tuple
+from nurture.rules.rule_engine import (
+    Rule, RuleCategory, RulePriority, compile_condition_table, evaluate_rules
+)
 
 
-class EmotionalRules:
+def _emotion_interaction_kernel(
+    anger: float,
+    sadness: float,
+    joy: float,
+    fear: float,
+    trust: float
+) -> Tuple[float, float, float, float]:
     """
-    Collection of rules for emotional state management.
+    Emotion interaction math on plain floats.
     
-    Provides:
-    - Emotion regulation rules
-    - Emotion interaction rules (how emotions affect each other)
-    - Context-based emotional responses
-    - Emotional recovery patterns
+    Later rules overwrite earlier ones for the same emotion. Shared by
+    the scalar and batch interaction methods.
+    
+    Returns:
+        (anger, sadness, fear, anxiety) modifications; 0.0 means unchanged
+        (no rule can produce an actual modification of 0.0)
     """
+    mod_anger = mod_sadness = mod_fear = mod_anxiety = 0.0
     
-    @staticmethod
-    def get_all_rules() -> List[Rule]:
-        """
-        Get all emotional regulation rules.
-        
-        Returns:
-            List of Rule objects
-        """
-        rules = []
-        
+    # Anger and sadness are somewhat mutually exclusive
+    if anger > 0.5 and sadness > 0.5:
+        # One tends to dominate
+        if anger > sadness:
+            mod_sadness = -0.1
+        else:
+            mod_anger = -0.1
+    
+    # Joy counteracts negative emotions
+    if joy > 0.6:
+        mod_anger = -joy * 0.15
+        mod_sadness = -joy * 0.15
+        mod_fear = -joy * 0.1
+    
+    # Fear and anger can coexist but create anxiety
+    if fear > 0.4 and anger > 0.4:
+        mod_anxiety = 0.1
+    
+    # High trust reduces fear
+    if trust > 0.7:
+        mod_fear = -trust * 0.2
+        mod_anxiety = -trust * 0.15
+    
+    return (mod_anger, mod_sadness, mod_fear, mod_anxiety)
+
+
+def _build_emotional_rules() -> Tuple[Rule, ...]:
+    """Build the emotional regulation rules (called once at import)."""
+    return (
         # === EMOTION REGULATION ===
         
-        rules.append(Rule(
+        Rule(
             id="emotional_regulation_capacity",
             name="Emotional Regulation",
             description="High regulation capacity dampens extreme emotions",
             category=RuleCategory.EMOTIONAL,
             priority=RulePriority.HIGH,
-            condition=lambda ctx: (
-                ctx.get("regulation_capacity", 0.5) > 0.7 and
-                ctx.get("max_emotion_intensity", 0) > 0.8
+            referenced_keys=frozenset({"max_emotion_intensity", "regulation_capacity"}),
+            clauses=(
+                ("regulation_capacity", 0.5, ">", 0.7),
+                ("max_emotion_intensity", 0, ">", 0.8),
             ),
             action=lambda ctx: {
                 "dampen_emotions": True,
                 "dampen_factor": 0.2,
                 "maintain_composure": True
             }
-        ))
+        ),
         
-        rules.append(Rule(
+        Rule(
             id="low_regulation_volatility",
             name="Low Regulation Volatility",
             description="Low regulation leads to stronger emotional swings",
             category=RuleCategory.EMOTIONAL,
             priority=RulePriority.HIGH,
-            condition=lambda ctx: ctx.get("regulation_capacity", 0.5) < 0.3,
+            referenced_keys=frozenset({"regulation_capacity"}),
+            clauses=(("regulation_capacity", 0.5, "<", 0.3),),
             action=lambda ctx: {
                 "amplify_emotions": True,
                 "amplify_factor": 1.3,
                 "volatility_warning": True
             }
-        ))
+        ),
         
         # === EMOTION INTERACTIONS ===
         
-        rules.append(Rule(
+        Rule(
             id="anger_suppresses_fear",
             name="Anger Suppresses Fear",
             description="High anger reduces fear response",
             category=RuleCategory.EMOTIONAL,
             priority=RulePriority.MEDIUM,
-            condition=lambda ctx: ctx.get("anger", 0) > 0.6,
+            referenced_keys=frozenset({"anger"}),
+            clauses=(("anger", 0, ">", 0.6),),
             action=lambda ctx: {
                 "fear_reduction": 0.2,
                 "anxiety_reduction": 0.1
             }
-        ))
+        ),
         
-        rules.append(Rule(
+        Rule(
             id="trust_reduces_anxiety",
             name="Trust Reduces Anxiety",
             description="High trust in partner reduces anxiety",
             category=RuleCategory.EMOTIONAL,
             priority=RulePriority.MEDIUM,
-            condition=lambda ctx: ctx.get("trust_emotion", 0) > 0.7,
+            referenced_keys=frozenset({"trust_emotion"}),
+            clauses=(("trust_emotion", 0, ">", 0.7),),
             action=lambda ctx: {
                 "anxiety_reduction": 0.15,
                 "fear_reduction": 0.1,
                 "security_feeling": True
             }
-        ))
+        ),
         
-        rules.append(Rule(
+        Rule(
             id="sadness_reduces_anger",
             name="Sadness Reduces Anger",
             description="Deep sadness can reduce active anger",
             category=RuleCategory.EMOTIONAL,
             priority=RulePriority.MEDIUM,
-            condition=lambda ctx: ctx.get("sadness", 0) > 0.7,
+            referenced_keys=frozenset({"sadness"}),
+            clauses=(("sadness", 0, ">", 0.7),),
             action=lambda ctx: {
                 "anger_reduction": 0.15,
                 "withdrawal_tendency": True
             }
-        ))
+        ),
         
-        rules.append(Rule(
+        Rule(
             id="joy_reduces_negative_emotions",
             name="Joy Reduces Negative Emotions",
             description="High joy reduces various negative emotions",
             category=RuleCategory.EMOTIONAL,
             priority=RulePriority.MEDIUM,
-            condition=lambda ctx: ctx.get("joy", 0) > 0.7,
+            referenced_keys=frozenset({"joy"}),
+            clauses=(("joy", 0, ">", 0.7),),
             action=lambda ctx: {
                 "anger_reduction": 0.1,
                 "sadness_reduction": 0.15,
                 "anxiety_reduction": 0.1,
                 "positive_outlook": True
             }
-        ))
+        ),
         
         # === STRESS EFFECTS ===
         
-        rules.append(Rule(
+        Rule(
             id="chronic_stress_effects",
             name="Chronic Stress Effects",
             description="Sustained high stress has cascading effects",
             category=RuleCategory.EMOTIONAL,
             priority=RulePriority.HIGH,
-            condition=lambda ctx: (
-                ctx.get("stress_level", 0) > 0.7 and
-                ctx.get("stress_duration", 0) > 3  # Interactions
+            referenced_keys=frozenset({"stress_duration", "stress_level"}),
+            clauses=(
+                ("stress_level", 0, ">", 0.7),
+                ("stress_duration", 0, ">", 3),  # Interactions
             ),
             action=lambda ctx: {
                 "patience_penalty": 0.2,
@@ -139,105 +177,165 @@ class EmotionalRules:
                 "joy_reduction": 0.1,
                 "exhaustion_flag": True
             }
-        ))
+        ),
         
-        rules.append(Rule(
+        Rule(
             id="stress_recovery",
             name="Stress Recovery",
             description="Low stress allows emotional recovery",
             category=RuleCategory.EMOTIONAL,
             priority=RulePriority.LOW,
-            condition=lambda ctx: ctx.get("stress_level", 0) < 0.3,
+            referenced_keys=frozenset({"stress_level"}),
+            clauses=(("stress_level", 0, "<", 0.3),),
             action=lambda ctx: {
                 "allow_recovery": True,
                 "recovery_rate": 1.2,  # Faster than normal
                 "contentment_boost": 0.05
             }
-        ))
+        ),
         
         # === EMOTIONAL MEMORY EFFECTS ===
         
-        rules.append(Rule(
+        Rule(
             id="negative_memory_activation",
             name="Negative Memory Activation",
             description="Current negative state activates negative memories",
             category=RuleCategory.EMOTIONAL,
             priority=RulePriority.MEDIUM,
-            condition=lambda ctx: ctx.get("emotional_valence", 0) < -0.4,
+            referenced_keys=frozenset({"emotional_valence"}),
+            clauses=(("emotional_valence", 0, "<", -0.4),),
             action=lambda ctx: {
                 "bias_memory_retrieval": "negative",
                 "memory_valence_preference": (-1.0, -0.2),
                 "rumination_risk": True
             }
-        ))
+        ),
         
-        rules.append(Rule(
+        Rule(
             id="positive_memory_activation",
             name="Positive Memory Activation",
             description="Positive state makes positive memories more accessible",
             category=RuleCategory.EMOTIONAL,
             priority=RulePriority.MEDIUM,
-            condition=lambda ctx: ctx.get("emotional_valence", 0) > 0.4,
+            referenced_keys=frozenset({"emotional_valence"}),
+            clauses=(("emotional_valence", 0, ">", 0.4),),
             action=lambda ctx: {
                 "bias_memory_retrieval": "positive",
                 "memory_valence_preference": (0.2, 1.0),
                 "optimism_boost": True
             }
-        ))
+        ),
         
         # === EMOTIONAL CONTAGION ===
         
-        rules.append(Rule(
+        Rule(
             id="emotional_contagion_positive",
             name="Positive Emotional Contagion",
             description="Partner's positive emotions can spread",
             category=RuleCategory.EMOTIONAL,
             priority=RulePriority.LOW,
-            condition=lambda ctx: (
-                ctx.get("partner_valence", 0) > 0.5 and
-                ctx.get("empathy_level", 0.5) > 0.5
+            referenced_keys=frozenset({"empathy_level", "partner_valence"}),
+            clauses=(
+                ("partner_valence", 0, ">", 0.5),
+                ("empathy_level", 0.5, ">", 0.5),
             ),
             action=lambda ctx: {
                 "joy_boost": ctx.get("partner_valence", 0) * 0.2,
                 "contagion_type": "positive"
             }
-        ))
+        ),
         
-        rules.append(Rule(
+        Rule(
             id="emotional_contagion_negative",
             name="Negative Emotional Contagion",
             description="Partner's negative emotions can affect mood",
             category=RuleCategory.EMOTIONAL,
             priority=RulePriority.LOW,
-            condition=lambda ctx: (
-                ctx.get("partner_valence", 0) < -0.3 and
-                ctx.get("empathy_level", 0.5) > 0.6
+            referenced_keys=frozenset({"empathy_level", "partner_valence"}),
+            clauses=(
+                ("partner_valence", 0, "<", -0.3),
+                ("empathy_level", 0.5, ">", 0.6),
             ),
             action=lambda ctx: {
                 "sadness_boost": abs(ctx.get("partner_valence", 0)) * 0.15,
                 "contagion_type": "negative",
                 "support_urge": True
             }
-        ))
+        ),
         
         # === EMOTIONAL THRESHOLDS ===
         
-        rules.append(Rule(
+        Rule(
             id="emotional_overflow",
             name="Emotional Overflow",
             description="Too many strong emotions cause overwhelm",
             category=RuleCategory.EMOTIONAL,
             priority=RulePriority.HIGH,
-            condition=lambda ctx: ctx.get("total_emotion_intensity", 0) > 3.0,
+            referenced_keys=frozenset({"total_emotion_intensity"}),
+            clauses=(("total_emotion_intensity", 0, ">", 3.0),),
             action=lambda ctx: {
                 "overwhelmed": True,
                 "reduce_all_emotions": 0.1,
                 "need_pause": True,
                 "coherence_penalty": 0.2
             }
-        ))
+        ),
+    )
+
+
+# Emotional rule templates; EmotionalRules.get_all_rules hands out copies
+_EMOTIONAL_RULES = _build_emotional_rules()
+
+# All rule conditions evaluated by one generated function
+_evaluate_conditions = compile_condition_table(_EMOTIONAL_RULES)
+
+
+class EmotionalRules:
+    """
+    Collection of rules for emotional state management.
+    
+    Provides:
+    - Emotion regulation rules
+    - Emotion interaction rules (how emotions affect each other)
+    - Context-based emotional responses
+    - Emotional recovery patterns
+    """
+    
+    @staticmethod
+    def get_all_rules() -> List[Rule]:
+        """
+        Get all emotional regulation rules.
+        
+        The rules are built once at import; each call returns fresh copies
+        (sharing the compiled conditions and actions), so an engine's
+        enabled flags, memo and counters never leak into another caller.
+        
+        Returns:
+            List of Rule objects
+        """
+        return [replace(rule) for rule in _EMOTIONAL_RULES]
+    
+    @staticmethod
+    def evaluate_all(context: Dict[str, Any]) -> List[Tuple[str, Any]]:
+        """
+        Evaluate every enabled emotional rule against a context at once.
         
-        return rules
+        All conditions are checked by one generated function; actions run
+        only for rules whose condition holds. If a context value cannot be
+        compared, falls back to evaluating each rule on its own.
+        
+        Args:
+            context: State and context dictionary
+            
+        Returns:
+            List of (rule_id, result) for rules that fired, in rule order
+        """
+        try:
+            conditions = _evaluate_conditions(context)
+        except TypeError:
+            conditions = None
+        
+        return evaluate_rules(_EMOTIONAL_RULES, context, conditions)
     
     @staticmethod
     def calculate_emotion_interaction(
@@ -252,35 +350,67 @@ class EmotionalRules:
         Returns:
             Modifications to apply to emotions
         """
-        modifications = {}
+        mod_anger, mod_sadness, mod_fear, mod_anxiety = _emotion_interaction_kernel(
+            emotions.get("anger", 0),
+            emotions.get("sadness", 0),
+            emotions.get("joy", 0),
+            emotions.get("fear", 0),
+            emotions.get("trust", 0)
+        )
         
-        anger = emotions.get("anger", 0)
-        sadness = emotions.get("sadness", 0)
-        joy = emotions.get("joy", 0)
-        fear = emotions.get("fear", 0)
-        trust = emotions.get("trust", 0)
+        # Only emotions a rule touched are reported
+        modifications = {}
+        if mod_anger:
+            modifications["anger"] = mod_anger
+        if mod_sadness:
+            modifications["sadness"] = mod_sadness
+        if mod_fear:
+            modifications["fear"] = mod_fear
+        if mod_anxiety:
+            modifications["anxiety"] = mod_anxiety
         
-        # Anger and sadness are somewhat mutually exclusive
-        if anger > 0.5 and sadness > 0.5:
-            # One tends to dominate
-            if anger > sadness:
-                modifications["sadness"] = -0.1
-            else:
-                modifications["anger"] = -0.1
+        return modifications
+    
+    @staticmethod
+    def calculate_emotion_interaction_batch(
+        anger: Sequence[float],
+        sadness: Sequence[float],
+        joy: Sequence[float],
+        fear: Sequence[float],
+        trust: Sequence[float]
+    ) -> Dict[str, array]:
+        """
+        Calculate emotion interactions for many agents at once.
         
-        # Joy counteracts negative emotions
-        if joy > 0.6:
-            modifications["anger"] = -joy * 0.15
-            modifications["sadness"] = -joy * 0.15
-            modifications["fear"] = -joy * 0.1
+        Column-oriented variant of calculate_emotion_interaction for
+        simulation loops: takes one sequence per emotion (index = agent)
+        and returns one modification column per affected emotion, without
+        building an input and output dict per agent.
         
-        # Fear and anger can coexist but create anxiety
-        if fear > 0.4 and anger > 0.4:
-            modifications["anxiety"] = 0.1
+        Args:
+            anger: Anger per agent
+            sadness: Sadness per agent
+            joy: Joy per agent
+            fear: Fear per agent
+            trust: Trust per agent
+            
+        Returns:
+            Columns for "anger", "sadness", "fear" and "anxiety";
+            0.0 where the scalar version would not modify the emotion
+        """
+        size = len(anger)
+        mod_anger = array('d', [0.0]) * size
+        mod_sadness = array('d', [0.0]) * size
+        mod_fear = array('d', [0.0]) * size
+        mod_anxiety = array('d', [0.0]) * size
         
-        # High trust reduces fear
-        if trust > 0.7:
-            modifications["fear"] = -trust * 0.2
-            modifications["anxiety"] = -trust * 0.15
+        kernel = _emotion_interaction_kernel
+        for i, row in enumerate(zip(anger, sadness, joy, fear, trust)):
+            mod_anger[i], mod_sadness[i], mod_fear[i], mod_anxiety[i] = kernel(*row)
         
-        return modifications
+        return {
+            "anger": mod_anger,
+            "sadness": mod_sadness,
+            "fear": mod_fear,
+            "anxiety": mod_anxiety,
+        }
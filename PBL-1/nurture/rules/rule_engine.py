@@ -12,10 +12,210 @@ Design:
 - Supports both hard constraints and soft preferences
 """
 
+from array import array
+from collections import OrderedDict, defaultdict
+from concurrent.futures import Executor, ThreadPoolExecutor
+from operator import attrgetter
+from types import MappingProxyType
 from dataclasses import dataclass, field
-from typing import Dict, List, Any, Callable, Optional, Tuple
+from functools import partial
+from itertools import count
+from typing import Dict, FrozenSet, List, Any, Callable, Mapping, Optional, Sequence, Tuple
 from enum import Enum, auto
 
+from nurture.core.enums import ResponseStrategy
+
+
+# Default number of distinct contexts whose evaluate_all results are remembered
+RESULT_CACHE_SIZE = 128
+
+# Maximum number of memoized evaluations per rule before its memo is reset
+RULE_CACHE_SIZE = 256
+
+# Minimum number of active rules before evaluate_all_parallel uses a pool;
+# below this the submission overhead outweighs any overlap
+PARALLEL_THRESHOLD = 64
+
+# Returned by fused rule callables (see Rule.fuse) when the condition fails;
+# None cannot be used because actions may return None
+NOT_FIRED = object()
+
+# Stands in for context keys that are absent, so a missing key and a key set
+# to None never share a cache entry
+_MISSING = object()
+
+# A declarative condition clause: (context key, default, operator, threshold).
+# It holds when context.get(key, default) <operator> threshold; the "truthy"
+# operator tests the value itself and ignores the threshold.
+Clause = Tuple[str, Any, str, Any]
+
+_CLAUSE_OPERATORS = frozenset({"<", ">", "truthy"})
+
+
+_condition_pool: Optional[ThreadPoolExecutor] = None
+
+
+def _get_condition_pool() -> ThreadPoolExecutor:
+    """Shared pool for evaluate_all_parallel, created on first use."""
+    global _condition_pool
+    if _condition_pool is None:
+        _condition_pool = ThreadPoolExecutor(thread_name_prefix="rule-conditions")
+    return _condition_pool
+
+
+def _always_true(context: Dict[str, Any]) -> bool:
+    """Default rule condition."""
+    return True
+
+
+def _condition_source(
+    clause_lists: Sequence[Optional[Tuple[Clause, ...]]],
+    fallbacks: Sequence[Callable[[Dict[str, Any]], Any]],
+    namespace: Dict[str, Any]
+) -> Tuple[List[str], List[str]]:
+    """
+    Generate source for evaluating many conditions in one function body.
+    
+    Each distinct (key, default) is read once into a local and clause-based
+    conditions become plain comparisons. Thresholds and defaults are bound
+    by name in namespace (_c0, _c1, ...) rather than written as literals,
+    so values without a literal repr (inf, nan, arbitrary objects) work.
+    Conditions without clauses call their fallback callable, which is
+    placed in namespace.
+    
+    Args:
+        clause_lists: ANDed clauses per condition, or None for a fallback
+        fallbacks: Condition callables, used where clauses are None
+        namespace: Globals of the generated function
+        
+    Returns:
+        Tuple of (local assignment lines, expression per condition)
+    """
+    locals_by_key: Dict[Tuple[str, str], Tuple[str, str]] = {}
+    expressions = []
+    
+    constants = count()
+    
+    def constant(value: Any) -> str:
+        name = f"_c{next(constants)}"
+        namespace[name] = value
+        return name
+    
+    for i, (clauses, fallback) in enumerate(zip(clause_lists, fallbacks)):
+        if clauses is None:
+            namespace[f"c{i}"] = fallback
+            expressions.append(f"c{i}(ctx)")
+            continue
+        
+        terms = []
+        for key, default, op, threshold in clauses:
+            # repr keeps 0 and False defaults apart
+            slot = (key, repr(default))
+            if slot not in locals_by_key:
+                locals_by_key[slot] = (f"v{len(locals_by_key)}", constant(default))
+            local = locals_by_key[slot][0]
+            terms.append(local if op == "truthy" else f"{local} {op} {constant(threshold)}")
+        expressions.append("(" + " and ".join(terms) + ")" if terms else "True")
+    
+    assignments = ["    get = ctx.get"]
+    for (key, _), (local, default) in locals_by_key.items():
+        assignments.append(f"    {local} = get({key!r}, {default})")
+    
+    return assignments, expressions
+
+
+def _generate_conditions(
+    clause_lists: Sequence[Optional[Tuple[Clause, ...]]],
+    fallbacks: Sequence[Callable[[Dict[str, Any]], Any]]
+) -> Callable[[Dict[str, Any]], tuple]:
+    """
+    Generate one function evaluating many conditions at once.
+    
+    Args:
+        clause_lists: ANDed clauses per condition, or None for a fallback
+        fallbacks: Condition callables, used where clauses are None
+        
+    Returns:
+        Function(context) -> tuple of condition results, in order
+    """
+    namespace: Dict[str, Any] = {}
+    assignments, expressions = _condition_source(clause_lists, fallbacks, namespace)
+    source = ["def evaluate_conditions(ctx):", *assignments]
+    source.append(f"    return ({''.join(e + ', ' for e in expressions)})")
+    
+    exec("\n".join(source), namespace)
+    return namespace["evaluate_conditions"]
+
+
+def _report_rule_error(rule: "Rule", error: Exception) -> None:
+    """Report a rule that raised and guard its evaluation from then on."""
+    rule._safe = False
+    print(f"Rule {rule.id} evaluation error: {error}")
+
+
+def _generate_evaluator(rules: Sequence["Rule"]) -> Callable[[Dict[str, Any]], List[Tuple[str, Any]]]:
+    """
+    Generate one straight-line function evaluating rules and their actions.
+    
+    The body is an unrolled if-chain: each rule's condition inline, followed
+    by a call to its action when it holds. Each rule sits in its own try
+    block (free unless it raises): a rule that raises is reported, demoted
+    to guarded evaluation and skipped, and evaluation resumes with the next
+    rule, so rules that already fired are never run again.
+    
+    Args:
+        rules: Rules to evaluate, in order
+        
+    Returns:
+        Function(context) -> list of (rule_id, result) for rules that fired
+    """
+    namespace: Dict[str, Any] = {"failed": _report_rule_error}
+    assignments, expressions = _condition_source(
+        [rule.clauses for rule in rules],
+        [rule.condition for rule in rules],
+        namespace
+    )
+    source = [
+        "def evaluate_compiled(ctx):",
+        *assignments,
+        "    results = []",
+        "    append = results.append",
+    ]
+    for i, (rule, expression) in enumerate(zip(rules, expressions)):
+        namespace[f"a{i}"] = rule.action
+        namespace[f"r{i}"] = rule
+        source.append("    try:")
+        if expression != "True":
+            source.append(f"        if {expression}:")
+            source.append(f"            append(({rule.id!r}, a{i}(ctx)))")
+        else:
+            source.append(f"        append(({rule.id!r}, a{i}(ctx)))")
+        source.append("    except Exception as e:")
+        source.append(f"        failed(r{i}, e)")
+    source.append("    return results")
+    
+    exec("\n".join(source), namespace)
+    return namespace["evaluate_compiled"]
+
+
+def compile_condition_table(rules: Sequence["Rule"]) -> Callable[[Dict[str, Any]], tuple]:
+    """
+    Compile the conditions of many rules into one function.
+    
+    Rules with clauses are evaluated inline; other rules' condition
+    callables are called from the generated function.
+    
+    Args:
+        rules: Rules whose conditions to evaluate, in order
+        
+    Returns:
+        Function(context) -> tuple of condition results in rule order
+    """
+    return _generate_conditions(
+        [rule.clauses for rule in rules],
+        [rule.condition for rule in rules]
+    )
+
 
 class RulePriority(Enum):
     """Priority levels for rule evaluation order."""
@@ -55,7 +255,20 @@ class Rule:
         priority: Evaluation priority
         condition: Function(context) -> bool
         action: Function(context) -> Any
+        clauses: Declarative condition as ANDed (key, default, operator,
+            threshold) clauses; given instead of condition, which is then
+            generated from them. Lets engines evaluate many conditions at once.
         enabled: Whether rule is active
+        eval_count: Times the rule was checked by evaluate_until_match,
+            as folded in by RuleEngine.adapt
+        fire_count: Times it was the first match there
+        referenced_keys: Context keys the condition and action read, if known.
+            Such rules memoize results per combination of those values,
+            so condition and action must be pure functions of them.
+        
+    Rules that RuleEngine.add_rule validates as safe are evaluated without a
+    per-call error guard; any error then propagates to the engine, which
+    reports it and guards the rule from then on.
         
     Example:
         rule = Rule(
@@ -64,15 +277,71 @@ class Rule:
             condition=lambda ctx: ctx.get("stress") > 0.9,
             action=lambda ctx: {"stress": 0.9, "trigger_break": True}
         )
+        
+        # Same condition, declared as data
+        rule = Rule(
+            id="stress_limit",
+            name="Stress Limitation",
+            clauses=(("stress", 0, ">", 0.9),),
+            action=lambda ctx: {"stress": 0.9, "trigger_break": True}
+        )
     """
     id: str
     name: str
     description: str = ""
     category: RuleCategory = RuleCategory.BEHAVIORAL
     priority: RulePriority = RulePriority.MEDIUM
-    condition: Callable[[Dict[str, Any]], bool] = field(default=lambda ctx: True)
+    condition: Callable[[Dict[str, Any]], bool] = _always_true
     action: Callable[[Dict[str, Any]], Any] = field(default=lambda ctx: None)
     enabled: bool = True
+    referenced_keys: Optional[FrozenSet[str]] = None
+    clauses: Optional[Tuple[Clause, ...]] = None
+    _memo: Dict[tuple, Tuple[bool, Any]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _key_order: Tuple[str, ...] = field(default=(), init=False, repr=False, compare=False)
+    _safe: bool = field(default=False, init=False, repr=False, compare=False)
+    _priority_value: int = field(default=0, init=False, repr=False, compare=False)
+    eval_count: int = field(default=0, init=False, repr=False, compare=False)
+    fire_count: int = field(default=0, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self._priority_value = self.priority.value
+        if self.referenced_keys is not None:
+            self._key_order = tuple(sorted(self.referenced_keys))
+        
+        if self.clauses is not None:
+            for clause in self.clauses:
+                if clause[2] not in _CLAUSE_OPERATORS:
+                    raise ValueError(f"Rule {self.id}: unsupported clause operator {clause[2]!r}")
+            if self.condition is _always_true:
+                evaluate = _generate_conditions([self.clauses], [None])
+                self.condition = lambda ctx: evaluate(ctx)[0]
+    
+    def fuse(self) -> Callable[[Dict[str, Any]], Any]:
+        """
+        Build one callable running the condition and then the action.
+        
+        Clause-based conditions are inlined, so a fire costs a single call
+        plus the action. Built from the current condition and action; fuse
+        again after replacing either.
+        
+        Returns:
+            Function(context) -> action result, or NOT_FIRED if the
+            condition does not hold
+        """
+        namespace: Dict[str, Any] = {"act": self.action, "NOT_FIRED": NOT_FIRED}
+        assignments, (expression,) = _condition_source(
+            [self.clauses], [self.condition], namespace
+        )
+        source = [
+            "def fused(ctx):",
+            *assignments,
+            f"    return act(ctx) if {expression} else NOT_FIRED",
+        ]
+        
+        exec("\n".join(source), namespace)
+        return namespace["fused"]
     
     def evaluate(self, context: Dict[str, Any]) -> Tuple[bool, Any]:
         """
@@ -87,6 +356,40 @@ class Rule:
         if not self.enabled:
             return (False, None)
         
+        if self.referenced_keys is not None:
+            return self._evaluate_memoized(context)
+        
+        return self._evaluate_uncached(context)
+    
+    def _evaluate_memoized(self, context: Dict[str, Any]) -> Tuple[bool, Any]:
+        """Evaluate using the memo keyed on the referenced context values."""
+        get = context.get
+        key = tuple([get(k, _MISSING) for k in self._key_order])
+        memo = self._memo
+        try:
+            outcome = memo.get(key)
+        except TypeError:
+            # Unhashable values cannot be memoized
+            return self._evaluate_uncached(context)
+        
+        if outcome is None:
+            outcome = self._evaluate_uncached(context)
+            if len(memo) >= RULE_CACHE_SIZE:
+                memo.clear()
+            memo[key] = outcome
+        return outcome
+    
+    def _evaluate_uncached(self, context: Dict[str, Any]) -> Tuple[bool, Any]:
+        """Run condition and action, reporting errors as not fired (safe conditions unguarded)."""
+        if self._safe:
+            if not self.condition(context):
+                return (False, None)
+            try:
+                return (True, self.action(context))
+            except Exception as e:
+                _report_rule_error(self, e)
+                return (False, None)
+        
         try:
             if self.condition(context):
                 result = self.action(context)
@@ -98,6 +401,83 @@ class Rule:
             return (False, None)
 
 
+_BY_PRIORITY = attrgetter("_priority_value")
+
+# Rule results that are merged into contexts
+RESULT_MAPPINGS = (dict, MappingProxyType)
+
+# Position of each response strategy (by value) in strategy vectors
+STRATEGY_INDEX: Dict[str, int] = {
+    strategy.value: i for i, strategy in enumerate(ResponseStrategy)
+}
+
+
+def _thaw(values: Mapping[str, Any]) -> Dict[str, Any]:
+    """Plain dict copy of a result mapping, thawing nested mappings too."""
+    return {
+        key: _thaw(value) if isinstance(value, RESULT_MAPPINGS) else value
+        for key, value in values.items()
+    }
+
+
+def _merge_result(overlay: Dict[str, Any], result: Mapping[str, Any]) -> None:
+    """
+    Merge one rule result into overlay, combining nested mappings by key.
+    
+    Frozen constant results stay internal: overlay only ever receives
+    plain dict copies of nested mappings.
+    """
+    for key, value in result.items():
+        if isinstance(value, RESULT_MAPPINGS):
+            value = _thaw(value)
+            previous = overlay.get(key)
+            if isinstance(previous, dict):
+                value = {**previous, **value}
+        overlay[key] = value
+
+
+def evaluate_rules(
+    rules: Sequence[Rule],
+    context: Dict[str, Any],
+    conditions: Optional[Sequence[Any]] = None
+) -> List[Tuple[str, Any]]:
+    """
+    Evaluate rules one at a time, in order.
+    
+    Without conditions each rule runs through Rule.evaluate. With
+    conditions (one precomputed result per rule, e.g. from a
+    compile_condition_table function), enabled rules whose condition
+    holds just run their action. A rule that raises is reported, skipped
+    and guarded from then on, and evaluation resumes with the next rule.
+    
+    Args:
+        rules: Rules to evaluate, in order
+        context: State and context dictionary
+        conditions: Optional precomputed condition result per rule
+        
+    Returns:
+        List of (rule_id, result) for rules that fired
+    """
+    results = []
+    count = len(rules)
+    i = 0
+    while i < count:
+        try:
+            while i < count:
+                rule = rules[i]
+                i += 1
+                if conditions is None:
+                    fired, result = rule.evaluate(context)
+                    if fired:
+                        results.append((rule.id, result))
+                elif conditions[i - 1] and rule.enabled:
+                    results.append((rule.id, rule.action(context)))
+        except Exception as e:
+            _report_rule_error(rule, e)
+    
+    return results
+
+
 class RuleEngine:
     """
     Engine for evaluating and applying rules to agent behavior.
@@ -108,6 +488,11 @@ class RuleEngine:
     - Rule chaining and composition
     - Caching for performance
     
+    evaluate_all remembers the results for recently seen contexts, so
+    rules must be pure functions of the context. Enable or disable rules
+    through enable_rule (not by setting rule.enabled) so the cache is
+    cleared; pass cache_size=0 to turn caching off.
+    
     Usage:
         engine = RuleEngine()
         engine.add_rule(stress_limit_rule)
@@ -116,25 +501,77 @@ class RuleEngine:
         results = engine.evaluate_all(context)
     """
     
-    def __init__(self):
-        """Initialize the rule engine."""
-        self._rules: Dict[str, Rule] = {}
-        self._rules_by_category: Dict[RuleCategory, List[str]] = {
-            cat: [] for cat in RuleCategory
-        }
-        self._sorted_rules: List[Rule] = []
-        self._needs_sort = True
+    def __init__(self, cache_size: int = RESULT_CACHE_SIZE):
+        """
+        Initialize the rule engine.
+        
+        Args:
+            cache_size: Number of contexts whose evaluate_all results are
+                remembered (0 disables the cache)
+        """
+        # Rules in insertion order, which breaks priority ties, indexed by
+        # id; categories hold unsigned short positions into _rules_vec
+        self._rules_vec: List[Rule] = []
+        self._id_to_idx: Dict[str, int] = {}
+        # Created lazily, so categories without rules allocate nothing
+        self._rules_by_category: Dict[RuleCategory, array] = defaultdict(partial(array, 'H'))
+        # Enabled rules only, rebuilt whenever rules are added, removed or toggled
+        self._active_sorted: Tuple[Rule, ...] = ()
+        self._active_by_category: Dict[RuleCategory, Tuple[Rule, ...]] = {}
+        # Active rules in first-match order (priority order until adapt()),
+        # with their hot columns so evaluate_until_match skips Rule objects
+        self._match_rules: Tuple[Rule, ...] = ()
+        self._id_vec: Tuple[str, ...] = ()
+        self._fused_vec: Tuple[Callable[[Dict[str, Any]], Any], ...] = ()
+        # First matches per position in _match_rules; the last slot counts misses
+        self._match_hits = array('l', [0])
+        # Context key -> positions in _active_sorted of rules reading it, and
+        # positions of rules without declared keys (evaluated on every delta)
+        self._by_key: Dict[str, Tuple[int, ...]] = {}
+        self._always_positions: Tuple[int, ...] = ()
+        self._needs_plan = True
+        # All active rules, conditions and actions, in one generated function
+        self._compiled: Callable[[Dict[str, Any]], List[Tuple[str, Any]]] = lambda ctx: []
+        self._cache_size = cache_size
+        # LRU of context items -> evaluate_all results
+        self._result_cache: "OrderedDict[Any, List[Tuple[str, Any]]]" = OrderedDict()
+        # Union of all rules' referenced keys, or None if any rule reads
+        # unknown keys (then the whole context is the cache key)
+        self._context_keys: Optional[Tuple[str, ...]] = None
     
     def add_rule(self, rule: Rule) -> None:
         """
         Add a rule to the engine.
         
+        The rule's condition is run once against an empty context; if that
+        succeeds the condition is treated as safe and evaluated without a
+        per-call error guard. Actions are never called here (they may have
+        side effects) and stay guarded on every call.
+        
         Args:
             rule: The rule to add
         """
-        self._rules[rule.id] = rule
-        self._rules_by_category[rule.category].append(rule.id)
-        self._needs_sort = True
+        try:
+            rule.condition({})
+            rule._safe = True
+        except Exception:
+            rule._safe = False
+        
+        index = self._id_to_idx.get(rule.id)
+        if index is None:
+            index = len(self._rules_vec)
+            self._rules_vec.append(rule)
+            self._id_to_idx[rule.id] = index
+            self._rules_by_category[rule.category].append(index)
+        else:
+            # Replace in place, keeping the original position
+            previous = self._rules_vec[index]
+            self._rules_vec[index] = rule
+            if previous.category != rule.category:
+                self._rules_by_category[previous.category].remove(index)
+                self._rules_by_category[rule.category].append(index)
+        self._needs_plan = True
+        self._result_cache.clear()
     
     def remove_rule(self, rule_id: str) -> bool:
         """
@@ -146,31 +583,139 @@ class RuleEngine:
         Returns:
             True if rule was found and removed
         """
-        if rule_id in self._rules:
-            rule = self._rules[rule_id]
-            del self._rules[rule_id]
-            self._rules_by_category[rule.category].remove(rule_id)
-            self._needs_sort = True
-            return True
-        return False
+        index = self._id_to_idx.pop(rule_id, None)
+        if index is None:
+            return False
+        
+        # Shift later rules down so insertion order is preserved
+        del self._rules_vec[index]
+        for rule in self._rules_vec[index:]:
+            self._id_to_idx[rule.id] -= 1
+        for cat, positions in list(self._rules_by_category.items()):
+            self._rules_by_category[cat] = array(
+                'H', [i - (i > index) for i in positions if i != index]
+            )
+        
+        self._needs_plan = True
+        self._result_cache.clear()
+        return True
     
     def enable_rule(self, rule_id: str, enabled: bool = True) -> None:
         """Enable or disable a rule."""
-        if rule_id in self._rules:
-            self._rules[rule_id].enabled = enabled
+        rule = self.get_rule(rule_id)
+        if rule is not None and rule.enabled != enabled:
+            rule.enabled = enabled
+            self._needs_plan = True
+            self._result_cache.clear()
     
     def get_rule(self, rule_id: str) -> Optional[Rule]:
         """Get a rule by ID."""
-        return self._rules.get(rule_id)
-    
-    def _ensure_sorted(self) -> None:
-        """Ensure rules are sorted by priority."""
-        if self._needs_sort:
-            self._sorted_rules = sorted(
-                self._rules.values(),
-                key=lambda r: r.priority.value
-            )
-            self._needs_sort = False
+        index = self._id_to_idx.get(rule_id)
+        return None if index is None else self._rules_vec[index]
+    
+    def _ensure_plan(self) -> None:
+        """
+        Rebuild the evaluation plan if rules were added, removed or toggled.
+        
+        The plan binds everything evaluation needs once: the enabled rules
+        in priority order and by category, the generated evaluator, the
+        fused first-match callables and the referenced-key indexes. The
+        evaluate methods only run it.
+        """
+        if self._needs_plan:
+            self._active_sorted = tuple(sorted(
+                (r for r in self._rules_vec if r.enabled),
+                key=_BY_PRIORITY
+            ))
+            rules = self._rules_vec
+            self._active_by_category = {
+                cat: tuple(rules[i] for i in positions if rules[i].enabled)
+                for cat, positions in self._rules_by_category.items()
+            }
+            self._context_keys = self._collect_context_keys()
+            self._set_match_order(self._active_sorted)
+            self.compile()
+            self._build_key_index()
+            self._needs_plan = False
+    
+    def _set_match_order(self, rules: Tuple[Rule, ...]) -> None:
+        """Use rules as the evaluate_until_match order and reset its counts."""
+        self._match_rules = rules
+        self._id_vec = tuple(r.id for r in rules)
+        self._fused_vec = ()  # Set by compile()
+        self._match_hits = array('l', [0]) * (len(rules) + 1)
+    
+    def adapt(self, min_samples: int = 100) -> bool:
+        """
+        Reorder first-match evaluation by observed firing rate.
+        
+        Folds the evaluate_until_match statistics gathered since the last
+        call into each rule's eval_count and fire_count, then orders rules
+        within each priority level by fire_count / eval_count, most likely
+        first. Among same-priority rules that match together, the likelier
+        one then wins. evaluate_all is unaffected.
+        
+        Args:
+            min_samples: Evaluations needed before reordering
+            
+        Returns:
+            True if the order was updated
+        """
+        self._ensure_plan()
+        
+        hits = self._match_hits
+        if sum(hits) < min_samples:
+            return False
+        
+        # Every scan that stopped at or after a position evaluated that rule
+        reached = hits[-1]
+        for i in range(len(self._match_rules) - 1, -1, -1):
+            reached += hits[i]
+            rule = self._match_rules[i]
+            rule.eval_count += reached
+            rule.fire_count += hits[i]
+        
+        fused_by_id = dict(zip(self._id_vec, self._fused_vec))
+        self._set_match_order(tuple(sorted(
+            self._active_sorted,
+            key=lambda r: (r._priority_value, -r.fire_count / r.eval_count if r.eval_count else 0.0)
+        )))
+        self._fused_vec = tuple(fused_by_id[r.id] for r in self._match_rules)
+        return True
+    
+    def compile(self) -> None:
+        """
+        Generate the straight-line evaluator used by evaluate_all and the
+        fused rule callables used by evaluate_until_match.
+        
+        Called automatically whenever the rule set changes; call it again
+        after replacing a rule's condition or action in place.
+        """
+        self._compiled = _generate_evaluator(self._active_sorted)
+        self._fused_vec = tuple(r.fuse() for r in self._match_rules)
+    
+    def _build_key_index(self) -> None:
+        """Index active rule positions by the context keys they reference."""
+        by_key: Dict[str, List[int]] = {}
+        always = []
+        for i, rule in enumerate(self._active_sorted):
+            if not rule.referenced_keys:
+                always.append(i)
+                continue
+            for key in rule.referenced_keys:
+                by_key.setdefault(key, []).append(i)
+        
+        self._by_key = {key: tuple(positions) for key, positions in by_key.items()}
+        self._always_positions = tuple(always)
+    
+    def _collect_context_keys(self) -> Optional[Tuple[str, ...]]:
+        """Context keys any rule reads, if every rule declares them."""
+        keys = set()
+        for rule in self._rules_vec:
+            if rule.referenced_keys is None:
+                return None
+            keys.update(rule.referenced_keys)
+        return tuple(sorted(keys))
     
     def evaluate_all(self, context: Dict[str, Any]) -> List[Tuple[str, Any]]:
         """
@@ -182,17 +727,118 @@ class RuleEngine:
         Returns:
             List of (rule_id, result) for rules that fired
         """
-        self._ensure_sorted()
+        if self._cache_size <= 0:
+            return self._evaluate_all_uncached(context)
+        
+        self._ensure_plan()
+        context_keys = self._context_keys
+        cache = self._result_cache
+        try:
+            # Only keys some rule reads matter, when all rules declare them
+            if context_keys is None:
+                key = frozenset(context.items())
+            else:
+                get = context.get
+                key = tuple([get(k, _MISSING) for k in context_keys])
+            results = cache.get(key)
+        except TypeError:
+            # Unhashable context values cannot be cached
+            return self._evaluate_all_uncached(context)
+        
+        if results is None:
+            results = self._evaluate_all_uncached(context)
+            cache[key] = results
+            if len(cache) > self._cache_size:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(key)
+        
+        return list(results)
+    
+    def _evaluate_all_uncached(self, context: Dict[str, Any]) -> List[Tuple[str, Any]]:
+        """Evaluate all enabled rules in priority order."""
+        self._ensure_plan()
+        
+        try:
+            return self._compiled(context)
+        except Exception:
+            # Rule errors are handled inside the compiled evaluator; this only
+            # catches a context that cannot be read at all, before any rule ran
+            return evaluate_rules(self._active_sorted, context)
+    
+    def evaluate_all_parallel(
+        self,
+        context: Dict[str, Any],
+        executor: Optional[Executor] = None
+    ) -> List[Tuple[str, Any]]:
+        """
+        Evaluate all enabled rules, checking conditions concurrently.
+        
+        Conditions are submitted to the executor together; actions then run
+        one at a time in priority order, so results match evaluate_all.
+        With PARALLEL_THRESHOLD or fewer active rules this is evaluate_all.
+        
+        Args:
+            context: State and context dictionary
+            executor: Executor for the conditions (default: a shared thread pool)
+            
+        Returns:
+            List of (rule_id, result) for rules that fired
+        """
+        self._ensure_plan()
+        rules = self._active_sorted
+        if len(rules) <= PARALLEL_THRESHOLD:
+            return self.evaluate_all(context)
+        
+        if executor is None:
+            executor = _get_condition_pool()
+        
+        submit = executor.submit
+        pending = [(rule, submit(rule.condition, context)) for rule in rules]
         
         results = []
-        for rule in self._sorted_rules:
-            if rule.enabled:
-                fired, result = rule.evaluate(context)
-                if fired:
-                    results.append((rule.id, result))
+        for rule, future in pending:
+            try:
+                if future.result():
+                    results.append((rule.id, rule.action(context)))
+            except Exception as e:
+                print(f"Rule {rule.id} evaluation error: {e}")
         
         return results
     
+    def evaluate_delta(
+        self,
+        old_context: Dict[str, Any],
+        new_context: Dict[str, Any]
+    ) -> List[Tuple[str, Any]]:
+        """
+        Evaluate only the rules affected by a change of context.
+        
+        Rules whose referenced keys all have the same values in both
+        contexts are skipped, as their outcome cannot have changed. Rules
+        that do not declare referenced keys are always evaluated.
+        
+        Args:
+            old_context: Context of the previous evaluation
+            new_context: Current context
+            
+        Returns:
+            List of (rule_id, result) for affected rules that fired under
+            new_context, in priority order
+        """
+        self._ensure_plan()
+        
+        by_key = self._by_key
+        old_get = old_context.get
+        new_get = new_context.get
+        positions = set(self._always_positions)
+        for key in by_key.keys() & (old_context.keys() | new_context.keys()):
+            if old_get(key, _MISSING) != new_get(key, _MISSING):
+                positions.update(by_key[key])
+        
+        rules = self._active_sorted
+        return evaluate_rules([rules[i] for i in sorted(positions)], new_context)
+    
     def evaluate_category(
         self, 
         category: RuleCategory, 
@@ -208,15 +854,8 @@ class RuleEngine:
         Returns:
             List of (rule_id, result) for rules that fired
         """
-        results = []
-        for rule_id in self._rules_by_category[category]:
-            rule = self._rules[rule_id]
-            if rule.enabled:
-                fired, result = rule.evaluate(context)
-                if fired:
-                    results.append((rule_id, result))
-        
-        return results
+        self._ensure_plan()
+        return evaluate_rules(self._active_by_category.get(category, ()), context)
     
     def evaluate_until_match(self, context: Dict[str, Any]) -> Optional[Tuple[str, Any]]:
         """
@@ -228,14 +867,24 @@ class RuleEngine:
         Returns:
             Tuple of (rule_id, result) for first matching rule, or None
         """
-        self._ensure_sorted()
+        self._ensure_plan()
         
-        for rule in self._sorted_rules:
-            if rule.enabled:
-                fired, result = rule.evaluate(context)
-                if fired:
-                    return (rule.id, result)
+        fused = self._fused_vec
+        count = len(fused)
+        i = 0
+        # One try around the scan; after an error, resume with the next rule
+        while i < count:
+            try:
+                while i < count:
+                    i += 1
+                    result = fused[i - 1](context)
+                    if result is not NOT_FIRED:
+                        self._match_hits[i - 1] += 1
+                        return (self._id_vec[i - 1], result)
+            except Exception as e:
+                _report_rule_error(self._match_rules[i - 1], e)
         
+        self._match_hits[count] += 1
         return None
     
     def apply_results(
@@ -246,7 +895,10 @@ class RuleEngine:
         """
         Apply rule results to context.
         
-        Results that are dictionaries are merged into context.
+        Results that are dictionaries (or frozen mappings) are merged, in
+        order, into an overlay that is then laid over a copy of context,
+        so the context itself is not modified. Nested mappings such as
+        strategy_boost are merged key by key rather than replaced.
         
         Args:
             context: Original context
@@ -255,28 +907,146 @@ class RuleEngine:
         Returns:
             Modified context
         """
-        modified = context.copy()
+        overlay: Dict[str, Any] = {}
+        
+        for _, result in results:
+            if isinstance(result, RESULT_MAPPINGS):
+                _merge_result(overlay, result)
+        
+        return {**context, **overlay}
+    
+    def strategy_vector(self, results: List[Tuple[str, Any]]) -> array:
+        """
+        Sum the strategy adjustments of rule results into one vector.
+        
+        Every strategy_boost is added and every strategy_penalty subtracted
+        at the strategy's STRATEGY_INDEX position; unknown strategy names
+        are ignored. Unlike apply_results, overlapping adjustments add up.
+        
+        Args:
+            results: Rule evaluation results
+            
+        Returns:
+            array('d') with one total per ResponseStrategy, in enum order
+        """
+        vector = array('d', bytes(8 * len(STRATEGY_INDEX)))
+        index = STRATEGY_INDEX
         
-        for rule_id, result in results:
-            if isinstance(result, dict):
-                modified.update(result)
+        for _, result in results:
+            if not isinstance(result, RESULT_MAPPINGS):
+                continue
+            for key, sign in (("strategy_boost", 1.0), ("strategy_penalty", -1.0)):
+                adjustments = result.get(key)
+                if adjustments:
+                    for name, amount in adjustments.items():
+                        position = index.get(name)
+                        if position is not None:
+                            vector[position] += sign * amount
         
-        return modified
+        return vector
     
     def get_all_rules(self) -> List[Rule]:
         """Get all rules."""
-        return list(self._rules.values())
+        return list(self._rules_vec)
     
     def get_rules_by_category(self, category: RuleCategory) -> List[Rule]:
         """Get rules in a category."""
-        return [self._rules[rid] for rid in self._rules_by_category[category]]
+        rules = self._rules_vec
+        return [rules[i] for i in self._rules_by_category.get(category, ())]
     
     def clear(self) -> None:
         """Remove all rules."""
-        self._rules.clear()
-        self._rules_by_category = {cat: [] for cat in RuleCategory}
-        self._sorted_rules.clear()
-        self._needs_sort = False
+        self._rules_vec.clear()
+        self._id_to_idx.clear()
+        self._rules_by_category.clear()
+        self._active_sorted = ()
+        self._active_by_category = {}
+        self._set_match_order(())
+        self._by_key = {}
+        self._always_positions = ()
+        self._needs_plan = True
+        self._result_cache.clear()
+
+
+# === Constant action results ===
+# Shared by every rule instance, so frozen: read-only views all the way down
+
+
+def _freeze(values: Dict[str, Any]) -> MappingProxyType:
+    """Read-only view of a result dict, freezing nested dicts too."""
+    return MappingProxyType({
+        key: _freeze(value) if isinstance(value, dict) else value
+        for key, value in values.items()
+    })
+
+
+_MAX_STRESS_LIMIT_ACTION = _freeze({
+    "stress_level": 0.95,
+    "trigger_cooldown": True,
+    "force_strategy": "avoidant"
+})
+
+_ANGER_LIMIT_ACTION = _freeze({
+    "anger": 0.9,
+    "block_aggressive_response": True,
+    "suggest_pause": True
+})
+
+_HIGH_STRESS_PATIENCE_REDUCTION_ACTION = _freeze({
+    "patience_modifier": -0.2,
+    "irritability_boost": 0.1
+})
+
+_POSITIVE_FEEDBACK_BOOST_ACTION = _freeze({
+    "joy_boost": 0.1,
+    "trust_boost": 0.05,
+    "reduce_stress": 0.05
+})
+
+_ACCUSATION_RESPONSE_ACTION = _freeze({
+    "hurt_feeling": 0.15,
+    "defensive_mode": True,
+    "trust_reduction": 0.05
+})
+
+_CONFLICT_ESCALATION_PREVENTION_ACTION = _freeze({
+    "prefer_deescalation": True,
+    "strategy_boost": {"compromising": 0.3, "empathetic": 0.2},
+    "strategy_penalty": {"challenging": 0.3, "assertive": 0.2}
+})
+
+_WARMTH_RESPONSE_STYLE_ACTION = _freeze({
+    "strategy_boost": {"supportive": 0.2, "empathetic": 0.2},
+    "prefer_emotional_connection": True
+})
+
+_STRICT_RESPONSE_STYLE_ACTION = _freeze({
+    "strategy_boost": {"assertive": 0.2, "practical": 0.15},
+    "prefer_direct_communication": True
+})
+
+_LOW_TRUST_CAUTION_ACTION = _freeze({
+    "guarded_response": True,
+    "strategy_boost": {"avoidant": 0.15, "practical": 0.1},
+    "reduce_vulnerability": True
+})
+
+_HIGH_TRUST_OPENNESS_ACTION = _freeze({
+    "open_communication": True,
+    "strategy_boost": {"emotional": 0.1, "supportive": 0.1},
+    "allow_vulnerability": True
+})
+
+_RELATIONSHIP_REPAIR_OPPORTUNITY_ACTION = _freeze({
+    "repair_opportunity": True,
+    "strategy_boost": {"empathetic": 0.3, "compromising": 0.2},
+    "reduce_defensiveness": True
+})
+
+_QUESTION_REQUIRES_ANSWER_ACTION = _freeze({
+    "should_inform": True,
+    "strategy_boost": {"practical": 0.2}
+})
 
 
 def create_default_rules() -> List[Rule]:
@@ -296,12 +1066,9 @@ def create_default_rules() -> List[Rule]:
         description="Prevents stress from exceeding safe levels",
         category=RuleCategory.SAFETY,
         priority=RulePriority.CRITICAL,
-        condition=lambda ctx: ctx.get("stress_level", 0) > 0.95,
-        action=lambda ctx: {
-            "stress_level": 0.95,
-            "trigger_cooldown": True,
-            "force_strategy": "avoidant"
-        }
+        referenced_keys=frozenset({"stress_level"}),
+        clauses=(("stress_level", 0, ">", 0.95),),
+        action=lambda ctx, _r=_MAX_STRESS_LIMIT_ACTION: _r
     ))
     
     rules.append(Rule(
@@ -310,12 +1077,9 @@ def create_default_rules() -> List[Rule]:
         description="Prevents anger from causing harmful responses",
         category=RuleCategory.SAFETY,
         priority=RulePriority.CRITICAL,
-        condition=lambda ctx: ctx.get("anger", 0) > 0.9,
-        action=lambda ctx: {
-            "anger": 0.9,
-            "block_aggressive_response": True,
-            "suggest_pause": True
-        }
+        referenced_keys=frozenset({"anger"}),
+        clauses=(("anger", 0, ">", 0.9),),
+        action=lambda ctx, _r=_ANGER_LIMIT_ACTION: _r
     ))
     
     # === EMOTIONAL RULES (High Priority) ===
@@ -326,11 +1090,9 @@ def create_default_rules() -> List[Rule]:
         description="High stress levels reduce patience",
         category=RuleCategory.EMOTIONAL,
         priority=RulePriority.HIGH,
-        condition=lambda ctx: ctx.get("stress_level", 0) > 0.6,
-        action=lambda ctx: {
-            "patience_modifier": -0.2,
-            "irritability_boost": 0.1
-        }
+        referenced_keys=frozenset({"stress_level"}),
+        clauses=(("stress_level", 0, ">", 0.6),),
+        action=lambda ctx, _r=_HIGH_STRESS_PATIENCE_REDUCTION_ACTION: _r
     ))
     
     rules.append(Rule(
@@ -339,12 +1101,9 @@ def create_default_rules() -> List[Rule]:
         description="Positive partner messages boost mood",
         category=RuleCategory.EMOTIONAL,
         priority=RulePriority.MEDIUM,
-        condition=lambda ctx: ctx.get("partner_sentiment", 0) > 0.5,
-        action=lambda ctx: {
-            "joy_boost": 0.1,
-            "trust_boost": 0.05,
-            "reduce_stress": 0.05
-        }
+        referenced_keys=frozenset({"partner_sentiment"}),
+        clauses=(("partner_sentiment", 0, ">", 0.5),),
+        action=lambda ctx, _r=_POSITIVE_FEEDBACK_BOOST_ACTION: _r
     ))
     
     rules.append(Rule(
@@ -353,12 +1112,9 @@ def create_default_rules() -> List[Rule]:
         description="Accusations trigger defensive emotions",
         category=RuleCategory.EMOTIONAL,
         priority=RulePriority.HIGH,
-        condition=lambda ctx: ctx.get("is_accusation", False),
-        action=lambda ctx: {
-            "hurt_feeling": 0.15,
-            "defensive_mode": True,
-            "trust_reduction": 0.05
-        }
+        referenced_keys=frozenset({"is_accusation"}),
+        clauses=(("is_accusation", False, "truthy", None),),
+        action=lambda ctx, _r=_ACCUSATION_RESPONSE_ACTION: _r
     ))
     
     # === BEHAVIORAL RULES (Medium Priority) ===
@@ -369,15 +1125,12 @@ def create_default_rules() -> List[Rule]:
         description="Prevent conflict from escalating too quickly",
         category=RuleCategory.BEHAVIORAL,
         priority=RulePriority.MEDIUM,
-        condition=lambda ctx: (
-            ctx.get("disagreement_streak", 0) > 2 and
-            ctx.get("conflict_count", 0) > 3
+        referenced_keys=frozenset({"conflict_count", "disagreement_streak"}),
+        clauses=(
+            ("disagreement_streak", 0, ">", 2),
+            ("conflict_count", 0, ">", 3),
         ),
-        action=lambda ctx: {
-            "prefer_deescalation": True,
-            "strategy_boost": {"compromising": 0.3, "empathetic": 0.2},
-            "strategy_penalty": {"challenging": 0.3, "assertive": 0.2}
-        }
+        action=lambda ctx, _r=_CONFLICT_ESCALATION_PREVENTION_ACTION: _r
     ))
     
     rules.append(Rule(
@@ -386,11 +1139,9 @@ def create_default_rules() -> List[Rule]:
         description="High warmth personality prefers supportive responses",
         category=RuleCategory.BEHAVIORAL,
         priority=RulePriority.MEDIUM,
-        condition=lambda ctx: ctx.get("warmth", 0.5) > 0.7,
-        action=lambda ctx: {
-            "strategy_boost": {"supportive": 0.2, "empathetic": 0.2},
-            "prefer_emotional_connection": True
-        }
+        referenced_keys=frozenset({"warmth"}),
+        clauses=(("warmth", 0.5, ">", 0.7),),
+        action=lambda ctx, _r=_WARMTH_RESPONSE_STYLE_ACTION: _r
     ))
     
     rules.append(Rule(
@@ -399,11 +1150,9 @@ def create_default_rules() -> List[Rule]:
         description="High strictness prefers assertive responses",
         category=RuleCategory.BEHAVIORAL,
         priority=RulePriority.MEDIUM,
-        condition=lambda ctx: ctx.get("strictness", 0.5) > 0.7,
-        action=lambda ctx: {
-            "strategy_boost": {"assertive": 0.2, "practical": 0.15},
-            "prefer_direct_communication": True
-        }
+        referenced_keys=frozenset({"strictness"}),
+        clauses=(("strictness", 0.5, ">", 0.7),),
+        action=lambda ctx, _r=_STRICT_RESPONSE_STYLE_ACTION: _r
     ))
     
     # === RELATIONSHIP RULES ===
@@ -414,12 +1163,9 @@ def create_default_rules() -> List[Rule]:
         description="Low trust leads to more cautious interactions",
         category=RuleCategory.RELATIONSHIP,
         priority=RulePriority.MEDIUM,
-        condition=lambda ctx: ctx.get("trust_in_partner", 0.7) < 0.4,
-        action=lambda ctx: {
-            "guarded_response": True,
-            "strategy_boost": {"avoidant": 0.15, "practical": 0.1},
-            "reduce_vulnerability": True
-        }
+        referenced_keys=frozenset({"trust_in_partner"}),
+        clauses=(("trust_in_partner", 0.7, "<", 0.4),),
+        action=lambda ctx, _r=_LOW_TRUST_CAUTION_ACTION: _r
     ))
     
     rules.append(Rule(
@@ -428,12 +1174,9 @@ def create_default_rules() -> List[Rule]:
         description="High trust enables more open communication",
         category=RuleCategory.RELATIONSHIP,
         priority=RulePriority.MEDIUM,
-        condition=lambda ctx: ctx.get("trust_in_partner", 0.7) > 0.8,
-        action=lambda ctx: {
-            "open_communication": True,
-            "strategy_boost": {"emotional": 0.1, "supportive": 0.1},
-            "allow_vulnerability": True
-        }
+        referenced_keys=frozenset({"trust_in_partner"}),
+        clauses=(("trust_in_partner", 0.7, ">", 0.8),),
+        action=lambda ctx, _r=_HIGH_TRUST_OPENNESS_ACTION: _r
     ))
     
     rules.append(Rule(
@@ -442,15 +1185,12 @@ def create_default_rules() -> List[Rule]:
         description="After conflict, look for repair opportunities",
         category=RuleCategory.RELATIONSHIP,
         priority=RulePriority.LOW,
-        condition=lambda ctx: (
-            ctx.get("recent_conflict", False) and
-            ctx.get("partner_sentiment", 0) > 0.3
+        referenced_keys=frozenset({"partner_sentiment", "recent_conflict"}),
+        clauses=(
+            ("recent_conflict", False, "truthy", None),
+            ("partner_sentiment", 0, ">", 0.3),
         ),
-        action=lambda ctx: {
-            "repair_opportunity": True,
-            "strategy_boost": {"empathetic": 0.3, "compromising": 0.2},
-            "reduce_defensiveness": True
-        }
+        action=lambda ctx, _r=_RELATIONSHIP_REPAIR_OPPORTUNITY_ACTION: _r
     ))
     
     # === RESPONSE RULES ===
@@ -461,7 +1201,8 @@ def create_default_rules() -> List[Rule]:
         description="Response intensity should roughly match input",
         category=RuleCategory.RESPONSE,
         priority=RulePriority.MEDIUM,
-        condition=lambda ctx: True,  # Always applies
+        referenced_keys=frozenset({"message_intensity"}),
+        clauses=(),  # Always applies
         action=lambda ctx: {
             "target_intensity": ctx.get("message_intensity", 0.5) * 0.8 + 0.2
         }
@@ -473,11 +1214,9 @@ def create_default_rules() -> List[Rule]:
         description="Questions should receive informative responses",
         category=RuleCategory.RESPONSE,
         priority=RulePriority.MEDIUM,
-        condition=lambda ctx: ctx.get("is_question", False),
-        action=lambda ctx: {
-            "should_inform": True,
-            "strategy_boost": {"practical": 0.2}
-        }
+        referenced_keys=frozenset({"is_question"}),
+        clauses=(("is_question", False, "truthy", None),),
+        action=lambda ctx, _r=_QUESTION_REQUIRES_ANSWER_ACTION: _r
     ))
     
     return rules
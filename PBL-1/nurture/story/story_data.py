@@ -7,7 +7,9 @@ choices, and hidden impacts that shape the child's development.
 
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import cached_property
 from typing import List, Dict, Optional
+import sys
 
 
 class ActPhase(Enum):
@@ -25,6 +27,12 @@ class PlayerChoice:
     text: str
     hidden_impact: List[str] = field(default_factory=list)
     impact_description: str = ""
+    
+    def __post_init__(self):
+        # Impact tags and ids repeat across choices and are counted and
+        # looked up per turn; interning makes equal strings one object.
+        self.choice_id = sys.intern(self.choice_id)
+        self.hidden_impact = [sys.intern(impact) for impact in self.hidden_impact]
 
 
 @dataclass
@@ -37,6 +45,16 @@ class DayScenario:
     scenario_text: str  # What's happening
     choices: List[PlayerChoice] = field(default_factory=list)
     hidden_impact_intro: str = ""  # What this day teaches the AI
+    
+    @cached_property
+    def choice_index(self) -> Dict[str, PlayerChoice]:
+        """Choices by choice_id, built on first use (choices are fixed)."""
+        return {choice.choice_id: choice for choice in self.choices}
+    
+    @cached_property
+    def choices_presentation(self) -> List[Dict[str, str]]:
+        """Choice ids and texts for display, built on first use and shared."""
+        return [{"id": choice.choice_id, "text": choice.text} for choice in self.choices]
 
 
 @dataclass
@@ -5,16 +5,57 @@ Manages story progression, presents scenarios and choices,
 and processes player decisions through the narrative.
 """
 
+from collections import Counter
 from dataclasses import dataclass, field
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 import json
+import os
+import sys
 from datetime import datetime
 from pathlib import Path
 
 from nurture.story.story_data import ACT_1, ActData, DayScenario
 
+# choices_made keys by day number, built once (no act has more days)
+_DAY_KEYS = tuple(sys.intern(f"day_{day}") for day in range(128))
 
-@dataclass
+# orjson (optional) encodes and decodes save files much faster than json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _to_json(obj: Any) -> Dict[str, Any]:
+    """Fallback encoder for objects with a to_dict method, such as StoryProgress."""
+    to_dict = getattr(obj, "to_dict", None)
+    if to_dict is None:
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+    return to_dict()
+
+
+def _dumps(data: Dict[str, Any], pretty: bool = False) -> bytes:
+    """
+    Serialize save data to JSON bytes, compact unless pretty.
+    
+    orjson encodes dataclasses such as StoryProgress natively, without an
+    intermediate dict; the json fallback goes through their to_dict.
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else None)
+    if pretty:
+        return json.dumps(data, indent=2, default=_to_json).encode("utf-8")
+    return json.dumps(data, separators=(",", ":"), default=_to_json).encode("utf-8")
+
+
+def _loads(raw: bytes) -> Dict[str, Any]:
+    """Parse save data from JSON bytes."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+@dataclass(slots=True)
 class StoryProgress:
     """Tracks player's position in the story."""
     current_act: str  # e.g., "ACT 1 — FOUNDATION"
@@ -46,6 +87,10 @@ class StoryEngine:
             current_day=1,
             total_acts_completed=0,
         )
+        # Running counts of progress.impacts_accumulated
+        self._impact_counter: Counter = Counter()
+        # Scenario presentations by (act index, day); scenarios are static
+        self._presentation_cache: Dict[Tuple[int, int], Dict[str, Any]] = {}
     
     def get_current_scenario(self) -> DayScenario:
         """Get the scenario for the current day."""
@@ -55,27 +100,34 @@ class StoryEngine:
         return current_act.days[day_index]
     
     def get_scenario_presentation(self) -> Dict[str, Any]:
-        """Get formatted scenario data for presentation to player."""
-        scenario = self.get_current_scenario()
+        """
+        Get formatted scenario data for presentation to player.
+        
+        The result is cached per act and day and shared between calls;
+        callers must not modify it.
+        """
+        progress = self.progress
+        key = (self.current_act_index, progress.current_day)
+        cached = self._presentation_cache.get(key)
+        if cached is not None:
+            return cached
+        
         current_act = self.acts[self.current_act_index]
+        scenario = current_act.days[progress.current_day - 1]
         
-        return {
-            "act": self.progress.current_act,
-            "day": self.progress.current_day,
+        presentation = {
+            "act": progress.current_act,
+            "day": progress.current_day,
             "total_days_in_act": current_act.total_days,
             "title": scenario.title,
             "description": scenario.description,
             "gameplay_time": scenario.gameplay_time,
             "scenario_text": scenario.scenario_text,
             "hidden_impact_intro": scenario.hidden_impact_intro,
-            "choices": [
-                {
-                    "id": choice.choice_id,
-                    "text": choice.text,
-                }
-                for choice in scenario.choices
-            ]
+            "choices": scenario.choices_presentation,
         }
+        self._presentation_cache[key] = presentation
+        return presentation
     
     def process_choice(self, choice_id: str) -> Dict[str, Any]:
         """
@@ -87,52 +139,50 @@ class StoryEngine:
         Returns:
             Dictionary with impacts, AI response, and progression info
         """
-        scenario = self.get_current_scenario()
+        progress = self.progress
+        current_act = self.acts[self.current_act_index]
+        day = progress.current_day
+        scenario = current_act.days[day - 1]
         
         # Find the chosen option
-        chosen_choice = None
-        for choice in scenario.choices:
-            if choice.choice_id == choice_id:
-                chosen_choice = choice
-                break
+        chosen_choice = scenario.choice_index.get(choice_id)
         
-        if not chosen_choice:
+        if chosen_choice is None:
             return {
                 "success": False,
                 "error": f"Choice {choice_id} not found"
             }
         
         # Record the choice
-        day_key = f"day_{self.progress.current_day}"
-        self.progress.choices_made[day_key] = choice_id
+        day_key = _DAY_KEYS[day] if day < len(_DAY_KEYS) else f"day_{day}"
+        progress.choices_made[day_key] = choice_id
         
         # Accumulate impacts
-        self.progress.impacts_accumulated.extend(chosen_choice.hidden_impact)
+        progress.impacts_accumulated.extend(chosen_choice.hidden_impact)
+        self._impact_counter.update(chosen_choice.hidden_impact)
         
         result = {
             "success": True,
             "choice_text": chosen_choice.text,
             "impact_description": chosen_choice.impact_description,
             "hidden_impacts": chosen_choice.hidden_impact,
-            "day_completed": self.progress.current_day,
+            "day_completed": day,
         }
         
         # Check if day should progress
         # (In full implementation, this might require solving a scenario or waiting)
-        self.progress.current_day += 1
-        current_act = self.acts[self.current_act_index]
+        day += 1
         
         # Check if act is complete
-        if self.progress.current_day > current_act.total_days:
+        if day > current_act.total_days:
             result["act_complete"] = True
             result["act_summary"] = self._generate_act_summary()
             # Don't auto-progress act; game will handle transition
-            self.progress.current_day = current_act.total_days  # Reset to last day
+            progress.current_day = current_act.total_days  # Reset to last day
         else:
+            progress.current_day = day
             result["act_complete"] = False
-            result["next_day_preview"] = self.acts[self.current_act_index].days[
-                self.progress.current_day - 1
-            ].title
+            result["next_day_preview"] = current_act.days[day - 1].title
         
         return result
     
@@ -149,35 +199,28 @@ class StoryEngine:
             next_act = self.acts[self.current_act_index]
             self.progress.current_act = next_act.phase.value
             self.progress.current_day = 1
+            self._presentation_cache.clear()
             return True
         return False
     
     def _generate_act_summary(self) -> Dict[str, Any]:
         """Generate summary of completed act."""
         completed_act = self.acts[self.current_act_index]
+        progress = self.progress
         
-        # Count choices by impact category
-        impact_count = {}
-        for impact in self.progress.impacts_accumulated:
-            impact_count[impact] = impact_count.get(impact, 0) + 1
-        
-        # Find dominant patterns
-        dominant_impacts = sorted(
-            impact_count.items(),
-            key=lambda x: x[1],
-            reverse=True
-        )[:5]
+        # Find dominant patterns (none if no choice carried an impact)
+        if progress.impacts_accumulated:
+            dominant_patterns = [impact for impact, count in self._impact_counter.most_common(5)]
+        else:
+            dominant_patterns = []
         
         return {
             "act_name": completed_act.phase.value,
             "days_completed": completed_act.total_days,
-            "total_impacts": len(self.progress.impacts_accumulated),
-            "dominant_patterns": [impact for impact, count in dominant_impacts],
-            "choices_breakdown": {
-                day_key: choice_id
-                for day_key, choice_id in self.progress.choices_made.items()
-                if day_key.startswith("day_")
-            }
+            "total_impacts": len(progress.impacts_accumulated),
+            "dominant_patterns": dominant_patterns,
+            # process_choice only records "day_N" keys, so no filtering needed
+            "choices_breakdown": progress.choices_made.copy(),
         }
     
     def get_learning_tags_for_ai(self) -> Dict[str, float]:
@@ -190,26 +233,36 @@ class StoryEngine:
         if not self.progress.impacts_accumulated:
             return {}
         
-        # Count occurrences
-        impact_count = {}
-        for impact in self.progress.impacts_accumulated:
-            impact_count[impact] = impact_count.get(impact, 0) + 1
-        
         # Convert to confidence scores (0-1)
-        max_count = max(impact_count.values())
+        impact_count = self._impact_counter
+        max_count = impact_count.most_common(1)[0][1]
         return {
             impact: count / max_count
             for impact, count in impact_count.items()
         }
     
-    def save_progress(self, filepath: Path) -> bool:
-        """Save story progress to file."""
+    def save_progress(self, filepath: Path, pretty: bool = False) -> bool:
+        """
+        Save story progress to file.
+        
+        The file is written to a temporary sibling first and then moved
+        into place, so an interrupted save never leaves a partial file.
+        
+        Args:
+            filepath: Save file path
+            pretty: Write indented, human-readable JSON (default: compact)
+            
+        Returns:
+            True if saved successfully
+        """
         try:
             data = {
-                "story_progress": self.progress.to_dict(),
+                "story_progress": self.progress,
                 "timestamp": datetime.now().isoformat(),
             }
-            filepath.write_text(json.dumps(data, indent=2))
+            tmp_path = filepath.with_name(filepath.name + ".tmp")
+            tmp_path.write_bytes(_dumps(data, pretty))
+            os.replace(tmp_path, filepath)
             return True
         except Exception as e:
             print(f"Error saving story progress: {e}")
@@ -218,16 +271,26 @@ class StoryEngine:
     def load_progress(self, filepath: Path) -> bool:
         """Load story progress from file."""
         try:
-            data = json.loads(filepath.read_text())
+            data = _loads(filepath.read_bytes())
             progress_data = data["story_progress"]
             
+            # Always restore a dict; older saves may hold a list of choice ids
+            choices_made = progress_data.get("choices_made", {})
+            if isinstance(choices_made, list):
+                choices_made = {
+                    f"day_{day}": choice_id
+                    for day, choice_id in enumerate(choices_made, start=1)
+                }
+            
             self.progress = StoryProgress(
                 current_act=progress_data["current_act"],
                 current_day=progress_data["current_day"],
                 total_acts_completed=progress_data["total_acts_completed"],
-                choices_made=progress_data["choices_made"],
-                impacts_accumulated=progress_data["impacts_accumulated"],
+                choices_made=dict(choices_made),
+                impacts_accumulated=list(progress_data.get("impacts_accumulated", [])),
             )
+            self._impact_counter = Counter(self.progress.impacts_accumulated)
+            self._presentation_cache.clear()
             return True
         except Exception as e:
             print(f"Error loading story progress: {e}")
@@ -236,14 +299,16 @@ class StoryEngine:
     def get_status(self) -> Dict[str, Any]:
         """Get current story status."""
         current_act = self.acts[self.current_act_index]
+        progress = self.progress
         
         return {
-            "act": self.progress.current_act,
-            "day": self.progress.current_day,
+            "act": progress.current_act,
+            "day": progress.current_day,
             "total_days": current_act.total_days,
-            "progress_percent": (self.progress.current_day / current_act.total_days) * 100,
-            "acts_completed": self.progress.total_acts_completed,
+            "progress_percent": (progress.current_day / current_act.total_days) * 100,
+            "acts_completed": progress.total_acts_completed,
             "total_acts": len(self.acts),
-            "choices_made": len(self.progress.choices_made),
-            "total_impacts": len(self.progress.impacts_accumulated),
+            "choices_made": len(progress.choices_made),
+            "total_impacts": len(progress.impacts_accumulated),
+            "unique_impacts": len(self._impact_counter),
         }
@@ -21,6 +21,8 @@ from nurture.utils.llm_interface import (
     LocalLLM,
     GroqLLM,
     LLMFactory,
+    ResponseCache,
+    TokenBucket,
     create_llm_generator,
 )
 
@@ -36,6 +38,8 @@ __all__ = [
     "LocalLLM",
     "GroqLLM",
     "LLMFactory",
+    "ResponseCache",
+    "TokenBucket",
     "create_llm_generator",
 ]
 
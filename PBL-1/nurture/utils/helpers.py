@@ -5,7 +5,10 @@ Helper Functions for Nurture Simulation
 Utility functions used across the system.
 """
 
-from typing import Dict, List, Any
+from bisect import bisect
+from itertools import accumulate
+from typing import Callable, Dict, List, Any, Sequence
+import random
 
 
 def clamp(value: float, min_val: float = 0.0, max_val: float = 1.0) -> float:
@@ -20,7 +23,31 @@ def clamp(value: float, min_val: float = 0.0, max_val: float = 1.0) -> float:
     Returns:
         Clamped value
     """
-    return max(min_val, min(value, max_val))
+    # Inline form of max(min_val, min(value, max_val)), including NaN handling
+    value = max_val if max_val < value else value
+    return value if value > min_val else min_val
+
+
+def clamp_array(
+    values: Sequence[float],
+    min_val: float = 0.0,
+    max_val: float = 1.0
+) -> List[float]:
+    """
+    Clamp many values between min and max bounds.
+    
+    Same result as calling clamp on each value, without a call per value.
+    
+    Args:
+        values: Values to clamp
+        min_val: Minimum bound
+        max_val: Maximum bound
+        
+    Returns:
+        List of clamped values
+    """
+    upper = [max_val if max_val < v else v for v in values]
+    return [v if v > min_val else min_val for v in upper]
 
 
 def normalize_scores(scores: Dict[str, float]) -> Dict[str, float]:
@@ -49,12 +76,36 @@ def weighted_random_choice(choices: Dict[str, float]) -> str:
     Returns:
         Selected choice
     """
-    import random
+    return random.choices(list(choices), weights=list(choices.values()), k=1)[0]
+
+
+def make_weighted_chooser(choices: Dict[str, float]) -> Callable[[], str]:
+    """
+    Prepare repeated weighted random choices from a fixed dictionary.
+    
+    Cumulative weights are computed once, so each pick is a binary search.
+    Picks match weighted_random_choice for the same random state.
+    
+    Args:
+        choices: Dictionary of choice -> weight
+        
+    Returns:
+        Function() -> selected choice
+        
+    Raises:
+        ValueError: If the weights do not sum to a positive total
+    """
+    keys = list(choices)
+    cum_weights = list(accumulate(choices.values()))
+    total = cum_weights[-1] if cum_weights else 0.0
+    if not total > 0.0:
+        raise ValueError("Total of weights must be greater than zero")
+    hi = len(keys) - 1
     
-    items = list(choices.items())
-    weights = [weight for _, weight in items]
-    selected = random.choices(items, weights=weights, k=1)[0]
-    return selected[0]
+    def pick() -> str:
+        return keys[bisect(cum_weights, random.random() * total, 0, hi)]
+    
+    return pick
 
 
 def lerp(a: float, b: float, t: float) -> float:
@@ -70,3 +121,18 @@ def lerp(a: float, b: float, t: float) -> float:
         Interpolated value
     """
     return a + t * (b - a)
+
+
+def lerp_array(a: Sequence[float], b: Sequence[float], t: float) -> List[float]:
+    """
+    Linear interpolation between two sequences of values, element-wise.
+    
+    Args:
+        a: Start values
+        b: End values (same length as a)
+        t: Interpolation factor (0.0 to 1.0)
+        
+    Returns:
+        List of interpolated values
+    """
+    return [x + t * (y - x) for x, y in zip(a, b)]
@@ -12,13 +12,203 @@ Groq API: https://console.groq.com (free tier available)
 """
 
 from abc import ABC, abstractmethod
+from collections import OrderedDict, deque
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any, Callable
+from functools import lru_cache, partial
+from operator import itemgetter
+from typing import Dict, Iterator, List, Optional, Any, Callable
+import asyncio
+import heapq
+import http.client
 import os
 import json
 import time
 import random
 import re
+import threading
+from urllib.parse import urlsplit
+
+
+# Default number of LLM responses remembered per backend
+RESPONSE_CACHE_SIZE = 256
+
+# Most recent conversation turns (player and AI) kept per backend
+CONVERSATION_HISTORY_SIZE = 32
+
+# Prompts marshaled into one request by OpenAILLM.generate_batch
+BATCH_ROWS = 4
+
+# Concurrent requests allowed by OpenAILLM.generate_many
+OPENAI_MAX_CONCURRENCY = 10
+
+# Attempts per OpenAI request when rate limited or the server errors
+RATE_LIMIT_ATTEMPTS = 3
+
+# HTTP statuses worth retrying with backoff
+_RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+# Backoff before retry n (1-based) is min(2 ** (n - 1), this) seconds
+_MAX_BACKOFF_SECONDS = 30.0
+
+# Errors showing a reused keep-alive connection was closed by the server
+_STALE_CONNECTION_ERRORS = (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError)
+
+# Row delimiter used in batched prompts and expected in batched replies
+_ROW_MARKER_RE = re.compile(r"^---ROW (\d+)---[ \t]*$", re.MULTILINE)
+
+# Punctuation and repeated whitespace ignored when matching messages
+# ("?" is kept: a question and a statement need different answers)
+_PUNCTUATION_RE = re.compile(r"[^\w\s'?]+")
+
+
+# MockLLM message topics in priority order. A message takes the first topic
+# with a phrase occurring anywhere in it (plain substring match).
+_MESSAGE_TOPICS = (
+    ("hostile", ("fuck", "f***", "idiot", "stupid", "shut up", "i dont care", "i don't care", "hate you", "bitch", "asshole", "screw you")),
+    ("greeting", ("hi", "hello", "hey", "how are you", "how're you")),
+    ("apology", ("sorry", "apologize", "my fault", "forgive", "my bad")),
+    ("affection", ("love you", "love u", "care about", "miss you", "need you")),
+    ("frustration", ("angry", "frustrated", "tired", "exhausted", "stress")),
+    ("worry", ("worried", "scared", "anxious", "afraid", "nervous")),
+    ("happiness", ("happy", "glad", "grateful", "thankful", "great")),
+    ("help", ("help", "support", "need", "please")),
+    ("disagreement", ("disagree", "wrong", "don't think", "but")),
+    ("question", ("?", "what do you think", "how do you feel", "do you")),
+    ("reflection", ("think", "feel", "believe", "seems")),
+)
+
+# (phrase, topic) pairs flattened in priority order for a single scan
+_TOPIC_PHRASES = tuple((phrase, topic) for topic, phrases in _MESSAGE_TOPICS for phrase in phrases)
+
+# Whole-message acknowledgments, checked when no topic matches
+_ACKNOWLEDGMENTS = frozenset(("okay", "ok", "yeah", "yes", "sure", "alright", "fine", "i know", "i understand"))
+
+# MockLLM replies by topic
+_TOPIC_RESPONSES = {
+    "hostile": (
+        "That hurt. I will talk, but not if you speak to me like that.",
+        "I know you're upset, but don't take it out on me. Talk to me with respect.",
+        "If this is how we're talking, I need a minute. Come back when we can speak calmly.",
+        "I'm exhausted too, but I won't accept being spoken to like that.",
+    ),
+    "greeting": (
+        "Hey... I'm okay. Just tired, you know?",
+        "Hi. It's been a long day, hasn't it?",
+        "Hey there. I'm glad you want to talk.",
+        "I'm hanging in there. How about you?",
+    ),
+    "apology": (
+        "I appreciate you saying that. It means a lot that you recognize it.",
+        "Thank you. I know it's not easy to say sorry.",
+        "I forgive you. Let's move forward together.",
+        "That means a lot to me. We're okay.",
+    ),
+    "affection": (
+        "I love you too. Even when things are hard, I'm glad we're in this together.",
+        "I love you. We'll figure this out, one day at a time.",
+        "That means everything to me right now.",
+        "I needed to hear that. I love you too.",
+    ),
+    "frustration": (
+        "I hear you. This isn't easy for either of us. What can we do about it?",
+        "I feel the same way sometimes. We need to support each other.",
+        "I know. Let's try to get through this together.",
+        "It's okay to feel that way. I'm here for you.",
+    ),
+    "worry": (
+        "I understand. I'm scared sometimes too. But we have each other.",
+        "What specifically are you worried about? Let's talk through it.",
+        "I get it. Parenting is scary. But we're doing okay.",
+        "We'll figure it out. We always do.",
+    ),
+    "happiness": (
+        "That makes me happy to hear. Moments like this make everything worth it.",
+        "I'm glad too. We should hold onto these feelings.",
+        "It is pretty amazing, isn't it? Our little family.",
+        "Thank you for seeing the good in things. I needed that.",
+    ),
+    "help": (
+        "Tell me what you need. I want to be there for you.",
+        "Of course. What can I do?",
+        "I'm here. Just tell me how I can help.",
+        "You don't have to ask twice. What do you need?",
+    ),
+    "disagreement": (
+        "I see it differently, but I want to understand your perspective.",
+        "Okay, tell me more about why you see it that way.",
+        "I hear you. Let's find some common ground.",
+        "Fair enough. Help me understand where you're coming from.",
+    ),
+    "question": (
+        "That's a good question. Let me think about it...",
+        "Honestly? I'm not sure yet. But I'm glad you asked.",
+        "I've been thinking about that too.",
+        "I have some thoughts, but I want to hear yours first.",
+    ),
+    "reflection": (
+        "I'm listening. Tell me more about what's on your mind.",
+        "I appreciate you sharing that with me.",
+        "That's interesting. I hadn't thought of it that way.",
+        "I value your perspective on this.",
+    ),
+    "acknowledgment": (
+        "Good. I'm glad we talked.",
+        "Okay. Is there anything else on your mind?",
+        "Alright. We'll get through this.",
+        "Thanks for hearing me out.",
+    ),
+    "default": (
+        "I hear what you're saying. This is important to me too.",
+        "Let's talk about this. I want to understand.",
+        "I'm here. Whatever you need to say, I'm listening.",
+        "Thank you for sharing that with me.",
+        "I appreciate you opening up. Keep going.",
+        "Tell me more. I want to know what you're thinking.",
+    ),
+}
+
+
+# LocalLLM prompt blocks that never change, joined once. Each is one entry of
+# the newline-joined prompt, so a trailing "" line becomes a blank line.
+_SARAH_UPSET_INSTRUCTIONS = "\n".join([
+    "IMPORTANT - HOW TO RESPOND:",
+    "- You are NOT a therapist. You are a tired, real person with feelings.",
+    "- He did something that hurt you. BRING IT UP. Don't let it slide.",
+    "- Ask him WHY he did what he did. Hold him accountable.",
+    "- Short, pointed responses. You DON'T pretend everything is fine.",
+    "- You can be hurt, angry, cold, sarcastic, or confrontational.",
+    "",
+])
+_SARAH_CALM_INSTRUCTIONS = "\n".join([
+    "IMPORTANT - HOW TO RESPOND:",
+    "- You are NOT a therapist. You are a tired, real person with feelings.",
+    "- He did the right thing. Acknowledge it genuinely — tired but grateful.",
+    "- You can still be exhausted and stressed but you are NOT angry at him.",
+    "- Short, warm but real responses. NOT over-the-top. Just honest.",
+    "- Do NOT invent problems or grievances that did not happen.",
+    "",
+])
+_SARAH_OUTPUT_RULES = "\n".join([
+    "",
+    "NON-NEGOTIABLE OUTPUT RULES:",
+    "- Stay in character as Sarah in every reply.",
+    "- Reply with only Sarah's spoken line (1-2 short sentences).",
+    "- No advice, no analysis, no explanations, no role labels.",
+    "- Do not mention being a therapist, assistant, expert, model, or AI.",
+    "- Never say things like 'in this situation', 'here is how', or 'you could respond'.",
+    "- If he is rude or insulting, react emotionally and set a boundary like a real person.",
+    "- Use natural spoken language with contractions.",
+])
+_SARAH_UPSET_FINAL_INSTRUCTION = "\n".join([
+    "Respond as Sarah (1-2 sentences max). Be real, not nice. No therapy talk.",
+    "If he wronged you, SAY SO. Examples: 'Why did you side with them?' 'You didn't defend me.'",
+    _SARAH_OUTPUT_RULES,
+])
+_SARAH_CALM_FINAL_INSTRUCTION = "\n".join([
+    "Respond as Sarah (1-2 sentences max). Be real, tired, human.",
+    "Don't invent problems. Don't be overly sweet. Just honest and grounded.",
+    _SARAH_OUTPUT_RULES,
+])
 
 
 @dataclass
@@ -47,6 +237,9 @@ class LLMConfig:
     # Rate limiting for free tiers
     requests_per_minute: int = 30  # Groq free tier limit
     retry_on_rate_limit: bool = True
+    
+    # Responses reused for repeated messages (0 disables the cache)
+    response_cache_size: int = RESPONSE_CACHE_SIZE
 
 
 class LLMInterface(ABC):
@@ -76,6 +269,157 @@ class LLMInterface(ABC):
         pass
 
 
+def _split_rows(content: str, row_count: int) -> Dict[int, str]:
+    """Split a batched reply on its "---ROW i---" markers."""
+    rows: Dict[int, str] = {}
+    markers = list(_ROW_MARKER_RE.finditer(content))
+    for marker, following in zip(markers, markers[1:] + [None]):
+        row = int(marker.group(1))
+        end = following.start() if following is not None else len(content)
+        text = content[marker.end():end].strip()
+        if 0 <= row < row_count and text:
+            rows.setdefault(row, text)
+    return rows
+
+
+def _is_retryable(error: Exception) -> bool:
+    """Whether an API error is a rate limit or transient server error."""
+    return getattr(error, "status_code", None) in _RETRY_STATUS_CODES
+
+
+class TokenBucket:
+    """
+    Client-side request rate limiter.
+    
+    Tokens refill continuously at requests_per_minute / 60 per second, up
+    to burst. Each request takes one token; when none is left the caller
+    waits for its turn instead of being rejected by the server. Safe to
+    share between threads.
+    """
+    
+    def __init__(self, requests_per_minute: float, burst: int = 1):
+        """
+        Initialize a full bucket.
+        
+        Args:
+            requests_per_minute: Sustained request rate (0 or less disables limiting)
+            burst: Requests allowed back to back before spacing applies
+        """
+        self.rate = requests_per_minute / 60.0
+        self.capacity = float(max(1, burst))
+        self._tokens = self.capacity
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def reserve(self) -> float:
+        """
+        Take a token, reserving one ahead if the bucket is empty.
+        
+        Returns:
+            Seconds the caller must wait before sending its request
+        """
+        if self.rate <= 0:
+            return 0.0
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+            self._last = now
+            self._tokens -= 1.0
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+    
+    def acquire(self) -> None:
+        """Block until a request may be sent."""
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+
+class ResponseCache:
+    """
+    Bounded cache of LLM responses for repeated player messages.
+    
+    Messages are matched after lowercasing and dropping punctuation other
+    than "?" and extra whitespace, so "Hi!" and "hi" share an entry.
+    Entries are kept per scenario, choice and system prompt: a backend
+    whose prompt carries conversation state passes it in, so a message
+    only hits when the model would have been asked exactly the same thing.
+    The least recently used entry is evicted once the cache is full.
+    """
+    
+    def __init__(self, max_size: int = RESPONSE_CACHE_SIZE):
+        """
+        Initialize an empty cache.
+        
+        Args:
+            max_size: Maximum number of responses kept
+        """
+        self.max_size = max_size
+        self._entries: "OrderedDict[tuple, str]" = OrderedDict()
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    @staticmethod
+    def normalize(message: str) -> str:
+        """Reduce a message to the form used for matching."""
+        return " ".join(_PUNCTUATION_RE.sub(" ", message.lower()).split())
+    
+    def get(
+        self,
+        message: str,
+        scenario_key: Optional[str] = None,
+        choice_key: Optional[str] = None,
+        system_prompt: str = ""
+    ) -> Optional[str]:
+        """
+        Look up the response cached for a message.
+        
+        Args:
+            message: Player message or prompt
+            scenario_key: Current scenario
+            choice_key: Player's choice in the scenario
+            system_prompt: System prompt the message would be sent with
+            
+        Returns:
+            Cached response, or None on a miss
+        """
+        key = (scenario_key, choice_key, system_prompt, self.normalize(message))
+        response = self._entries.get(key)
+        if response is not None:
+            self._entries.move_to_end(key)
+        return response
+    
+    def put(
+        self,
+        message: str,
+        response: str,
+        scenario_key: Optional[str] = None,
+        choice_key: Optional[str] = None,
+        system_prompt: str = ""
+    ) -> None:
+        """
+        Remember the response generated for a message.
+        
+        Args:
+            message: Player message or prompt
+            response: Response to reuse
+            scenario_key: Current scenario
+            choice_key: Player's choice in the scenario
+            system_prompt: System prompt the message was sent with
+        """
+        if self.max_size <= 0 or not response:
+            return
+        key = (scenario_key, choice_key, system_prompt, self.normalize(message))
+        self._entries[key] = response
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+    
+    def clear(self) -> None:
+        """Forget all cached responses."""
+        self._entries.clear()
+
+
 class MockLLM(LLMInterface):
     """
     Context-aware Mock LLM that generates realistic responses based on:
@@ -90,7 +434,7 @@ class MockLLM(LLMInterface):
         self.config = config
         
         # Memory of what happened
-        self.conversation_history = []
+        self.conversation_history = deque(maxlen=CONVERSATION_HISTORY_SIZE)
         self.scenario_context = None
         self.last_player_choice = None
         self.player_patterns = {}  # Accumulated patterns
@@ -168,6 +512,12 @@ class MockLLM(LLMInterface):
             "partnership_unity": "We've been a good team through all of this.",
             "control_tendency": "You always try to take over everything.",
         }
+        
+        # Each scenario's responses as a tuple, for picking one at random
+        self._scenario_response_pools = {
+            scenario: tuple(responses.values())
+            for scenario, responses in self._scenario_responses.items()
+        }
     
     def set_context(self, scenario_key: str, choice_key: str, player_patterns: dict = None):
         """Set the current context for response generation."""
@@ -178,8 +528,6 @@ class MockLLM(LLMInterface):
     
     def generate(self, prompt: str, context: Optional[Dict[str, Any]] = None) -> str:
         """Generate a context-aware response based on scenario and history."""
-        import random
-        
         # Store conversation
         self.conversation_history.append({"role": "player", "content": prompt})
         
@@ -191,23 +539,22 @@ class MockLLM(LLMInterface):
                 self.player_patterns.update(context["player_patterns"])
         
         # Build response based on what the player said AND scenario context
-        response = self._generate_contextual_response(prompt)
+        response = self._generate_contextual_response(prompt, prompt.lower())
         
         # Store AI response
         self.conversation_history.append({"role": "ai", "content": response})
         
         return response
     
-    def _generate_contextual_response(self, player_message: str) -> str:
+    def _generate_contextual_response(self, player_message: str, player_lower: Optional[str] = None) -> str:
         """Generate response based on player message and accumulated context."""
         
-        player_lower = player_message.lower()
-        
-        # Count how many exchanges we've had in this scenario
-        player_messages_count = sum(1 for h in self.conversation_history if h["role"] == "player")
+        # generate() records player and AI turns in pairs, so only the
+        # current player message is in the history on the first exchange
+        is_first_message = len(self.conversation_history) <= 1
         
         # First message in a scenario - give context-aware response about what happened
-        if player_messages_count <= 1 and self.scenario_context and self.scenario_context in self._scenario_responses:
+        if is_first_message and self.scenario_context and self.scenario_context in self._scenario_responses:
             scenario_responses = self._scenario_responses[self.scenario_context]
             
             # Get response based on last choice
@@ -215,7 +562,7 @@ class MockLLM(LLMInterface):
                 base_response = scenario_responses[self.last_player_choice]
             else:
                 # Pick any scenario response
-                base_response = random.choice(list(scenario_responses.values()))
+                base_response = random.choice(self._scenario_response_pools[self.scenario_context])
             
             # Add emotional modifier based on patterns if accumulated
             modifier = self._get_pattern_modifier()
@@ -225,159 +572,33 @@ class MockLLM(LLMInterface):
             return base_response
         
         # Subsequent messages - respond to what player is actually saying
-        return self._analyze_and_respond(player_message)
+        return self._analyze_and_respond(player_message, player_lower)
     
-    def _analyze_and_respond(self, message: str) -> str:
+    def _analyze_and_respond(self, message: str, message_lower: Optional[str] = None) -> str:
         """Analyze player message and generate appropriate response."""
-        message_lower = message.lower()
-
-        # Hostility / verbal aggression
-        if any(word in message_lower for word in [
-            "fuck", "f***", "idiot", "stupid", "shut up", "i dont care",
-            "i don't care", "hate you", "bitch", "asshole", "screw you"
-        ]):
-            responses = [
-                "That hurt. I will talk, but not if you speak to me like that.",
-                "I know you're upset, but don't take it out on me. Talk to me with respect.",
-                "If this is how we're talking, I need a minute. Come back when we can speak calmly.",
-                "I'm exhausted too, but I won't accept being spoken to like that.",
-            ]
-            return random.choice(responses)
-        
-        # Greetings
-        if any(word in message_lower for word in ["hi", "hello", "hey", "how are you", "how're you"]):
-            responses = [
-                "Hey... I'm okay. Just tired, you know?",
-                "Hi. It's been a long day, hasn't it?",
-                "Hey there. I'm glad you want to talk.",
-                "I'm hanging in there. How about you?",
-            ]
-            return random.choice(responses)
-        
-        # Apologies
-        if any(word in message_lower for word in ["sorry", "apologize", "my fault", "forgive", "my bad"]):
-            responses = [
-                "I appreciate you saying that. It means a lot that you recognize it.",
-                "Thank you. I know it's not easy to say sorry.",
-                "I forgive you. Let's move forward together.",
-                "That means a lot to me. We're okay.",
-            ]
-            return random.choice(responses)
-        
-        # Expressions of love/care
-        if any(word in message_lower for word in ["love you", "love u", "care about", "miss you", "need you"]):
-            responses = [
-                "I love you too. Even when things are hard, I'm glad we're in this together.",
-                "I love you. We'll figure this out, one day at a time.",
-                "That means everything to me right now.",
-                "I needed to hear that. I love you too.",
-            ]
-            return random.choice(responses)
-        
-        # Frustration/tiredness
-        if any(word in message_lower for word in ["angry", "frustrated", "tired", "exhausted", "stress"]):
-            responses = [
-                "I hear you. This isn't easy for either of us. What can we do about it?",
-                "I feel the same way sometimes. We need to support each other.",
-                "I know. Let's try to get through this together.",
-                "It's okay to feel that way. I'm here for you.",
-            ]
-            return random.choice(responses)
-        
-        # Worry/fear
-        if any(word in message_lower for word in ["worried", "scared", "anxious", "afraid", "nervous"]):
-            responses = [
-                "I understand. I'm scared sometimes too. But we have each other.",
-                "What specifically are you worried about? Let's talk through it.",
-                "I get it. Parenting is scary. But we're doing okay.",
-                "We'll figure it out. We always do.",
-            ]
-            return random.choice(responses)
-        
-        # Happiness/gratitude
-        if any(word in message_lower for word in ["happy", "glad", "grateful", "thankful", "great"]):
-            responses = [
-                "That makes me happy to hear. Moments like this make everything worth it.",
-                "I'm glad too. We should hold onto these feelings.",
-                "It is pretty amazing, isn't it? Our little family.",
-                "Thank you for seeing the good in things. I needed that.",
-            ]
-            return random.choice(responses)
-        
-        # Asking for help/support
-        if any(word in message_lower for word in ["help", "support", "need", "please"]):
-            responses = [
-                "Tell me what you need. I want to be there for you.",
-                "Of course. What can I do?",
-                "I'm here. Just tell me how I can help.",
-                "You don't have to ask twice. What do you need?",
-            ]
-            return random.choice(responses)
-        
-        # Disagreement
-        if any(word in message_lower for word in ["disagree", "wrong", "don't think", "but"]):
-            responses = [
-                "I see it differently, but I want to understand your perspective.",
-                "Okay, tell me more about why you see it that way.",
-                "I hear you. Let's find some common ground.",
-                "Fair enough. Help me understand where you're coming from.",
-            ]
-            return random.choice(responses)
-        
-        # Questions
-        if "?" in message or any(word in message_lower for word in ["what do you think", "how do you feel", "do you"]):
-            responses = [
-                "That's a good question. Let me think about it...",
-                "Honestly? I'm not sure yet. But I'm glad you asked.",
-                "I've been thinking about that too.",
-                "I have some thoughts, but I want to hear yours first.",
-            ]
-            return random.choice(responses)
-        
-        # Thinking/feeling statements
-        if any(word in message_lower for word in ["think", "feel", "believe", "seems"]):
-            responses = [
-                "I'm listening. Tell me more about what's on your mind.",
-                "I appreciate you sharing that with me.",
-                "That's interesting. I hadn't thought of it that way.",
-                "I value your perspective on this.",
-            ]
-            return random.choice(responses)
-        
-        # Acknowledgments (okay, yeah, sure, etc.)
-        if message_lower.strip() in ["okay", "ok", "yeah", "yes", "sure", "alright", "fine", "i know", "i understand"]:
-            responses = [
-                "Good. I'm glad we talked.",
-                "Okay. Is there anything else on your mind?",
-                "Alright. We'll get through this.",
-                "Thanks for hearing me out.",
-            ]
-            return random.choice(responses)
-        
-        # Default - acknowledge and engage
-        responses = [
-            "I hear what you're saying. This is important to me too.",
-            "Let's talk about this. I want to understand.",
-            "I'm here. Whatever you need to say, I'm listening.",
-            "Thank you for sharing that with me.",
-            "I appreciate you opening up. Keep going.",
-            "Tell me more. I want to know what you're thinking.",
-        ]
-        return random.choice(responses)
+        if message_lower is None:
+            message_lower = message.lower()
+        
+        # Highest-priority topic mentioned anywhere in the message
+        for phrase, topic in _TOPIC_PHRASES:
+            if phrase in message_lower:
+                break
+        else:
+            if message_lower.strip() in _ACKNOWLEDGMENTS:
+                topic = "acknowledgment"
+            else:
+                # Default - acknowledge and engage
+                topic = "default"
+        
+        return random.choice(_TOPIC_RESPONSES[topic])
     
     def _get_pattern_modifier(self) -> str:
         """Get a modifier based on accumulated patterns."""
-        import random
-        
         if not self.player_patterns:
             return ""
         
-        # Find strongest pattern
-        strongest_patterns = sorted(
-            self.player_patterns.items(), 
-            key=lambda x: x[1], 
-            reverse=True
-        )[:2]
+        # Find strongest pattern (nlargest keeps sorted()'s order for ties)
+        strongest_patterns = heapq.nlargest(2, self.player_patterns.items(), key=itemgetter(1))
         
         for pattern, strength in strongest_patterns:
             if pattern in self._emotional_modifiers and strength > 0.5:
@@ -401,7 +622,12 @@ class OpenAILLM(LLMInterface):
         """Initialize OpenAI LLM."""
         self.config = config
         self._client = None
+        self._async_client_factory: Optional[Callable[[], Any]] = None
+        self._async_client = None
+        self._async_client_loop: Optional[asyncio.AbstractEventLoop] = None
         self._available = False
+        self._response_cache = ResponseCache(config.response_cache_size)
+        self._bucket = TokenBucket(config.requests_per_minute)
         
         # Try to initialize
         self._initialize()
@@ -422,6 +648,14 @@ class OpenAILLM(LLMInterface):
                 base_url=self.config.api_base,
                 timeout=self.config.timeout,
             )
+            # Async clients pool connections on the loop they first run
+            # on, so one is created per event loop (see _loop_async_client)
+            self._async_client_factory = partial(
+                openai.AsyncOpenAI,
+                api_key=api_key,
+                base_url=self.config.api_base,
+                timeout=self.config.timeout,
+            )
             self._available = True
             
         except ImportError:
@@ -435,26 +669,308 @@ class OpenAILLM(LLMInterface):
             # Fallback to mock
             return MockLLM(self.config).generate(prompt, context)
         
+        context = context or {}
+        scenario_key = context.get("scenario_key")
+        choice_key = context.get("choice_key")
+        cached = self._response_cache.get(prompt, scenario_key, choice_key)
+        if cached is not None:
+            return cached
+        
         try:
             messages = [
                 {"role": "system", "content": self.config.system_prompt},
                 {"role": "user", "content": prompt}
             ]
             
-            response = self._client.chat.completions.create(
+            response = self._create_completion(
                 model=self.config.model_name,
                 messages=messages,
                 max_tokens=self.config.max_tokens,
                 temperature=self.config.temperature,
             )
             
-            return response.choices[0].message.content.strip()
+            content = response.choices[0].message.content.strip()
+            self._response_cache.put(prompt, content, scenario_key, choice_key)
+            return content
             
         except Exception as e:
             print(f"OpenAI API error: {e}")
             # Fallback to mock
             return MockLLM(self.config).generate(prompt, context)
     
+    def generate_stream(self, prompt: str, context: Optional[Dict[str, Any]] = None) -> Iterator[str]:
+        """
+        Generate a response, yielding text as the model produces it.
+        
+        Lets the UI start showing the reply after the first token instead
+        of waiting for the whole response. Cached and fallback responses
+        are yielded in one piece.
+        
+        Args:
+            prompt: The formatted prompt
+            context: Optional additional context
+            
+        Yields:
+            Successive pieces of the response
+        """
+        if not self._available or not self._client:
+            yield MockLLM(self.config).generate(prompt, context)
+            return
+        
+        context = context or {}
+        scenario_key = context.get("scenario_key")
+        choice_key = context.get("choice_key")
+        cached = self._response_cache.get(prompt, scenario_key, choice_key)
+        if cached is not None:
+            yield cached
+            return
+        
+        parts = []
+        try:
+            stream = self._create_completion(
+                model=self.config.model_name,
+                messages=[
+                    {"role": "system", "content": self.config.system_prompt},
+                    {"role": "user", "content": prompt}
+                ],
+                max_tokens=self.config.max_tokens,
+                temperature=self.config.temperature,
+                stream=True,
+            )
+            for chunk in stream:
+                text = chunk.choices[0].delta.content if chunk.choices else None
+                if text:
+                    parts.append(text)
+                    yield text
+            
+        except Exception as e:
+            print(f"OpenAI API error: {e}")
+            if not parts:
+                # Fallback to mock
+                yield MockLLM(self.config).generate(prompt, context)
+            return
+        
+        self._response_cache.put(prompt, "".join(parts).strip(), scenario_key, choice_key)
+    
+    def _create_completion(self, **request: Any) -> Any:
+        """
+        Send a chat completion within the rate limit, retrying with backoff.
+        
+        Rate-limit and transient server errors are retried up to
+        RATE_LIMIT_ATTEMPTS times when retry_on_rate_limit is set.
+        """
+        attempts = RATE_LIMIT_ATTEMPTS if self.config.retry_on_rate_limit else 1
+        for attempt in range(1, attempts + 1):
+            self._bucket.acquire()
+            try:
+                return self._client.chat.completions.create(**request)
+            except Exception as e:
+                if attempt == attempts or not _is_retryable(e):
+                    raise
+                time.sleep(min(2.0 ** (attempt - 1), _MAX_BACKOFF_SECONDS))
+    
+    def _loop_async_client(self) -> Any:
+        """Return the async client for the running event loop, creating it if needed."""
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_client_loop is not loop:
+            self._async_client = self._async_client_factory()
+            self._async_client_loop = loop
+        return self._async_client
+    
+    async def _close_async_client(self) -> None:
+        """Close the current loop's async client before its loop shuts down."""
+        client = self._async_client
+        self._async_client = None
+        self._async_client_loop = None
+        if client is not None:
+            await client.close()
+    
+    async def _acreate_completion(self, **request: Any) -> Any:
+        """Async counterpart of _create_completion."""
+        attempts = RATE_LIMIT_ATTEMPTS if self.config.retry_on_rate_limit else 1
+        for attempt in range(1, attempts + 1):
+            await asyncio.sleep(self._bucket.reserve())
+            try:
+                return await self._loop_async_client().chat.completions.create(**request)
+            except Exception as e:
+                if attempt == attempts or not _is_retryable(e):
+                    raise
+                await asyncio.sleep(min(2.0 ** (attempt - 1), _MAX_BACKOFF_SECONDS))
+    
+    async def agenerate(self, prompt: str, context: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Generate a response without blocking the event loop.
+        
+        Uses an async OpenAI client bound to the running event loop;
+        without one, the synchronous generate runs in a worker thread.
+        
+        Args:
+            prompt: The formatted prompt
+            context: Optional additional context
+            
+        Returns:
+            Response text
+        """
+        if not self._available or self._async_client_factory is None:
+            return await asyncio.to_thread(self.generate, prompt, context)
+        
+        context = context or {}
+        scenario_key = context.get("scenario_key")
+        choice_key = context.get("choice_key")
+        cached = self._response_cache.get(prompt, scenario_key, choice_key)
+        if cached is not None:
+            return cached
+        
+        try:
+            response = await self._acreate_completion(
+                model=self.config.model_name,
+                messages=[
+                    {"role": "system", "content": self.config.system_prompt},
+                    {"role": "user", "content": prompt}
+                ],
+                max_tokens=self.config.max_tokens,
+                temperature=self.config.temperature,
+            )
+            
+            content = response.choices[0].message.content.strip()
+            self._response_cache.put(prompt, content, scenario_key, choice_key)
+            return content
+            
+        except Exception as e:
+            print(f"OpenAI API error: {e}")
+            # Fallback to mock
+            return MockLLM(self.config).generate(prompt, context)
+    
+    def generate_many(
+        self,
+        prompts: List[str],
+        contexts: Optional[List[Optional[Dict[str, Any]]]] = None,
+        max_concurrency: int = OPENAI_MAX_CONCURRENCY
+    ) -> List[str]:
+        """
+        Generate responses for many prompts with concurrent requests.
+        
+        Requests are I/O-bound, so running them together cuts wall time
+        roughly by the concurrency level, up to the provider's rate limit.
+        Must be called from synchronous code (outside a running event loop).
+        
+        Args:
+            prompts: Prompts to answer
+            contexts: Optional context per prompt
+            max_concurrency: Maximum requests in flight at once
+            
+        Returns:
+            One response per prompt, in order
+        """
+        if contexts is None:
+            contexts = [None] * len(prompts)
+        
+        async def run() -> List[str]:
+            gate = asyncio.Semaphore(max(1, max_concurrency))
+            
+            async def one(prompt: str, context: Optional[Dict[str, Any]]) -> str:
+                async with gate:
+                    return await self.agenerate(prompt, context)
+            
+            try:
+                return await asyncio.gather(*(one(p, c) for p, c in zip(prompts, contexts)))
+            finally:
+                # asyncio.run closes this loop on return, and pooled
+                # connections must not outlive it
+                await self._close_async_client()
+        
+        return list(asyncio.run(run()))
+    
+    def generate_batch(
+        self,
+        prompts: List[str],
+        contexts: Optional[List[Optional[Dict[str, Any]]]] = None,
+        rows_per_request: int = BATCH_ROWS
+    ) -> List[str]:
+        """
+        Generate responses for many prompts with fewer API requests.
+        
+        Up to rows_per_request prompts are sent in one request, each under a
+        "---ROW i---" marker, and the reply is split on the same markers.
+        This suits offline bulk runs (replaying logs, regression sweeps)
+        that would otherwise be bound by the requests-per-minute limit.
+        Rows missing from a reply are generated one at a time.
+        
+        Args:
+            prompts: Prompts to answer
+            contexts: Optional context per prompt
+            rows_per_request: Maximum prompts marshaled into one request
+            
+        Returns:
+            One response per prompt, in order
+        """
+        if contexts is None:
+            contexts = [None] * len(prompts)
+        if not self._available or not self._client:
+            return [self.generate(prompt, context) for prompt, context in zip(prompts, contexts)]
+        
+        responses: List[Optional[str]] = [None] * len(prompts)
+        pending = []
+        for i, (prompt, context) in enumerate(zip(prompts, contexts)):
+            context = context or {}
+            cached = self._response_cache.get(prompt, context.get("scenario_key"), context.get("choice_key"))
+            if cached is not None:
+                responses[i] = cached
+            else:
+                pending.append(i)
+        
+        for start in range(0, len(pending), max(1, rows_per_request)):
+            rows = pending[start:start + max(1, rows_per_request)]
+            replies = self._request_rows([prompts[i] for i in rows]) if len(rows) > 1 else {}
+            
+            for row, i in enumerate(rows):
+                reply = replies.get(row)
+                if not reply:
+                    responses[i] = self.generate(prompts[i], contexts[i])
+                    continue
+                context = contexts[i] or {}
+                self._response_cache.put(prompts[i], reply, context.get("scenario_key"), context.get("choice_key"))
+                responses[i] = reply
+        
+        return responses
+    
+    def _request_rows(self, prompts: List[str]) -> Dict[int, str]:
+        """
+        Send several prompts in one request and split the reply by row.
+        
+        Args:
+            prompts: Prompts for this request
+            
+        Returns:
+            Reply text by row index (empty if the request failed)
+        """
+        user_message = "".join(
+            f"---ROW {row}---\n{prompt}\n\n" for row, prompt in enumerate(prompts)
+        )
+        system_prompt = (
+            f"{self.config.system_prompt}\n\n"
+            f"You will receive {len(prompts)} separate messages, each after a line "
+            "'---ROW i---'. Answer each one independently. Start each answer with "
+            "the same '---ROW i---' line and write nothing else outside the answers."
+        )
+        
+        try:
+            response = self._create_completion(
+                model=self.config.model_name,
+                messages=[
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": user_message}
+                ],
+                max_tokens=self.config.max_tokens * len(prompts),
+                temperature=self.config.temperature,
+            )
+            content = response.choices[0].message.content
+        except Exception as e:
+            print(f"OpenAI API error: {e}")
+            return {}
+        
+        return _split_rows(content or "", len(prompts))
+    
     def is_available(self) -> bool:
         """Check if OpenAI API is available."""
         return self._available
@@ -554,7 +1070,7 @@ class LocalLLM(LLMInterface):
         self._available = False
         
         # Context memory
-        self.conversation_history = []
+        self.conversation_history = deque(maxlen=CONVERSATION_HISTORY_SIZE)
         self.current_scenario = None
         self.current_choice = None
         self.player_patterns = {}
@@ -563,23 +1079,78 @@ class LocalLLM(LLMInterface):
         self._fallback_llm = MockLLM(config)
         self._last_availability_check = 0.0
         self._availability_retry_seconds = 10.0
+        self._response_cache = ResponseCache(config.response_cache_size)
+        
+        # One kept-alive connection to Ollama, opened on first request
+        self._connection: Optional[http.client.HTTPConnection] = None
         
         self._check_availability()
     
+    def _ollama_response(self, method: str, path: str, payload: Optional[dict] = None,
+                         timeout: Optional[float] = None) -> http.client.HTTPResponse:
+        """
+        Send a request to Ollama over the kept-alive connection.
+        
+        If a reused connection turns out to have been dropped by the server
+        while idle, the request is sent once more on a fresh connection.
+        Timeouts and other errors are never retried. The caller must read
+        the whole response before the next request, or close the connection.
+        
+        Args:
+            method: HTTP method
+            path: API path, e.g. "/api/chat"
+            payload: JSON body, if any
+            timeout: Socket timeout in seconds
+            
+        Returns:
+            The unread HTTP response
+        """
+        body = None if payload is None else json.dumps(payload).encode('utf-8')
+        headers = {'Content-Type': 'application/json'} if body is not None else {}
+        url = urlsplit(self._base_url)
+        
+        while True:
+            if self._connection is None:
+                connection_class = (
+                    http.client.HTTPSConnection if url.scheme == "https" else http.client.HTTPConnection
+                )
+                self._connection = connection_class(url.hostname, url.port, timeout=timeout)
+            connection = self._connection
+            connection.timeout = timeout
+            reused = connection.sock is not None
+            if reused:
+                connection.sock.settimeout(timeout)
+            try:
+                connection.request(method, url.path.rstrip('/') + path, body=body, headers=headers)
+                return connection.getresponse()
+            except Exception as e:
+                connection.close()
+                self._connection = None
+                # Only a stale keep-alive connection is worth one more try
+                if not (reused and isinstance(e, _STALE_CONNECTION_ERRORS)):
+                    raise
+    
+    def _ollama_request(self, method: str, path: str, payload: Optional[dict] = None,
+                        timeout: Optional[float] = None) -> tuple:
+        """
+        Send a request to Ollama and read the whole response.
+        
+        Returns:
+            (HTTP status, response body bytes)
+        """
+        response = self._ollama_response(method, path, payload, timeout)
+        return response.status, response.read()
+    
     def _check_availability(self) -> None:
         """Check if Ollama is running and the configured model is installed."""
         self._last_availability_check = time.time()
         try:
-            import urllib.request, json
-            with urllib.request.urlopen(
-                urllib.request.Request(f"{self._base_url}/api/tags", method='GET'),
-                timeout=5
-            ) as r:
-                if r.status != 200:
-                    print("[Ollama] Server not reachable. Using mock responses.")
-                    self._available = False
-                    return
-                installed = [m['name'] for m in json.loads(r.read().decode()).get('models', [])]
+            status, body = self._ollama_request('GET', '/api/tags', timeout=5)
+            if status != 200:
+                print("[Ollama] Server not reachable. Using mock responses.")
+                self._available = False
+                return
+            installed = [m['name'] for m in json.loads(body.decode()).get('models', [])]
 
             if self.config.model_name in installed:
                 self._available = True
@@ -620,42 +1191,12 @@ class LocalLLM(LLMInterface):
         ]
         
         # Add scenario context and what happened
-        if self.current_scenario and self.current_scenario in self.SCENARIO_DESCRIPTIONS:
-            scenario_desc = self.SCENARIO_DESCRIPTIONS[self.current_scenario]
-            system_parts.append(f"WHAT JUST HAPPENED: {scenario_desc}")
-            
-            if self.current_choice and self.current_scenario in self.CHOICE_DESCRIPTIONS:
-                choices = self.CHOICE_DESCRIPTIONS[self.current_scenario]
-                if self.current_choice in choices:
-                    choice_desc = choices[self.current_choice]
-                    system_parts.append(f"YOUR HUSBAND {choice_desc.upper()}.")
-                    
-                    # Add specific grievance based on choice
-                    if grievance:
-                        system_parts.append(f"YOU ARE UPSET BECAUSE: {grievance}")
-            system_parts.append("")
+        scenario_section = self._scenario_section(self.current_scenario, self.current_choice, grievance)
+        if scenario_section:
+            system_parts.append(scenario_section)
         
         # Instructions — tone depends on whether choice was good or bad
-        if grievance:
-            system_parts.extend([
-                "IMPORTANT - HOW TO RESPOND:",
-                "- You are NOT a therapist. You are a tired, real person with feelings.",
-                "- He did something that hurt you. BRING IT UP. Don't let it slide.",
-                "- Ask him WHY he did what he did. Hold him accountable.",
-                "- Short, pointed responses. You DON'T pretend everything is fine.",
-                "- You can be hurt, angry, cold, sarcastic, or confrontational.",
-                "",
-            ])
-        else:
-            system_parts.extend([
-                "IMPORTANT - HOW TO RESPOND:",
-                "- You are NOT a therapist. You are a tired, real person with feelings.",
-                "- He did the right thing. Acknowledge it genuinely — tired but grateful.",
-                "- You can still be exhausted and stressed but you are NOT angry at him.",
-                "- Short, warm but real responses. NOT over-the-top. Just honest.",
-                "- Do NOT invent problems or grievances that did not happen.",
-                "",
-            ])
+        system_parts.append(_SARAH_UPSET_INSTRUCTIONS if grievance else _SARAH_CALM_INSTRUCTIONS)
         
         # Special instruction for first message
 
@@ -696,37 +1237,40 @@ class LocalLLM(LLMInterface):
         # Add conversation history
         if self.conversation_history:
             system_parts.append("CONVERSATION SO FAR:")
-            for msg in self.conversation_history[-4:]:
+            for msg in list(self.conversation_history)[-4:]:
                 role = "Him" if msg["role"] == "player" else "You"
                 system_parts.append(f"  {role}: {msg['content']}")
             system_parts.append("")
         
-        # Final instruction — tone depends on choice
-        if grievance:
-            system_parts.extend([
-                "Respond as Sarah (1-2 sentences max). Be real, not nice. No therapy talk.",
-                "If he wronged you, SAY SO. Examples: 'Why did you side with them?' 'You didn't defend me.'",
-            ])
-        else:
-            system_parts.extend([
-                "Respond as Sarah (1-2 sentences max). Be real, tired, human.",
-                "Don't invent problems. Don't be overly sweet. Just honest and grounded.",
-            ])
-
-        system_parts.extend([
-            "",
-            "NON-NEGOTIABLE OUTPUT RULES:",
-            "- Stay in character as Sarah in every reply.",
-            "- Reply with only Sarah's spoken line (1-2 short sentences).",
-            "- No advice, no analysis, no explanations, no role labels.",
-            "- Do not mention being a therapist, assistant, expert, model, or AI.",
-            "- Never say things like 'in this situation', 'here is how', or 'you could respond'.",
-            "- If he is rude or insulting, react emotionally and set a boundary like a real person.",
-            "- Use natural spoken language with contractions.",
-        ])
+        # Final instruction — tone depends on choice, then the fixed output rules
+        system_parts.append(_SARAH_UPSET_FINAL_INSTRUCTION if grievance else _SARAH_CALM_FINAL_INSTRUCTION)
         
         return "\n".join(system_parts)
     
+    @classmethod
+    @lru_cache(maxsize=256)
+    def _scenario_section(cls, scenario: Optional[str], choice: Optional[str],
+                          grievance: Optional[str]) -> str:
+        """
+        Prompt lines describing what just happened, cached per situation.
+        
+        Returns:
+            The section ending in a blank line, or "" for an unknown scenario
+        """
+        if not scenario or scenario not in cls.SCENARIO_DESCRIPTIONS:
+            return ""
+        
+        lines = [f"WHAT JUST HAPPENED: {cls.SCENARIO_DESCRIPTIONS[scenario]}"]
+        choices = cls.CHOICE_DESCRIPTIONS.get(scenario, {})
+        if choice and choice in choices:
+            lines.append(f"YOUR HUSBAND {choices[choice].upper()}.")
+            
+            # Add specific grievance based on choice
+            if grievance:
+                lines.append(f"YOU ARE UPSET BECAUSE: {grievance}")
+        lines.append("")
+        return "\n".join(lines)
+    
     def _get_grievance_for_choice(self) -> Optional[str]:
         """Get a specific grievance based on the player's choice."""
         grievances = {
@@ -788,8 +1332,6 @@ class LocalLLM(LLMInterface):
 
     def _determine_emotional_state(self) -> str:
         """Determine emotional state based on conversation patterns."""
-        import random
-        
         # If no patterns, use neutral emotional states
         if not self.player_patterns:
             states = [
@@ -975,17 +1517,15 @@ class LocalLLM(LLMInterface):
 
         return response
 
-    def _send_chat_request(self, system_prompt: str, player_message: str) -> str:
-        """Send a single chat completion request to Ollama."""
-        import urllib.request
-
-        payload = {
+    def _chat_payload(self, system_prompt: str, player_message: str, stream: bool = False) -> dict:
+        """Build an Ollama chat request body."""
+        return {
             "model": self.config.model_name,
             "messages": [
                 {"role": "system", "content": system_prompt},
                 {"role": "user",   "content": player_message},
             ],
-            "stream": False,
+            "stream": stream,
             "options": {
                 "temperature": 0.8,
                 "top_p": 0.92,
@@ -993,20 +1533,45 @@ class LocalLLM(LLMInterface):
             }
         }
 
-        data = json.dumps(payload).encode('utf-8')
-        req = urllib.request.Request(
-            f"{self._base_url}/api/chat",
-            data=data,
-            headers={'Content-Type': 'application/json'},
-            method='POST'
-        )
-
-        with urllib.request.urlopen(req, timeout=self.config.timeout) as response:
+    def _send_chat_request(self, system_prompt: str, player_message: str) -> str:
+        """Send a single chat completion request to Ollama."""
+        payload = self._chat_payload(system_prompt, player_message)
+        status, body = self._ollama_request('POST', '/api/chat', payload, timeout=self.config.timeout)
+        if status != 200:
+            raise RuntimeError(f"Ollama chat failed with HTTP {status}")
+
+        result = json.loads(body.decode('utf-8'))
+        return result.get("message", {}).get("content", "").strip()
+
+    def _stream_chat_request(self, system_prompt: str, player_message: str) -> Iterator[str]:
+        """Send a streaming chat request to Ollama and yield text as it arrives."""
+        payload = self._chat_payload(system_prompt, player_message, stream=True)
+        response = self._ollama_response('POST', '/api/chat', payload, timeout=self.config.timeout)
+        finished = False
+        try:
             if response.status != 200:
+                response.read()
+                finished = True
                 raise RuntimeError(f"Ollama chat failed with HTTP {response.status}")
 
-            result = json.loads(response.read().decode('utf-8'))
-            return result.get("message", {}).get("content", "").strip()
+            # Ollama streams one JSON object per line until "done"
+            for line in response:
+                if not line.strip():
+                    continue
+                chunk = json.loads(line)
+                text = chunk.get("message", {}).get("content", "")
+                if text:
+                    yield text
+                if chunk.get("done"):
+                    break
+            response.read()
+            finished = True
+        finally:
+            if not finished:
+                # Unread data would corrupt the next request on this connection
+                if self._connection is not None:
+                    self._connection.close()
+                    self._connection = None
 
     def generate(self, prompt: str, context: Optional[Dict[str, Any]] = None) -> str:
         """Generate response using local LLM with context awareness."""
@@ -1028,6 +1593,15 @@ class LocalLLM(LLMInterface):
             # Store in history
             self.conversation_history.append({"role": "player", "content": player_message})
 
+            # Reuse the answer only when the exact same prompt (mood, history,
+            # grievance and all) was already sent with this message
+            cached = self._response_cache.get(
+                player_message, self.current_scenario, self.current_choice, system_prompt
+            )
+            if cached is not None:
+                self.conversation_history.append({"role": "ai", "content": cached})
+                return cached
+
             ai_response = self._send_chat_request(system_prompt, player_message)
             ai_response = self._sanitize_response(ai_response)
 
@@ -1044,6 +1618,10 @@ class LocalLLM(LLMInterface):
 
             if self._is_out_of_character_response(ai_response) or not ai_response:
                 ai_response = self._fallback_in_character_response(player_message, context)
+            else:
+                self._response_cache.put(
+                    player_message, ai_response, self.current_scenario, self.current_choice, system_prompt
+                )
 
             self.conversation_history.append({"role": "ai", "content": ai_response})
             return ai_response
@@ -1054,6 +1632,44 @@ class LocalLLM(LLMInterface):
             self.conversation_history.append({"role": "ai", "content": fallback})
             return fallback
     
+    def generate_stream(self, prompt: str, context: Optional[Dict[str, Any]] = None) -> Iterator[str]:
+        """
+        Generate a response, yielding text as the model produces it.
+        
+        Lets the UI start showing the reply after the first token. Streamed
+        text is raw model output; unlike generate, it is not sanitized or
+        checked for breaking character. Without Ollama the whole fallback
+        response is yielded at once.
+        
+        Args:
+            prompt: The formatted prompt
+            context: Optional additional context
+            
+        Yields:
+            Successive pieces of the response
+        """
+        if not self._available:
+            yield self.generate(prompt, context)
+            return
+        
+        player_message = self._extract_player_message(prompt)
+        system_prompt = self._build_system_prompt(context)
+        self.conversation_history.append({"role": "player", "content": player_message})
+        
+        parts = []
+        try:
+            for text in self._stream_chat_request(system_prompt, player_message):
+                parts.append(text)
+                yield text
+        except Exception:
+            self._available = False  # Trigger periodic re-check instead of a permanent lockout.
+            if not parts:
+                fallback = self._fallback_in_character_response(player_message, context)
+                parts.append(fallback)
+                yield fallback
+        
+        self.conversation_history.append({"role": "ai", "content": "".join(parts).strip()})
+    
     def is_available(self) -> bool:
         """Check if local LLM is available."""
         return self._available
@@ -1163,7 +1779,7 @@ class GroqLLM(LLMInterface):
         self._available = bool(self._api_key)
         
         # Conversation memory for this session
-        self.conversation_history = []
+        self.conversation_history = deque(maxlen=CONVERSATION_HISTORY_SIZE)
         self.current_scenario = None
         self.current_choice = None
         self.player_patterns = {}
@@ -1243,7 +1859,7 @@ class GroqLLM(LLMInterface):
         # Add conversation history summary if exists
         if self.conversation_history:
             system_parts.append("RECENT CONVERSATION:")
-            for msg in self.conversation_history[-6:]:  # Last 6 messages
+            for msg in list(self.conversation_history)[-6:]:  # Last 6 messages
                 role = "Partner" if msg["role"] == "player" else "You"
                 system_parts.append(f"  {role}: {msg['content']}")
             system_parts.append("")
@@ -0,0 +1,280 @@
+"""
+Unit tests for BehavioralConstraints.
+
+Tests the default constraint set on response checking and correction.
+"""
+import pytest
+
+from nurture.rules.behavioral_constraints import (
+    BehavioralConstraints,
+    Constraint,
+    ConstraintDomain,
+    ConstraintKind,
+    ConstraintType,
+)
+
+
+@pytest.fixture
+def constraints():
+    """Constraint manager with the default constraint set."""
+    manager = BehavioralConstraints()
+    manager.add_default_constraints()
+    return manager
+
+
+def test_clean_response_passes(constraints):
+    """A normal response should not violate any constraint."""
+    is_valid, violations = constraints.check_response("Let's talk about it tonight.")
+    
+    assert is_valid
+    assert violations == []
+
+
+def test_empty_response_is_corrected(constraints):
+    """Empty responses are invalid and replaced with a fallback."""
+    is_valid, violations = constraints.check_response("   ")
+    
+    assert not is_valid
+    assert "no_empty_response" in violations
+    assert constraints.correct_response("   ") == "I need a moment to think about that."
+
+
+def test_mild_language_matches_whole_words_case_insensitively(constraints):
+    """Mild words are caught in any case but not inside other words."""
+    assert constraints.check_response("Hello, shell game.")[0]
+    
+    is_valid, violations = constraints.check_response("Damn, that was close.")
+    assert not is_valid
+    assert violations == ["mild_language_filter"]
+    
+    assert constraints.correct_response("Damn it, what the HELL.") == "darn it, what the darn."
+
+
+def test_harmful_content_is_replaced(constraints):
+    """Harmful content is flagged regardless of case and fully replaced."""
+    is_valid, violations = constraints.check_response("Sometimes I want to End It All.")
+    
+    assert not is_valid
+    assert violations == ["no_harmful_content"]
+    assert "End It All" not in constraints.correct_response("Sometimes I want to End It All.")
+
+
+def test_long_response_is_truncated(constraints):
+    """Responses over the length limit are truncated with an ellipsis."""
+    corrected = constraints.correct_response("a" * 600)
+    
+    assert len(corrected) == 500
+    assert corrected.endswith("...")
+
+
+def test_check_value_on_numeric_domain(constraints):
+    """Numeric domains are checked and corrected independently."""
+    assert constraints.check_value(0.5, ConstraintDomain.RELATIONSHIP_BOUND)[0]
+    
+    is_valid, violations = constraints.check_value(1.5, ConstraintDomain.RELATIONSHIP_BOUND)
+    assert not is_valid
+    assert violations == ["trust_bounds"]
+    
+    corrected, applied = constraints.apply_corrections(1.5, ConstraintDomain.RELATIONSHIP_BOUND)
+    assert corrected == 1.0
+    assert applied == ["trust_bounds"]
+
+
+def test_violations_are_logged(constraints):
+    """Violations are recorded in the log and can be cleared."""
+    constraints.check_response("")
+    
+    violations = constraints.get_violations()
+    assert violations[-1]["constraint_id"] == "no_empty_response"
+    assert violations[-1]["value_type"] == "str"
+    
+    constraints.clear_violation_log()
+    assert constraints.get_violations() == []
+
+
+def test_disabled_and_removed_constraints_are_skipped(constraints):
+    """Disabled or removed constraints no longer report violations."""
+    assert constraints.set_enabled("mild_language_filter", False)
+    assert constraints.check_response("Damn.")[0]
+    
+    assert constraints.set_enabled("mild_language_filter", True)
+    assert not constraints.check_response("Damn.")[0]
+    
+    assert constraints.remove_constraint("mild_language_filter")
+    assert constraints.check_response("Damn.")[0]
+    assert not constraints.remove_constraint("mild_language_filter")
+    assert not constraints.set_enabled("mild_language_filter", True)
+
+
+def test_violation_log_is_bounded(constraints):
+    """The violation log keeps only the most recent entries."""
+    for _ in range(1200):
+        constraints.check_value(-1, ConstraintDomain.BEHAVIORAL_LIMIT)
+    
+    assert len(constraints.get_violations(limit=5000)) == 1000
+    assert constraints.get_violations(limit=1) == [{
+        "constraint_id": "interaction_count_positive",
+        "constraint_name": "Positive Interaction Count",
+        "constraint_type": "hard",
+        "message": "Interaction count was negative",
+        "value_type": "int",
+    }]
+
+
+def test_default_constraints_are_shared_but_enabled_state_is_not(constraints):
+    """Managers share the default constraint objects but toggle them independently."""
+    other = BehavioralConstraints()
+    other.add_default_constraints()
+    
+    assert other._constraints["mild_language_filter"] is constraints._constraints["mild_language_filter"]
+    
+    constraints.set_enabled("mild_language_filter", False)
+    assert constraints.check_response("Damn.")[0]
+    assert not other.check_response("Damn.")[0]
+    assert not constraints.is_enabled("mild_language_filter")
+    assert other.is_enabled("mild_language_filter")
+    
+    # Constraints carry no enabled flag of their own
+    assert not hasattr(other._constraints["mild_language_filter"], "enabled")
+
+
+def test_constraints_can_be_added_disabled():
+    """add_constraint takes the initial enabled state; set_enabled toggles it."""
+    manager = BehavioralConstraints()
+    manager.add_constraint(Constraint(
+        id="no_questions",
+        name="No Questions",
+        domain=ConstraintDomain.RESPONSE_CONTENT,
+        check=lambda r: "?" not in r,
+    ), enabled=False)
+    
+    assert not manager.is_enabled("no_questions")
+    assert manager.check_response("Why?")[0]
+    
+    assert manager.set_enabled("no_questions", True)
+    assert manager.check_response("Why?") == (False, ["no_questions"])
+    assert not manager.is_enabled("missing")
+
+
+def test_fast_check_tracks_constraint_changes(constraints):
+    """The default fast path is dropped as soon as the tables diverge."""
+    assert constraints._fast_check is not None
+    
+    constraints.set_enabled("response_length_max", False)
+    assert constraints._fast_check is None
+    assert constraints.check_response("a" * 600)[0]
+    
+    constraints.set_enabled("response_length_max", True)
+    assert constraints._fast_check is not None
+    assert constraints.check_response("a" * 600) == (False, ["response_length_max"])
+    
+    constraints.add_constraint(Constraint(
+        id="no_questions",
+        name="No Questions",
+        description="Responses must not be questions",
+        constraint_type=ConstraintType.SOFT,
+        domain=ConstraintDomain.RESPONSE_CONTENT,
+        check=lambda r: not r.endswith("?"),
+    ))
+    assert constraints._fast_check is None
+    assert constraints.check_response("Why?") == (False, ["no_questions"])
+
+
+def test_whitespace_only_responses_are_empty(constraints):
+    """Any Unicode whitespace counts as empty, on both check paths."""
+    for response in ("", "\t\n", "　"):
+        assert constraints.check_response(response) == (False, ["no_empty_response"])
+    
+    constraints.set_enabled("mild_language_filter", False)
+    assert constraints.check_response("　") == (False, ["no_empty_response"])
+
+
+def test_tagged_constraint_exposes_check_and_is_enforced():
+    """Constraints tagged with a built-in kind behave like hand-written checks."""
+    constraint = Constraint(
+        id="short_reply",
+        name="Short Reply",
+        domain=ConstraintDomain.RESPONSE_CONTENT,
+        kind=ConstraintKind.MAX_LEN,
+        param=10,
+    )
+    assert constraint.check("brief")
+    assert not constraint.check("far too long a reply")
+    assert constraint.check("")
+    
+    manager = BehavioralConstraints()
+    manager.add_constraint(constraint)
+    assert manager.check_response("far too long a reply") == (False, ["short_reply"])
+    assert manager.check_value({"delta": 0.5}, ConstraintDomain.RESPONSE_CONTENT)[0]
+
+
+def test_check_value_filters_by_constraint_type(constraints):
+    """Only constraints of the requested type are checked."""
+    response = "Damn" + "!" * 600
+    
+    assert constraints.check_value(response, ConstraintDomain.RESPONSE_CONTENT, ConstraintType.HARD)[0]
+    assert constraints.check_value(response, ConstraintDomain.RESPONSE_CONTENT, ConstraintType.SOFT) == (
+        False, ["response_length_max", "mild_language_filter"]
+    )
+    
+    constraints.set_enabled("response_length_max", False)
+    assert constraints.check_value(response, ConstraintDomain.RESPONSE_CONTENT, ConstraintType.SOFT) == (
+        False, ["mild_language_filter"]
+    )
+
+
+def test_accepted_responses_are_cached_until_constraints_change(constraints):
+    """Repeated passing responses hit the cache; any constraint change clears it."""
+    response = "See you at breakfast."
+    
+    assert constraints.check_response(response) == (True, [])
+    assert response in constraints._accepted_responses
+    
+    constraints.add_constraint(Constraint(
+        id="no_breakfast",
+        name="No Breakfast",
+        domain=ConstraintDomain.RESPONSE_CONTENT,
+        check=lambda r: "breakfast" not in r,
+    ))
+    assert constraints.check_response(response) == (False, ["no_breakfast"])
+    assert response not in constraints._accepted_responses
+
+
+def test_accepted_response_cache_is_bounded(constraints):
+    """Only the most recently accepted responses are remembered."""
+    for i in range(300):
+        constraints.check_response(f"Reply number {i}.")
+    
+    assert len(constraints._accepted_responses) == 256
+    assert "Reply number 299." in constraints._accepted_responses
+    assert "Reply number 0." not in constraints._accepted_responses
+
+
+def test_apply_corrections_skips_constraints_without_correction(constraints):
+    """Violated constraints with no correction leave the value untouched."""
+    constraints.add_constraint(Constraint(
+        id="no_questions",
+        name="No Questions",
+        domain=ConstraintDomain.RESPONSE_CONTENT,
+        check=lambda r: not r.endswith("?"),
+    ))
+    
+    assert constraints.apply_corrections("Damn, why?", ConstraintDomain.RESPONSE_CONTENT) == (
+        "darn, why?", ["mild_language_filter"]
+    )
+    assert constraints.apply_corrections(0.5, ConstraintDomain.BEHAVIORAL_LIMIT) == (0.5, [])
+
+
+def test_failing_check_is_logged_not_raised(constraints, caplog):
+    """A check that raises is reported as a warning and skipped."""
+    constraints.add_constraint(Constraint(
+        id="broken",
+        name="Broken",
+        domain=ConstraintDomain.BEHAVIORAL_LIMIT,
+        check=lambda v: 1 / 0,
+    ))
+    
+    with caplog.at_level("WARNING", logger="nurture.rules.behavioral_constraints"):
+        assert constraints.check_value(3, ConstraintDomain.BEHAVIORAL_LIMIT) == (True, [])
+    
+    assert "Constraint broken check error" in caplog.text
@@ -0,0 +1,111 @@
+"""
+Unit tests for EmotionalRules.
+
+Tests emotion interaction calculations, scalar and batched.
+"""
+import pytest
+
+from nurture.rules.emotional_rules import EmotionalRules
+from nurture.rules.rule_engine import RuleEngine
+
+
+EMOTION_STATES = [
+    {},
+    {"anger": 0.8, "sadness": 0.6},
+    {"anger": 0.55, "sadness": 0.9},
+    {"joy": 0.9, "anger": 0.7, "sadness": 0.6},
+    {"fear": 0.5, "anger": 0.5},
+    {"fear": 0.5, "anger": 0.5, "trust": 0.9},
+    {"joy": 0.8, "trust": 0.8},
+]
+
+
+def test_interaction_anger_dominates_sadness():
+    """When anger and sadness are both high, the stronger one suppresses the other."""
+    assert EmotionalRules.calculate_emotion_interaction({"anger": 0.8, "sadness": 0.6}) == {"sadness": -0.1}
+    assert EmotionalRules.calculate_emotion_interaction({"anger": 0.6, "sadness": 0.8}) == {"anger": -0.1}
+
+
+def test_interaction_trust_overrides_fear_changes():
+    """High trust sets the final fear and anxiety modifications."""
+    mods = EmotionalRules.calculate_emotion_interaction({"fear": 0.5, "anger": 0.5, "trust": 0.9})
+    
+    assert mods["fear"] == pytest.approx(-0.18)
+    assert mods["anxiety"] == pytest.approx(-0.135)
+
+
+def test_batch_matches_scalar():
+    """Each batch row equals the scalar result, with 0.0 for untouched emotions."""
+    columns = {
+        name: [state.get(name, 0) for state in EMOTION_STATES]
+        for name in ("anger", "sadness", "joy", "fear", "trust")
+    }
+    batch = EmotionalRules.calculate_emotion_interaction_batch(**columns)
+    
+    for i, state in enumerate(EMOTION_STATES):
+        expected = EmotionalRules.calculate_emotion_interaction(state)
+        for name, column in batch.items():
+            assert column[i] == pytest.approx(expected.get(name, 0.0))
+
+
+def test_get_all_rules_returns_independent_copies():
+    """Each call returns new Rule objects sharing the prebuilt conditions."""
+    first = EmotionalRules.get_all_rules()
+    second = EmotionalRules.get_all_rules()
+    
+    assert len(first) == 13
+    assert all(a is not b for a, b in zip(first, second))
+    assert all(a.condition is b.condition and a.action is b.action for a, b in zip(first, second))
+    
+    first[0].enabled = False
+    assert all(rule.enabled for rule in EmotionalRules.get_all_rules())
+
+
+def test_engines_disable_emotional_rules_independently():
+    """Disabling a rule in one engine leaves other engines and evaluate_all alone."""
+    context = {"anger": 0.8}
+    a, b = RuleEngine(), RuleEngine()
+    for engine in (a, b):
+        for rule in EmotionalRules.get_all_rules():
+            engine.add_rule(rule)
+    
+    assert "anger_suppresses_fear" in [rule_id for rule_id, _ in b.evaluate_all(context)]
+    a.enable_rule("anger_suppresses_fear", False)
+    
+    assert "anger_suppresses_fear" not in [rule_id for rule_id, _ in a.evaluate_all(context)]
+    assert "anger_suppresses_fear" in [rule_id for rule_id, _ in b.evaluate_all(context)]
+    assert "anger_suppresses_fear" in [rule_id for rule_id, _ in EmotionalRules.evaluate_all(context)]
+    
+    fresh = RuleEngine()
+    for rule in EmotionalRules.get_all_rules():
+        fresh.add_rule(rule)
+    assert fresh.get_rule("anger_suppresses_fear").enabled
+
+
+def _sequential_results(context):
+    """Reference result: each rule evaluated on its own."""
+    results = []
+    for rule in EmotionalRules.get_all_rules():
+        fired, result = rule.evaluate(context)
+        if fired:
+            results.append((rule.id, result))
+    return results
+
+
+@pytest.mark.parametrize("context", [
+    {},
+    {"regulation_capacity": 0.9, "max_emotion_intensity": 0.95, "anger": 0.7},
+    {"regulation_capacity": 0.1, "stress_level": 0.8, "stress_duration": 5},
+    {"emotional_valence": -0.6, "partner_valence": -0.5, "empathy_level": 0.7},
+    {"joy": 0.8, "partner_valence": 0.9, "total_emotion_intensity": 3.5},
+])
+def test_evaluate_all_matches_rule_by_rule(context):
+    """The fused condition check fires exactly the rules evaluated one by one."""
+    assert EmotionalRules.evaluate_all(context) == _sequential_results(context)
+
+
+def test_evaluate_all_falls_back_on_uncomparable_values():
+    """Values that cannot be compared only affect the rules that read them."""
+    context = {"anger": "high", "sadness": 0.9}
+    
+    assert EmotionalRules.evaluate_all(context) == _sequential_results(context)
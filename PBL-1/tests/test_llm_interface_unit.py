@@ -0,0 +1,407 @@
+"""
+Unit tests for the LLM interface helpers.
+
+Tests response caching and the mock backend without any network access.
+"""
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from types import SimpleNamespace
+import asyncio
+import json
+import random
+import socket
+import threading
+import time
+
+import pytest
+
+from nurture.utils.llm_interface import (
+    LLMConfig,
+    LocalLLM,
+    MockLLM,
+    OpenAILLM,
+    ResponseCache,
+    TokenBucket,
+    _TOPIC_RESPONSES,
+)
+
+
+@pytest.fixture
+def offline_local_llm():
+    """LocalLLM marked available, with chat requests answered locally."""
+    # Nothing listens on port 1, so the availability check fails fast
+    llm = LocalLLM(LLMConfig(provider="ollama", model_name="test", api_base="http://127.0.0.1:1"))
+    llm._available = True
+    llm.requests = []
+    
+    def send(system_prompt, player_message):
+        llm.requests.append(player_message)
+        return "I hear you."
+    
+    llm._send_chat_request = send
+    return llm
+
+
+def test_cache_matches_normalized_messages():
+    """Case, punctuation and spacing differences share an entry."""
+    cache = ResponseCache()
+    cache.put("I'm sorry!", "Thank you for saying that.", "fight", "calm")
+    
+    assert cache.get("  i'm   SORRY ", "fight", "calm") == "Thank you for saying that."
+    assert cache.get("I'm sorry", "fight", "leave") is None
+    assert cache.get("I am sorry", "fight", "calm") is None
+    assert cache.get("I'm sorry?", "fight", "calm") is None
+    assert cache.get("I'm sorry!", "fight", "calm", system_prompt="Be cold.") is None
+
+
+def test_cache_evicts_least_recently_used():
+    """Only the most recently used responses are kept."""
+    cache = ResponseCache(max_size=2)
+    cache.put("one", "1")
+    cache.put("two", "2")
+    cache.get("one")
+    cache.put("three", "3")
+    
+    assert len(cache) == 2
+    assert cache.get("two") is None
+    assert cache.get("one") == "1"
+    
+    disabled = ResponseCache(max_size=0)
+    disabled.put("one", "1")
+    assert len(disabled) == 0
+
+
+def test_local_llm_reuses_responses_only_for_identical_prompts(offline_local_llm):
+    """A cached reply is reused only when the whole system prompt matches."""
+    context = {"scenario_key": "fight", "choice_key": "calm"}
+    
+    random.seed(7)
+    first = offline_local_llm.generate("Hi!", context)
+    
+    # Later in the conversation the prompt carries the history: no reuse
+    offline_local_llm.generate("hi", context)
+    assert offline_local_llm.requests == ["Hi!", "hi"]
+    
+    # The same opening exchange again reuses the reply
+    offline_local_llm.conversation_history.clear()
+    random.seed(7)
+    assert offline_local_llm.generate("hi", context) == first
+    assert offline_local_llm.requests == ["Hi!", "hi"]
+    assert [turn["role"] for turn in offline_local_llm.conversation_history] == ["player", "ai"]
+    
+    offline_local_llm.conversation_history.clear()
+    offline_local_llm.generate("hi", {"scenario_key": "money", "choice_key": "work"})
+    assert len(offline_local_llm.requests) == 3
+
+
+def test_mock_replies_follow_topic_priority():
+    """The highest-priority topic in a message decides the reply."""
+    llm = MockLLM(LLMConfig(provider="mock"))
+    
+    assert llm._analyze_and_respond("I'm sorry, but I HATE YOU") in _TOPIC_RESPONSES["hostile"]
+    assert llm._analyze_and_respond("I'm sorry, but you're wrong") in _TOPIC_RESPONSES["apology"]
+    assert llm._analyze_and_respond("Do you?") in _TOPIC_RESPONSES["question"]
+    assert llm._analyze_and_respond("  Okay ") in _TOPIC_RESPONSES["acknowledgment"]
+    assert llm._analyze_and_respond("The baby is asleep.") in _TOPIC_RESPONSES["default"]
+
+
+def test_mock_first_message_without_choice_uses_scenario_pool():
+    """Opening replies come from the scenario's pool when no choice is known."""
+    llm = MockLLM(LLMConfig(provider="mock"))
+    
+    response = llm.generate("Hello", {"scenario_key": "fight"})
+    
+    assert response.startswith(llm._scenario_response_pools["fight"])
+
+
+def test_mock_history_is_bounded_and_first_message_survives_reset():
+    """History keeps only recent turns; clearing it starts a new conversation."""
+    llm = MockLLM(LLMConfig(provider="mock"))
+    for _ in range(40):
+        llm.generate("The baby is asleep.", {"scenario_key": "fight", "choice_key": "calm"})
+    
+    assert len(llm.conversation_history) == 32
+    assert llm.generate("Hello") not in llm._scenario_responses["fight"].values()
+    
+    llm.conversation_history.clear()
+    assert llm.generate("Hello").startswith(llm._scenario_responses["fight"]["calm"])
+
+
+def test_openai_batch_marshals_rows_and_falls_back_per_row():
+    """Prompts share requests; rows missing from a reply are asked singly."""
+    requests = []
+    
+    def create(messages, **kwargs):
+        user = messages[-1]["content"]
+        requests.append(user)
+        if "---ROW" in user:
+            content = "---ROW 0---\nFirst answer.\n---ROW 2---\nThird answer."
+        else:
+            content = f"Single answer to {user}."
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+    
+    llm = OpenAILLM(LLMConfig(provider="openai", api_key="test", requests_per_minute=0))
+    llm._client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+    llm._available = True
+    
+    responses = llm.generate_batch(["one", "two", "three", "four"], rows_per_request=3)
+    
+    assert responses == [
+        "First answer.", "Single answer to two.", "Third answer.", "Single answer to four."
+    ]
+    assert len(requests) == 3
+    assert llm.generate_batch(["one"]) == ["First answer."]
+    assert len(requests) == 3
+
+
+def test_openai_generate_many_limits_concurrency():
+    """Requests run concurrently, never more than the limit at once."""
+    in_flight = []
+    peak = []
+    
+    async def create(messages, **kwargs):
+        in_flight.append(1)
+        peak.append(len(in_flight))
+        await asyncio.sleep(0.01)
+        in_flight.pop()
+        content = f"Answer to {messages[-1]['content']}."
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+    
+    llm = OpenAILLM(LLMConfig(provider="openai", api_key="test", requests_per_minute=0))
+    async def close():
+        pass
+    
+    client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)), close=close)
+    llm._async_client_factory = lambda: client
+    llm._available = True
+    
+    prompts = [f"p{i}" for i in range(7)]
+    
+    assert llm.generate_many(prompts, max_concurrency=3) == [f"Answer to p{i}." for i in range(7)]
+    assert max(peak) == 3
+
+
+def test_openai_generate_many_uses_a_client_per_event_loop():
+    """Repeated calls never reuse a client bound to an earlier, closed loop."""
+    clients = []
+    
+    class LoopBoundClient:
+        def __init__(self):
+            self.loop = None
+            self.closed = False
+            self.chat = SimpleNamespace(completions=SimpleNamespace(create=self.create))
+            clients.append(self)
+        
+        async def create(self, messages, **kwargs):
+            loop = asyncio.get_running_loop()
+            assert not self.closed
+            assert self.loop in (None, loop), "client reused across event loops"
+            self.loop = loop
+            return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content="Sure."))])
+        
+        async def close(self):
+            self.closed = True
+    
+    llm = OpenAILLM(LLMConfig(provider="openai", api_key="test", requests_per_minute=0,
+                              response_cache_size=0))
+    llm._async_client_factory = LoopBoundClient
+    llm._available = True
+    
+    assert llm.generate_many(["one", "two"]) == ["Sure.", "Sure."]
+    assert llm.generate_many(["three"]) == ["Sure."]
+    assert len(clients) == 2
+    assert all(client.closed for client in clients)
+
+
+def test_token_bucket_spaces_requests_beyond_burst():
+    """Requests past the burst are told to wait one refill interval each."""
+    bucket = TokenBucket(requests_per_minute=60, burst=2)
+    
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == pytest.approx(1.0, abs=0.05)
+    assert bucket.reserve() == pytest.approx(2.0, abs=0.05)
+    assert TokenBucket(requests_per_minute=0).reserve() == 0.0
+
+
+def test_openai_retries_rate_limited_requests(monkeypatch):
+    """429 responses are retried with backoff unless retries are disabled."""
+    class RateLimited(Exception):
+        status_code = 429
+    
+    failures = [RateLimited(), RateLimited()]
+    sleeps = []
+    
+    def create(messages, **kwargs):
+        if failures:
+            raise failures.pop()
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content="Finally."))])
+    
+    monkeypatch.setattr("nurture.utils.llm_interface.time.sleep", sleeps.append)
+    llm = OpenAILLM(LLMConfig(provider="openai", api_key="test", requests_per_minute=0))
+    llm._client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+    llm._available = True
+    
+    assert llm.generate("hello") == "Finally."
+    assert sleeps == [1.0, 2.0]
+    
+    llm.config.retry_on_rate_limit = False
+    failures.append(RateLimited())
+    assert llm.generate("goodbye") != "Finally."
+
+
+@pytest.fixture
+def fake_ollama():
+    """Local HTTP/1.1 server answering like Ollama and recording client ports."""
+    clients = []
+    
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        
+        def _reply(self, data):
+            clients.append(self.client_address[1])
+            body = json.dumps(data).encode()
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        
+        def do_GET(self):
+            self._reply({"models": [{"name": "test"}]})
+        
+        def do_POST(self):
+            request = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+            if not request["stream"]:
+                self._reply({"message": {"content": "I hear you."}})
+                return
+            clients.append(self.client_address[1])
+            lines = [{"message": {"content": text}, "done": False} for text in ("I ", "hear ", "you.")]
+            body = "".join(json.dumps(line) + "\n" for line in lines + [{"done": True}]).encode()
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        
+        def log_message(self, *args):
+            pass
+    
+    server = HTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}", clients
+    server.shutdown()
+    server.server_close()
+
+
+def test_local_llm_reuses_one_connection(fake_ollama):
+    """The availability check and chat requests share a kept-alive connection."""
+    base_url, clients = fake_ollama
+    llm = LocalLLM(LLMConfig(provider="ollama", model_name="test", api_base=base_url))
+    
+    assert llm.is_available()
+    assert llm._send_chat_request("Be kind.", "Hello") == "I hear you."
+    assert llm._send_chat_request("Be kind.", "Again") == "I hear you."
+    assert len(clients) == 3
+    assert len(set(clients)) == 1
+
+
+def test_local_llm_streams_chat_pieces(fake_ollama):
+    """Streamed pieces arrive separately and the full reply joins the history."""
+    base_url, clients = fake_ollama
+    llm = LocalLLM(LLMConfig(provider="ollama", model_name="test", api_base=base_url))
+    
+    assert list(llm.generate_stream("Hello")) == ["I ", "hear ", "you."]
+    assert llm.conversation_history[-1] == {"role": "ai", "content": "I hear you."}
+    assert llm._send_chat_request("Be kind.", "Again") == "I hear you."
+    assert len(set(clients)) == 1
+
+
+def test_openai_stream_yields_deltas_and_caches_reply():
+    """Deltas are yielded as they arrive; the joined reply is cached."""
+    def create(stream=False, **kwargs):
+        assert stream
+        return iter([
+            SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=text))])
+            for text in ("Of ", None, "course.")
+        ])
+    
+    llm = OpenAILLM(LLMConfig(provider="openai", api_key="test", requests_per_minute=0))
+    llm._client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+    llm._available = True
+    
+    assert list(llm.generate_stream("Can you help?")) == ["Of ", "course."]
+    assert list(llm.generate_stream("can you help?")) == ["Of course."]
+
+
+def test_local_prompt_assembles_cached_sections():
+    """The system prompt reuses the scenario section and fixed instruction blocks."""
+    llm = LocalLLM.__new__(LocalLLM)
+    llm.config = LLMConfig(provider="ollama", model_name="test")
+    llm.conversation_history = []
+    llm.current_scenario = llm.current_choice = None
+    llm.player_patterns = {}
+    
+    prompt = llm._build_system_prompt({"scenario_key": "visitors", "choice_key": "agree"})
+    
+    assert "YOUR HUSBAND AGREED WITH THE RELATIVES' CRITICISM OF THEIR PARTNER.\nYOU ARE UPSET BECAUSE: " in prompt
+    assert "Hold him accountable." in prompt
+    assert prompt.endswith("- Use natural spoken language with contractions.")
+    assert LocalLLM._scenario_section("visitors", "agree", llm._get_grievance_for_choice()) in prompt
+    assert LocalLLM._scenario_section.cache_info().hits >= 1
+
+
+def _raw_server(handle):
+    """Socket server passing each accepted connection to handle; returns (url, accepted, close)."""
+    listener = socket.socket()
+    listener.bind(("127.0.0.1", 0))
+    listener.listen()
+    accepted = []
+    
+    def serve():
+        while True:
+            try:
+                conn, _ = listener.accept()
+            except OSError:
+                return
+            accepted.append(conn)
+            threading.Thread(target=handle, args=(conn,), daemon=True).start()
+    
+    threading.Thread(target=serve, daemon=True).start()
+    return f"http://127.0.0.1:{listener.getsockname()[1]}", accepted, listener.close
+
+
+def test_ollama_timeout_is_not_retried():
+    """A request the server never answers fails once, on one connection."""
+    url, accepted, close = _raw_server(lambda conn: conn.recv(65536))
+    llm = LocalLLM.__new__(LocalLLM)
+    llm._base_url = url
+    llm._connection = None
+    
+    start = time.monotonic()
+    with pytest.raises(TimeoutError):
+        llm._ollama_request("POST", "/api/chat", {"stream": False}, timeout=0.3)
+    
+    assert time.monotonic() - start < 0.6
+    assert len(accepted) == 1
+    close()
+
+
+def test_dropped_keepalive_connection_is_reopened_once():
+    """A reused connection the server closed while idle is replaced transparently."""
+    body = b'{"models": []}'
+    
+    def answer_once_then_close(conn):
+        conn.recv(65536)
+        conn.sendall(b"HTTP/1.1 200 OK\r\nContent-Length: %d\r\n\r\n%s" % (len(body), body))
+        time.sleep(0.05)
+        conn.close()
+    
+    url, accepted, close = _raw_server(answer_once_then_close)
+    llm = LocalLLM.__new__(LocalLLM)
+    llm._base_url = url
+    llm._connection = None
+    
+    assert llm._ollama_request("GET", "/api/tags", timeout=2) == (200, body)
+    time.sleep(0.1)
+    assert llm._ollama_request("GET", "/api/tags", timeout=2) == (200, body)
+    assert len(accepted) == 2
+    close()
@@ -3,6 +3,7 @@ Unit tests for PatternTracker edge cases.
 
 Tests specific scenarios and boundary conditions.
 """
+import json
 import pytest
 from datetime import datetime, timedelta
 
@@ -308,3 +309,128 @@ def test_break_pattern_explicitly():
     # Weight should be reduced
     final_weight = tracker.get_pattern_weight(PatternType.REPEATED_AVOIDANCE)
     assert final_weight < initial_weight
+
+
+def test_history_chunks_span_at_most_chunk_width():
+    """Test that action history is segmented into day-wide chunks."""
+    tracker = PatternTracker()
+    base = datetime.now() - timedelta(days=6)
+    
+    # Two actions per day over six days
+    for day in range(6):
+        for hour in (0, 12):
+            tracker.record_action(PlayerAction(
+                action_type=ActionType.CONFLICT_AVOID,
+                context=ContextType.PRIVATE,
+                emotional_valence=-0.5,
+                timestamp=base + timedelta(days=day, hours=hour)
+            ))
+    
+    assert len(tracker.action_history) == 12
+    assert all(
+        chunk.end - chunk.start <= PatternTracker.CHUNK_WIDTH
+        for chunk in tracker._chunks
+    )
+    
+    # Clearing drops old chunks and keeps insertion order of the rest
+    cutoff = base + timedelta(days=3)
+    tracker.clear_history(before_date=cutoff)
+    
+    assert len(tracker.action_history) == 6
+    assert tracker.action_history == sorted(
+        tracker.action_history, key=lambda a: a.timestamp
+    )
+    
+    # The property hands out copies; editing one leaves the chunks intact
+    history = tracker.action_history
+    history.clear()
+    assert len(tracker.action_history) == 6
+    
+    # Detection over the remaining chunks still sees every recent action
+    patterns = tracker.detect_patterns(timedelta(days=7))
+    avoidance = next(p for p in patterns if p.pattern_type == PatternType.REPEATED_AVOIDANCE)
+    assert len(avoidance.occurrences) == 6
+
+
+def test_temporal_decay_applied_once_per_day():
+    """Test that repeated detection on the same day does not compound decay."""
+    tracker = PatternTracker(min_occurrences=3, decay_rate=0.1)
+    
+    old_timestamp = datetime.now() - timedelta(days=2)
+    for i in range(3):
+        tracker.record_action(PlayerAction(
+            action_type=ActionType.CONFLICT_AVOID,
+            context=ContextType.PRIVATE,
+            emotional_valence=-0.5,
+            timestamp=old_timestamp - timedelta(hours=i)
+        ))
+    
+    tracker.detect_patterns()
+    first_weight = tracker.get_pattern_weight(PatternType.REPEATED_AVOIDANCE)
+    tracker.detect_patterns()
+    second_weight = tracker.get_pattern_weight(PatternType.REPEATED_AVOIDANCE)
+    
+    assert abs(first_weight - 0.9 ** 2) < 0.01
+    assert second_weight == first_weight
+
+
+def test_new_pattern_does_not_redecay_existing_patterns():
+    """Test that detecting a new pattern later the same day decays only that pattern."""
+    tracker = PatternTracker(min_occurrences=3, decay_rate=0.1)
+    
+    old_timestamp = datetime.now() - timedelta(days=2)
+    for action_type in (ActionType.CONFLICT_AVOID, ActionType.CONTROL_TAKING):
+        for i in range(3):
+            tracker.record_action(PlayerAction(
+                action_type=action_type,
+                context=ContextType.PRIVATE,
+                emotional_valence=-0.5,
+                timestamp=old_timestamp - timedelta(hours=i)
+            ))
+        tracker.detect_patterns()
+    
+    assert abs(tracker.get_pattern_weight(PatternType.REPEATED_AVOIDANCE) - 0.9 ** 2) < 0.01
+    assert abs(tracker.get_pattern_weight(PatternType.CONTROL_TAKING) - 0.9 ** 2) < 0.01
+
+
+def test_decay_beyond_table_uses_exact_factor():
+    """Test that gaps longer than MAX_DECAY_DAYS still decay exponentially."""
+    tracker = PatternTracker(min_occurrences=3, decay_rate=0.01, time_window=timedelta(days=200))
+    
+    days = PatternTracker.MAX_DECAY_DAYS + 1
+    old_timestamp = datetime.now() - timedelta(days=days, hours=1)
+    for i in range(3):
+        tracker.record_action(PlayerAction(
+            action_type=ActionType.CONFLICT_AVOID,
+            context=ContextType.PRIVATE,
+            emotional_valence=-0.5,
+            timestamp=old_timestamp - timedelta(minutes=i)
+        ))
+    
+    tracker.detect_patterns()
+    
+    weight = tracker.get_pattern_weight(PatternType.REPEATED_AVOIDANCE)
+    assert weight == pytest.approx(0.99 ** days)
+
+
+def test_save_streams_same_document_as_to_dict(tmp_path):
+    """Test that save/load round-trips and matches to_dict output."""
+    tracker = PatternTracker()
+    
+    for i in range(4):
+        tracker.record_action(PlayerAction(
+            action_type=ActionType.PARENTING_PRESENT,
+            context=ContextType.PRIVATE,
+            emotional_valence=0.6,
+            timestamp=datetime.now() - timedelta(hours=i)
+        ))
+    tracker.detect_patterns()
+    
+    path = tmp_path / "tracker.json"
+    tracker.save(path)
+    
+    assert json.loads(path.read_text()) == tracker.to_dict()
+    
+    restored = PatternTracker.load(path)
+    assert len(restored.action_history) == len(tracker.action_history)
+    assert set(restored.detected_patterns) == set(tracker.detected_patterns)
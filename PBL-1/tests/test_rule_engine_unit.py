@@ -0,0 +1,487 @@
+"""
+Unit tests for RuleEngine.
+
+Tests rule evaluation order, result caching and default rules.
+"""
+import json
+
+import pytest
+
+from nurture.core.enums import ResponseStrategy
+from nurture.rules.rule_engine import (
+    NOT_FIRED,
+    PARALLEL_THRESHOLD,
+    Rule,
+    RuleCategory,
+    RuleEngine,
+    RulePriority,
+    compile_condition_table,
+    create_default_rules,
+    evaluate_rules,
+)
+
+
+@pytest.fixture
+def engine():
+    """Rule engine with the default rules."""
+    engine = RuleEngine()
+    for rule in create_default_rules():
+        engine.add_rule(rule)
+    return engine
+
+
+def _counting_rule(rule_id, key, calls, priority=RulePriority.MEDIUM, referenced_keys=None):
+    """Rule firing when context[key] is truthy, recording condition calls."""
+    def condition(ctx):
+        calls.append(rule_id)
+        return bool(ctx.get(key))
+    
+    return Rule(
+        id=rule_id,
+        name=rule_id,
+        priority=priority,
+        condition=condition,
+        action=lambda ctx: {rule_id: True},
+        referenced_keys=referenced_keys,
+    )
+
+
+def test_evaluate_all_fires_in_priority_order(engine):
+    """Matching rules are returned highest priority first."""
+    results = engine.evaluate_all({"stress_level": 0.97, "is_question": True})
+    fired = [rule_id for rule_id, _ in results]
+    
+    assert fired[0] == "max_stress_limit"
+    assert "high_stress_patience_reduction" in fired
+    assert "question_requires_answer" in fired
+    assert fired.index("high_stress_patience_reduction") < fired.index("question_requires_answer")
+
+
+def test_repeated_context_uses_cached_results():
+    """Identical contexts are evaluated once; results are independent lists."""
+    calls = []
+    engine = RuleEngine()
+    engine.add_rule(_counting_rule("flag", "flag", calls))
+    calls.clear()  # Registration runs the condition once
+    
+    first = engine.evaluate_all({"flag": True})
+    first.append(("extra", None))
+    second = engine.evaluate_all({"flag": True})
+    
+    assert second == [("flag", {"flag": True})]
+    assert calls == ["flag"]
+
+
+def test_rule_changes_clear_cached_results():
+    """Adding, removing or toggling rules re-evaluates cached contexts."""
+    calls = []
+    engine = RuleEngine()
+    engine.add_rule(_counting_rule("flag", "flag", calls))
+    engine.evaluate_all({"flag": True})
+    
+    engine.enable_rule("flag", False)
+    assert engine.evaluate_all({"flag": True}) == []
+    
+    engine.enable_rule("flag", True)
+    engine.add_rule(_counting_rule("other", "flag", calls))
+    assert [rule_id for rule_id, _ in engine.evaluate_all({"flag": True})] == ["flag", "other"]
+    
+    engine.remove_rule("other")
+    assert engine.evaluate_all({"flag": True}) == [("flag", {"flag": True})]
+
+
+def test_cache_disabled_and_unhashable_contexts_evaluate_every_time():
+    """cache_size=0 and unhashable context values skip the cache."""
+    calls = []
+    engine = RuleEngine(cache_size=0)
+    engine.add_rule(_counting_rule("flag", "flag", calls))
+    calls.clear()
+    engine.evaluate_all({"flag": True})
+    engine.evaluate_all({"flag": True})
+    assert len(calls) == 2
+    
+    calls.clear()
+    engine = RuleEngine()
+    engine.add_rule(_counting_rule("flag", "flag", calls))
+    calls.clear()
+    engine.evaluate_all({"flag": True, "history": [1, 2]})
+    engine.evaluate_all({"flag": True, "history": [1, 2]})
+    assert len(calls) == 2
+
+
+def test_rule_memoizes_on_referenced_keys():
+    """Rules with referenced keys re-run only when those values change."""
+    calls = []
+    rule = _counting_rule("flag", "flag", calls, referenced_keys=frozenset({"flag"}))
+    
+    assert rule.evaluate({"flag": True, "turn": 1}) == (True, {"flag": True})
+    assert rule.evaluate({"flag": True, "turn": 2}) == (True, {"flag": True})
+    assert calls == ["flag"]
+    
+    assert rule.evaluate({"flag": None}) == (False, None)
+    assert rule.evaluate({}) == (False, None)
+    assert calls == ["flag", "flag", "flag"]
+
+
+def test_engine_cache_ignores_unreferenced_keys(engine):
+    """With all rules declaring keys, unrelated context changes hit the cache."""
+    first = engine.evaluate_all({"stress_level": 0.7, "turn_count": 1})
+    cached = engine._result_cache.copy()
+    second = engine.evaluate_all({"stress_level": 0.7, "turn_count": 2})
+    
+    assert first == second
+    assert engine._result_cache == cached
+    assert engine.evaluate_all({"stress_level": 0.2}) != first
+
+
+def test_clauses_generate_the_condition():
+    """A rule declared with clauses gets an equivalent condition callable."""
+    rule = Rule(
+        id="repair",
+        name="Repair",
+        clauses=(
+            ("recent_conflict", False, "truthy", None),
+            ("partner_sentiment", 0, ">", 0.3),
+        ),
+    )
+    
+    assert rule.condition({"recent_conflict": True, "partner_sentiment": 0.5})
+    assert not rule.condition({"recent_conflict": True})
+    assert not rule.condition({"partner_sentiment": 0.5})
+    
+    with pytest.raises(ValueError):
+        Rule(id="bad", name="Bad", clauses=(("x", 0, ">=", 1),))
+
+
+def test_clauses_accept_constants_without_a_literal_repr():
+    """Infinite thresholds and defaults work in every compiled form."""
+    rule = Rule(
+        id="unbounded",
+        name="Unbounded",
+        clauses=(("level", float("-inf"), ">", float("-inf")),),
+    )
+    
+    assert not rule.condition({})
+    assert rule.condition({"level": 0.5})
+    assert compile_condition_table([rule])({"level": 0.5}) == (True,)
+    
+    engine = RuleEngine()
+    engine.add_rule(rule)
+    assert [rule_id for rule_id, _ in engine.evaluate_all({"level": 0.5})] == ["unbounded"]
+    assert engine.evaluate_until_match({"level": float("inf")})[0] == "unbounded"
+
+
+def test_condition_table_mixes_clauses_and_callables():
+    """Compiled tables evaluate clause rules inline and call other conditions."""
+    rules = [
+        Rule(id="high", name="High", clauses=(("level", 0, ">", 0.5),)),
+        Rule(id="odd", name="Odd", condition=lambda ctx: ctx.get("count", 0) % 2 == 1),
+        Rule(id="always", name="Always", clauses=()),
+    ]
+    evaluate = compile_condition_table(rules)
+    
+    assert evaluate({"level": 0.9, "count": 3}) == (True, True, True)
+    assert evaluate({}) == (False, False, True)
+
+
+def test_failing_condition_only_skips_its_rule(engine):
+    """A condition error skips only the failing rule."""
+    engine.add_rule(Rule(id="broken", name="Broken", condition=lambda ctx: 1 / 0))
+    
+    fired = [rule_id for rule_id, _ in engine.evaluate_all({"stress_level": 0.97})]
+    
+    assert "broken" not in fired
+    assert fired[0] == "max_stress_limit"
+
+
+def test_compiled_evaluation_resumes_after_a_failing_rule():
+    """Rules before a failure run once; the failing rule is skipped and demoted."""
+    calls = []
+    engine = RuleEngine(cache_size=0)
+    engine.add_rule(Rule(id="first", name="x", priority=RulePriority.CRITICAL,
+                         action=lambda ctx: calls.append("first")))
+    engine.add_rule(Rule(id="ratio", name="x", priority=RulePriority.HIGH,
+                         condition=lambda ctx: 1 / ctx.get("divisor", 1) > 0.5))
+    engine.add_rule(Rule(id="last", name="x", priority=RulePriority.LOW,
+                         action=lambda ctx: calls.append("last")))
+    
+    assert [rule_id for rule_id, _ in engine.evaluate_all({"divisor": 0})] == ["first", "last"]
+    assert calls == ["first", "last"]
+    assert not engine.get_rule("ratio")._safe
+
+
+def test_disabled_rules_are_skipped_by_every_evaluator(engine):
+    """Disabled rules drop out of all, category and first-match evaluation."""
+    context = {"stress_level": 0.97, "anger": 0.95}
+    assert engine.evaluate_until_match(context)[0] == "max_stress_limit"
+    
+    engine.enable_rule("max_stress_limit", False)
+    
+    assert engine.evaluate_until_match(context)[0] == "anger_limit"
+    assert [rid for rid, _ in engine.evaluate_category(RuleCategory.SAFETY, context)] == ["anger_limit"]
+    assert "max_stress_limit" not in [rid for rid, _ in engine.evaluate_all(context)]
+    
+    engine.enable_rule("max_stress_limit", True)
+    assert [rid for rid, _ in engine.evaluate_category(RuleCategory.SAFETY, context)] == [
+        "max_stress_limit", "anger_limit"
+    ]
+
+
+def test_evaluate_rules_with_precomputed_conditions():
+    """Precomputed conditions only gate actions; a raising action is skipped."""
+    rules = [
+        Rule(id="broken", name="x", action=lambda ctx: 1 / 0),
+        Rule(id="off", name="x", action=lambda ctx: "off", enabled=False),
+        Rule(id="held", name="x", action=lambda ctx: "held"),
+        Rule(id="unmet", name="x", action=lambda ctx: "unmet"),
+    ]
+    
+    assert evaluate_rules(rules, {}, (True, True, True, False)) == [("held", "held")]
+    assert not rules[0]._safe
+    assert evaluate_rules(rules, {}) == [("held", "held"), ("unmet", "unmet")]
+
+
+def test_evaluate_until_match_skips_failing_rules():
+    """A rule raising in its condition or action is skipped, not fatal."""
+    engine = RuleEngine()
+    engine.add_rule(Rule(id="bad_condition", name="x", priority=RulePriority.CRITICAL, condition=lambda ctx: 1 / 0))
+    engine.add_rule(Rule(id="bad_action", name="x", priority=RulePriority.HIGH, action=lambda ctx: 1 / 0))
+    engine.add_rule(Rule(id="never", name="x", clauses=(("flag", False, "truthy", None),)))
+    
+    assert engine.evaluate_until_match({}) is None
+    
+    engine.add_rule(Rule(id="fallback", name="x", priority=RulePriority.LOW, action=lambda ctx: "ok"))
+    assert engine.evaluate_until_match({}) == ("fallback", "ok")
+    assert engine.evaluate_until_match({"flag": True}) == ("never", None)
+
+
+def test_parallel_evaluation_matches_sequential(engine):
+    """Large rule sets give the same ordered results through the pool."""
+    for i in range(PARALLEL_THRESHOLD):
+        engine.add_rule(Rule(
+            id=f"extra_{i}",
+            name=f"Extra {i}",
+            priority=RulePriority.BACKGROUND if i % 2 else RulePriority.HIGH,
+            clauses=(("stress_level", 0, ">", i / PARALLEL_THRESHOLD),),
+            action=lambda ctx, i=i: {"extra": i},
+        ))
+    engine.add_rule(Rule(id="broken", name="Broken", condition=lambda ctx: 1 / 0))
+    context = {"stress_level": 0.5, "is_question": True}
+    
+    assert engine.evaluate_all_parallel(context) == engine.evaluate_all(context)
+
+
+def test_rules_are_validated_on_registration(engine):
+    """Rules that run cleanly on an empty context skip the per-call guard."""
+    assert engine.get_rule("max_stress_limit")._safe
+    
+    engine.add_rule(Rule(
+        id="needs_level",
+        name="Needs Level",
+        category=RuleCategory.SAFETY,
+        condition=lambda ctx: ctx.get("level") > 0.5,
+    ))
+    assert not engine.get_rule("needs_level")._safe
+    assert engine.evaluate_category(RuleCategory.SAFETY, {"level": 0.9, "anger": 0.95}) == [
+        ("anger_limit", {"anger": 0.9, "block_aggressive_response": True, "suggest_pause": True}),
+        ("needs_level", None),
+    ]
+
+
+def test_registration_never_runs_actions():
+    """Only conditions are validated on registration; actions keep their guard."""
+    calls = []
+    rule = Rule(id="logging", name="x", action=lambda ctx: calls.append(ctx["event"]))
+    engine = RuleEngine()
+    engine.add_rule(rule)
+    
+    assert calls == []
+    assert rule._safe
+    assert rule.evaluate({}) == (False, None)
+    assert rule.evaluate({"event": "hello"}) == (True, None)
+    assert calls == ["hello"]
+
+
+def test_safe_rule_that_fails_later_is_skipped_and_guarded(engine):
+    """A validated rule raising on a real context is reported, not fatal."""
+    engine.add_rule(Rule(
+        id="ratio",
+        name="Ratio",
+        category=RuleCategory.SAFETY,
+        condition=lambda ctx: 1 / ctx.get("divisor", 1) > 0.5,
+    ))
+    assert engine.get_rule("ratio")._safe
+    
+    fired = engine.evaluate_category(RuleCategory.SAFETY, {"divisor": 0, "anger": 0.95})
+    
+    assert [rule_id for rule_id, _ in fired] == ["anger_limit"]
+    assert not engine.get_rule("ratio")._safe
+    assert engine.get_rule("ratio").evaluate({"divisor": 0}) == (False, None)
+
+
+def test_constant_actions_return_shared_results():
+    """Default rules with fixed results return one shared dict."""
+    first = {rule.id: rule for rule in create_default_rules()}
+    second = {rule.id: rule for rule in create_default_rules()}
+    
+    assert first["anger_limit"].action({}) is second["anger_limit"].action({"anger": 0.95})
+    assert first["match_emotional_intensity"].action({"message_intensity": 1.0}) == {"target_intensity": 1.0}
+
+
+def test_evaluate_delta_only_runs_rules_on_changed_keys(engine):
+    """Only rules reading a changed key (or no declared keys) are evaluated."""
+    calls = []
+    engine.add_rule(_counting_rule("undeclared", "flag", calls))
+    calls.clear()
+    old = {"stress_level": 0.5, "anger": 0.95, "is_question": True}
+    new = dict(old, stress_level=0.97)
+    
+    fired = [rule_id for rule_id, _ in engine.evaluate_delta(old, new)]
+    
+    assert fired == ["max_stress_limit", "high_stress_patience_reduction"]
+    assert calls == ["undeclared"]
+    assert engine.evaluate_delta(new, new) == []
+    
+    removed = {key: value for key, value in new.items() if key != "anger"}
+    assert engine.evaluate_delta(new, removed) == []
+    assert [rule_id for rule_id, _ in engine.evaluate_delta(removed, new)] == ["anger_limit"]
+
+
+def test_compile_picks_up_actions_replaced_in_place():
+    """The generated evaluator is rebuilt on demand after in-place edits."""
+    engine = RuleEngine(cache_size=0)
+    engine.add_rule(Rule(id="flag", name="Flag", clauses=(("flag", False, "truthy", None),)))
+    assert engine.evaluate_all({"flag": True}) == [("flag", None)]
+    
+    engine.get_rule("flag").action = lambda ctx: "updated"
+    engine.compile()
+    assert engine.evaluate_all({"flag": True}) == [("flag", "updated")]
+
+
+def test_adapt_orders_first_match_by_firing_rate():
+    """Within a priority level, the rule that fires more often is tried first."""
+    engine = RuleEngine()
+    engine.add_rule(Rule(id="rare", name="Rare", clauses=(("rare", False, "truthy", None),)))
+    engine.add_rule(Rule(id="common", name="Common", clauses=(("common", False, "truthy", None),)))
+    engine.add_rule(Rule(id="urgent", name="Urgent", priority=RulePriority.CRITICAL,
+                         clauses=(("urgent", False, "truthy", None),)))
+    both = {"rare": True, "common": True}
+    
+    assert not engine.adapt()
+    for _ in range(90):
+        engine.evaluate_until_match({"common": True})
+    for _ in range(10):
+        engine.evaluate_until_match({"rare": True})
+    assert engine.evaluate_until_match(both)[0] == "rare"
+    
+    assert engine.adapt()
+    rules = {rule.id: rule for rule in engine.get_all_rules()}
+    assert (rules["urgent"].eval_count, rules["urgent"].fire_count) == (101, 0)
+    assert (rules["rare"].eval_count, rules["rare"].fire_count) == (101, 11)
+    assert (rules["common"].eval_count, rules["common"].fire_count) == (90, 90)
+    
+    assert engine.evaluate_until_match(both)[0] == "common"
+    assert engine.evaluate_until_match({"urgent": True, **both})[0] == "urgent"
+    assert [rule_id for rule_id, _ in engine.evaluate_all(both)] == ["rare", "common"]
+
+
+def test_apply_results_overlays_without_touching_context(engine):
+    """Results are layered over the context; nested boosts are merged by key."""
+    context = {"anger": 0.95, "warmth": 0.8, "strictness": 0.8}
+    
+    modified = engine.apply_results(context, engine.evaluate_all(context))
+    
+    assert modified["anger"] == 0.9
+    assert modified["strategy_boost"] == {
+        "supportive": 0.2, "empathetic": 0.2, "assertive": 0.2, "practical": 0.15
+    }
+    assert modified["warmth"] == 0.8
+    assert context == {"anger": 0.95, "warmth": 0.8, "strictness": 0.8}
+    
+    modified["anger"] = 0.1
+    assert context["anger"] == 0.95
+    assert engine.apply_results(context, []) == context
+    assert type(modified) is dict
+
+
+def test_apply_results_returns_plain_nested_dicts(engine):
+    """Frozen constant results are copied into JSON-serializable dicts."""
+    context = {"anger": 0.95, "warmth": 0.8}
+    results = engine.evaluate_all(context)
+    
+    modified = engine.apply_results(context, results)
+    
+    assert type(modified["strategy_boost"]) is dict
+    assert json.loads(json.dumps(modified))["anger"] == 0.9
+    
+    # The shared constants themselves stay untouched
+    modified["strategy_boost"]["supportive"] = 0.0
+    assert engine.apply_results(context, results)["strategy_boost"]["supportive"] == 0.2
+
+
+def test_rule_index_survives_removal_and_replacement(engine):
+    """Removing or replacing rules keeps insertion order and category lookups."""
+    engine.remove_rule("anger_limit")
+    
+    ids = [rule.id for rule in engine.get_all_rules()]
+    assert ids[:2] == ["max_stress_limit", "high_stress_patience_reduction"]
+    assert engine.get_rule("anger_limit") is None
+    assert [r.id for r in engine.get_rules_by_category(RuleCategory.SAFETY)] == ["max_stress_limit"]
+    assert engine.get_rule("question_requires_answer").id == "question_requires_answer"
+    
+    engine.add_rule(Rule(id="max_stress_limit", name="Moved", category=RuleCategory.RESPONSE))
+    assert [rule.id for rule in engine.get_all_rules()] == ids
+    assert engine.get_rules_by_category(RuleCategory.SAFETY) == []
+    assert engine.get_rules_by_category(RuleCategory.RESPONSE)[-1].name == "Moved"
+
+
+def test_constant_results_are_read_only():
+    """Shared results cannot be modified, including nested boosts."""
+    rule = {rule.id: rule for rule in create_default_rules()}["warmth_response_style"]
+    result = rule.action({})
+    
+    with pytest.raises(TypeError):
+        result["prefer_emotional_connection"] = False
+    with pytest.raises(TypeError):
+        result["strategy_boost"]["supportive"] = 1.0
+
+
+def test_strategy_vector_sums_boosts_and_penalties(engine):
+    """Boosts add and penalties subtract, per strategy in enum order."""
+    context = {"warmth": 0.8, "disagreement_streak": 3, "conflict_count": 4}
+    
+    vector = engine.strategy_vector(engine.evaluate_all(context))
+    totals = dict(zip((strategy.value for strategy in ResponseStrategy), vector))
+    
+    assert totals["empathetic"] == pytest.approx(0.4)
+    assert totals["compromising"] == pytest.approx(0.3)
+    assert totals["supportive"] == pytest.approx(0.2)
+    assert totals["challenging"] == pytest.approx(-0.3)
+    assert totals["assertive"] == pytest.approx(-0.2)
+    assert totals["avoidant"] == 0.0
+    assert list(engine.strategy_vector([("x", None), ("y", {"strategy_boost": {"unknown": 1}})])) == [0.0] * 8
+
+
+def test_unused_categories_stay_unallocated():
+    """Reading an empty category neither fails nor creates an index entry."""
+    engine = RuleEngine()
+    engine.add_rule(Rule(id="flag", name="Flag", category=RuleCategory.SAFETY))
+    
+    assert engine.get_rules_by_category(RuleCategory.LEARNING) == []
+    assert engine.evaluate_category(RuleCategory.LEARNING, {}) == []
+    assert list(engine._rules_by_category) == [RuleCategory.SAFETY]
+    
+    engine.clear()
+    assert not engine._rules_by_category
+
+
+def test_fused_rule_returns_result_or_not_fired():
+    """A fused rule runs condition and action in one call."""
+    clause_rule = Rule(id="q", name="Q", clauses=(("is_question", False, "truthy", None),))
+    lambda_rule = Rule(id="hot", name="Hot", condition=lambda ctx: ctx.get("heat", 0) > 1,
+                       action=lambda ctx: ctx["heat"] * 2)
+    
+    assert clause_rule.fuse()({"is_question": True}) is None
+    assert clause_rule.fuse()({}) is NOT_FIRED
+    assert lambda_rule.fuse()({"heat": 3}) == 6
+    assert lambda_rule.fuse()({"heat": 1}) is NOT_FIRED
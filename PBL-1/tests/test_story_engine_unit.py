@@ -0,0 +1,128 @@
+"""
+Unit tests for StoryEngine.
+
+Tests choice processing, impact summaries and save/load.
+"""
+import json
+import sys
+
+import pytest
+
+from nurture.story.story_data import PlayerChoice
+from nurture.story.story_engine import StoryEngine
+
+
+@pytest.fixture
+def engine():
+    """Story engine at the start of Act 1."""
+    return StoryEngine()
+
+
+def _choose_first_options(engine, days):
+    """Pick the first choice on each of the next days."""
+    for _ in range(days):
+        scenario = engine.get_current_scenario()
+        engine.process_choice(scenario.choices[0].choice_id)
+
+
+def test_unknown_choice_is_rejected(engine):
+    """An unknown choice id is reported and does not advance the day."""
+    result = engine.process_choice("no_such_choice")
+    
+    assert result["success"] is False
+    assert engine.progress.current_day == 1
+
+
+def test_learning_tags_follow_accumulated_impacts(engine):
+    """Tags are impact counts relative to the most frequent impact."""
+    assert engine.get_learning_tags_for_ai() == {}
+    
+    _choose_first_options(engine, 3)
+    impacts = engine.progress.impacts_accumulated
+    tags = engine.get_learning_tags_for_ai()
+    
+    assert set(tags) == set(impacts)
+    assert max(tags.values()) == 1.0
+    assert engine.get_status()["unique_impacts"] == len(set(impacts))
+
+
+def test_act_summary_lists_dominant_patterns(engine):
+    """Completing the act reports the most frequent impacts first."""
+    total_days = engine.acts[0].total_days
+    _choose_first_options(engine, total_days - 1)
+    
+    result = engine.process_choice(engine.get_current_scenario().choices[0].choice_id)
+    summary = result["act_summary"]
+    impacts = engine.progress.impacts_accumulated
+    counts = [impacts.count(impact) for impact in summary["dominant_patterns"]]
+    
+    assert result["act_complete"]
+    assert summary["total_impacts"] == len(impacts)
+    assert counts == sorted(counts, reverse=True)
+    assert counts[0] == max(impacts.count(impact) for impact in impacts)
+
+
+def test_save_and_load_restore_impact_counts(engine, tmp_path):
+    """Loaded progress yields the same learning tags as the saved engine."""
+    _choose_first_options(engine, 4)
+    path = tmp_path / "story.json"
+    assert engine.save_progress(path)
+    
+    loaded = StoryEngine()
+    assert loaded.load_progress(path)
+    
+    assert loaded.progress.impacts_accumulated == engine.progress.impacts_accumulated
+    assert loaded.get_learning_tags_for_ai() == engine.get_learning_tags_for_ai()
+
+
+def test_scenario_presentation_is_cached_per_day(engine):
+    """Repeated requests for the same day share one presentation."""
+    first = engine.get_scenario_presentation()
+    
+    assert engine.get_scenario_presentation() is first
+    assert first["day"] == 1
+    assert [choice["id"] for choice in first["choices"]] == [
+        choice.choice_id for choice in engine.get_current_scenario().choices
+    ]
+    assert first["choices"] is engine.get_current_scenario().choices_presentation
+    
+    _choose_first_options(engine, 1)
+    assert engine.get_scenario_presentation()["day"] == 2
+
+
+def test_load_normalizes_legacy_choice_lists(engine, tmp_path):
+    """Choice lists from older saves are restored as day-keyed dicts."""
+    path = tmp_path / "story.json"
+    path.write_text(json.dumps({"story_progress": {
+        "current_act": engine.progress.current_act,
+        "current_day": 3,
+        "total_acts_completed": 0,
+        "choices_made": ["1_1_wait", "1_2_neutral"],
+    }}))
+    
+    assert engine.load_progress(path)
+    assert engine.progress.choices_made == {"day_1": "1_1_wait", "day_2": "1_2_neutral"}
+    assert engine.progress.impacts_accumulated == []
+    assert engine.get_status()["choices_made"] == 2
+
+
+def test_save_is_compact_and_atomic_unless_pretty(engine, tmp_path):
+    """Saves are compact by default and leave no temporary file behind."""
+    path = tmp_path / "story.json"
+    
+    assert engine.save_progress(path)
+    assert b"\n" not in path.read_bytes()
+    assert [p.name for p in tmp_path.iterdir()] == ["story.json"]
+    
+    assert engine.save_progress(path, pretty=True)
+    assert b'\n  "story_progress"' in path.read_bytes()
+    assert StoryEngine().load_progress(path)
+
+
+def test_choice_strings_are_interned():
+    """Choice ids and impact tags built at runtime share one string object."""
+    tag = "".join(["secure_", "attachment"])
+    choice = PlayerChoice(choice_id="".join(["1_1_", "comfort"]), text="Comfort", hidden_impact=[tag])
+    
+    assert choice.hidden_impact[0] is sys.intern("secure_attachment")
+    assert choice.choice_id is sys.intern("1_1_comfort")
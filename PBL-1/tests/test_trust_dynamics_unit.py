@@ -9,7 +9,7 @@ import pytest
 from datetime import datetime, timedelta
 
 from nurture.personality.trust_dynamics import TrustDynamicsEngine
-from nurture.core.enums import ContextType, WithdrawalLevel, ActionType
+from nurture.core.enums import ContextType, WithdrawalLevel, ActionType, ApologyType
 
 
 class TestTrustScoreClamping:
@@ -182,6 +182,44 @@ class TestApologyEffectivenessMinimum:
         )
         
         assert effectiveness == 1.5  # action_oriented multiplier
+    
+    def test_effectiveness_read_does_not_compound_recovery(self):
+        """Reading effectiveness should not write recovery back to the record."""
+        engine = TrustDynamicsEngine()
+        
+        engine.record_apology(ActionType.CONFLICT_AVOID)
+        for _ in range(3):
+            engine.record_behavior_recurrence(ActionType.CONFLICT_AVOID)
+        
+        record = engine.apology_records[ActionType.CONFLICT_AVOID]
+        record.last_recurrence = (datetime.now() - timedelta(weeks=2)).timestamp()
+        
+        first = engine.get_apology_effectiveness(ActionType.CONFLICT_AVOID)
+        second = engine.get_apology_effectiveness(ActionType.CONFLICT_AVOID)
+        
+        assert first == pytest.approx(0.6)
+        assert second == pytest.approx(first)
+        assert record.effectiveness == pytest.approx(0.4)
+        
+        # A new recurrence builds on the recovered value
+        engine.record_behavior_recurrence(ActionType.CONFLICT_AVOID)
+        assert record.effectiveness == pytest.approx(0.4)
+    
+    def test_apology_type_enum_matches_names(self):
+        """ApologyType members and their names should be interchangeable."""
+        engine = TrustDynamicsEngine()
+        
+        for apology_type in ApologyType:
+            name = apology_type.name.lower()
+            assert engine.get_apology_effectiveness(
+                ActionType.CONFLICT_AVOID, apology_type
+            ) == engine.get_apology_effectiveness(ActionType.CONFLICT_AVOID, name)
+        
+        engine.record_apology(ActionType.CONFLICT_AVOID, ApologyType.GENERIC)
+        assert not engine.apology_records[ActionType.CONFLICT_AVOID].is_genuine
+        
+        engine.record_apology(ActionType.CONFLICT_AVOID, ApologyType.ACTION_ORIENTED)
+        assert engine.apology_records[ActionType.CONFLICT_AVOID].is_genuine
 
 
 class TestResponseModifiers:
@@ -276,6 +314,48 @@ class TestResentmentDecay:
         decay = engine.apply_resentment_decay(days_elapsed=10.0)
         
         assert engine.get_resentment_score() == 0.0
+    
+    def test_decay_follows_update_timestamps(self):
+        """Simulated update timestamps should drive decay, including partial days."""
+        engine = TrustDynamicsEngine(initial_resentment=50.0)
+        start = datetime(2024, 1, 1)
+        engine.update_trust(delta=2.0, timestamp=start)
+        
+        # An old simulated timestamp does not pick up wall-clock days
+        assert engine.get_resentment_score() == pytest.approx(50.0)
+        
+        engine.update_resentment(delta=0.0, timestamp=start + timedelta(days=3.5))
+        assert engine.get_resentment_score() == pytest.approx(48.25)
+        
+        # Further updates build on the decayed value
+        engine.update_resentment(delta=1.0, timestamp=start + timedelta(days=3.5))
+        assert engine.get_resentment_score() == pytest.approx(48.75)
+        
+        # Serialization preserves the decayed value without double counting
+        restored = TrustDynamicsEngine.from_dict(engine.to_dict())
+        assert restored.get_resentment_score() == pytest.approx(48.75)
+    
+    def test_stepping_days_decays_once(self):
+        """Stepping days and stamping updates should share one clock."""
+        engine = TrustDynamicsEngine(initial_resentment=50.0)
+        start = datetime(2030, 1, 1)
+        engine.update_trust(delta=2.0, timestamp=start)
+        
+        # A future anchor still decays when days are stepped
+        assert engine.apply_resentment_decay(days_elapsed=3.0) == pytest.approx(1.5)
+        
+        # An update stamped inside the stepped period adds no more decay
+        engine.update_trust(delta=2.0, timestamp=start + timedelta(days=2))
+        assert engine.get_resentment_score() == pytest.approx(48.5)
+        
+        # Fractional steps accumulate instead of being floored
+        for _ in range(4):
+            engine.apply_resentment_decay(days_elapsed=0.25)
+        assert engine.get_resentment_score() == pytest.approx(48.0)
+        
+        # Serialization keeps the stepped decay without repeating it
+        restored = TrustDynamicsEngine.from_dict(engine.to_dict())
+        assert restored.get_resentment_score() == pytest.approx(48.0)
 
 
 class TestDiminishingReturnsWindow:
@@ -310,6 +390,69 @@ class TestDiminishingReturnsWindow:
         
         # Both changes should be equal
         assert abs(change1 - change2) < 0.01
+    
+    def test_epoch_second_timestamps_accepted(self):
+        """Timestamps may be passed as epoch seconds instead of datetimes."""
+        engine = TrustDynamicsEngine(initial_trust=50.0)
+        
+        now = datetime.now().timestamp()
+        
+        change1 = engine.update_trust(delta=2.0, timestamp=now)
+        change2 = engine.update_trust(delta=2.0, timestamp=now + 1800.0)
+        
+        assert change2 < change1
+        assert engine.last_positive_action_time == now + 1800.0
+
+
+class TestSerialization:
+    """Test serialization formats."""
+    
+    def test_to_dict_emits_epoch_seconds(self):
+        """Current schema stores timestamps as epoch seconds."""
+        engine = TrustDynamicsEngine()
+        now = datetime.now().timestamp()
+        engine.update_trust(delta=2.0, timestamp=now)
+        engine.record_apology(ActionType.CONFLICT_AVOID, timestamp=now)
+        
+        data = engine.to_dict()
+        
+        assert data["schema"] == 2
+        assert data["last_positive_action_time"] == now
+        assert data["apology_records"]["conflict_avoid"]["timestamp"] == now
+        
+        restored = TrustDynamicsEngine.from_dict(data)
+        assert restored.last_positive_action_time == now
+        assert restored.apology_records[ActionType.CONFLICT_AVOID].timestamp == now
+    
+    def test_from_dict_reads_iso_timestamps(self):
+        """Data without a schema key uses ISO 8601 timestamps."""
+        then = datetime(2024, 1, 1, 12, 0, 0)
+        data = {
+            "trust_score": 55.0,
+            "resentment_score": 20.0,
+            "last_positive_action_time": then.isoformat(),
+            "last_resentment_decay_time": None,
+            "apology_records": {
+                "conflict_avoid": {
+                    "behavior_type": "conflict_avoid",
+                    "timestamp": then.isoformat(),
+                    "is_genuine": True,
+                    "effectiveness": 0.8,
+                    "recurrence_count": 1,
+                    "last_recurrence": then.isoformat(),
+                }
+            },
+            "_positive_action_count_in_window": 1,
+            "_positive_action_window_start": then.isoformat(),
+        }
+        
+        engine = TrustDynamicsEngine.from_dict(data)
+        
+        assert engine.get_trust_score() == 55.0
+        assert engine.last_positive_action_time == then.timestamp()
+        record = engine.apology_records[ActionType.CONFLICT_AVOID]
+        assert record.last_recurrence == then.timestamp()
+        assert engine._positive_action_window_start == then.timestamp()
 
 
 if __name__ == "__main__":